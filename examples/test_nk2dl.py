@@ -1,11 +1,15 @@
 import os
 from nk2dl.nuke import submit_nuke_script
+from nk2dl.deadline import get_connection
 
 # Assumes Nuke 15.1 and 15.2 are the versions installed and we are running in Nuke 15.2.
 
 # Set the root directoty to the correct path if running in the Nuke script editor.
 root_dir = os.path.dirname(os.path.abspath(__file__))
 
+# Share one Deadline connection between both submissions.
+connection = get_connection()
+
 # Submit the script with the dependencies example.
 job_ids = submit_nuke_script(
     root_dir + "/dependencies_example.nk",
@@ -19,7 +23,8 @@ job_ids = submit_nuke_script(
     write_nodes=["Write1","Write2","Write3","Write4","Write5","Write6"],
     use_nodes_frame_list=True,
     continue_on_error=True,
-    nuke_version="15.1"
+    nuke_version="15.1",
+    connection=connection
 )
 
 # Print the job IDs.
@@ -43,7 +48,8 @@ if major >= 15 and minor >= 2:
         write_nodes=["Write1","Write2","Write3","Write4","Write5","Write6"],
         use_nodes_frame_list=True,
         continue_on_error=True, 
-        graph_scope_variables=["shotcode:ABC_0010,ABC_0020"]
+        graph_scope_variables=["shotcode:ABC_0010,ABC_0020"],
+        connection=connection
     )
 
     # Print the job IDs.
@@ -4,13 +4,13 @@ This module provides the implementations for the nk2dl CLI commands.
 """
 
 import argparse
+import json
 import sys
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from ..common.config import config
+from ..common.config import config, enable_config_cache
 from ..common.errors import NK2DLError
 from ..common.logging import logger
-from ..nuke.submission import submit_nuke_script
 
 
 def handle_submit(args: argparse.Namespace) -> int:
@@ -22,6 +22,9 @@ def handle_submit(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure)
     """
+    # Imported here so non-submit commands don't load the submission stack
+    from ..nuke.submission import submit_nuke_script
+    
     try:
         logger.info(f"Submitting Nuke script: {args.script_path}")
         
@@ -44,6 +47,128 @@ def handle_submit(args: argparse.Namespace) -> int:
         return 2
 
 
+def handle_submit_batch(args: argparse.Namespace) -> int:
+    """Handle the batch command.
+    
+    Every line of the jobspec file is a JSON object holding a ``script_path``
+    and any keyword arguments accepted by ``submit_nuke_script``. All rows are
+    parsed before anything is submitted, then dispatched through a bounded
+    thread pool that shares this process's config and Deadline connection.
+    
+    Args:
+        args: Command line arguments
+        
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
+    # Imported here so non-submit commands don't load the submission stack
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from ..deadline.connection import get_connection
+    from ..nuke.submission import submit_nuke_script
+    
+    try:
+        jobspecs = _read_jobspecs(args.jobspec)
+    except NK2DLError as e:
+        logger.error(f"Jobspec error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    if not jobspecs:
+        print(f"Error: No submissions found in jobspec: {args.jobspec}", file=sys.stderr)
+        return 1
+    
+    if args.fanout < 1:
+        print(f"Error: --fanout must be at least 1, got {args.fanout}", file=sys.stderr)
+        return 1
+    
+    logger.info(f"Submitting {len(jobspecs)} Nuke scripts from {args.jobspec} with fanout {args.fanout}")
+    
+    try:
+        # Connect once up front so every worker reuses the same Deadline connection
+        connection = get_connection()
+        connection.ensure_connected()
+    except NK2DLError as e:
+        logger.error(f"Connection error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    failures = 0
+    with ThreadPoolExecutor(max_workers=min(args.fanout, len(jobspecs))) as executor:
+        futures = {
+            executor.submit(
+                submit_nuke_script, jobspec.pop("script_path"), connection=connection, **jobspec
+            ): line_number
+            for line_number, jobspec in jobspecs
+        }
+        
+        # Report each submission as soon as it returns so one failure doesn't hold up the rest
+        for future in as_completed(futures):
+            line_number = futures[future]
+            try:
+                jobs_by_render_order = future.result()
+                job_ids = [job_id for ids in jobs_by_render_order.values() for job_id in ids]
+                print(f"[{line_number}] Jobs submitted successfully. Job IDs: {', '.join(job_ids)}")
+            except NK2DLError as e:
+                failures += 1
+                logger.error(f"Submission error on jobspec line {line_number}: {e}")
+                print(f"[{line_number}] Error: {e}", file=sys.stderr)
+            except Exception as e:
+                failures += 1
+                logger.exception(f"Unexpected error during submission of jobspec line {line_number}")
+                print(f"[{line_number}] Unexpected error: {e}", file=sys.stderr)
+    
+    if failures:
+        print(f"{failures} of {len(jobspecs)} submissions failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _read_jobspecs(jobspec_path: str) -> List[Tuple[int, Dict[str, Any]]]:
+    """Read all submissions from a JSONL jobspec file.
+    
+    Args:
+        jobspec_path: Path to the jobspec file
+        
+    Returns:
+        List of (line number, submission kwargs) tuples
+        
+    Raises:
+        NK2DLError: If the file can't be read or a line is not a valid jobspec
+    """
+    from ..nuke.submission import SUBMISSION_KWARGS
+    
+    jobspecs = []
+    try:
+        with open(jobspec_path, "r") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                
+                try:
+                    jobspec = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise NK2DLError(f"Invalid JSON on line {line_number} of {jobspec_path}: {e}")
+                
+                if not isinstance(jobspec, dict) or "script_path" not in jobspec:
+                    raise NK2DLError(f"Line {line_number} of {jobspec_path} must be an object with a script_path")
+                
+                # Catch typos before anything is submitted rather than in a worker thread.
+                # Every line is submitted through the batch's shared connection, so it can't set one
+                unknown_options = jobspec.keys() - (SUBMISSION_KWARGS - {"connection"}) - {"script_path"}
+                if unknown_options:
+                    raise NK2DLError(
+                        f"Unknown submission options on line {line_number} of {jobspec_path}: "
+                        f"{', '.join(sorted(unknown_options))}"
+                    )
+                
+                jobspecs.append((line_number, jobspec))
+    except OSError as e:
+        raise NK2DLError(f"Failed to read jobspec {jobspec_path}: {e}")
+    
+    return jobspecs
+
+
 def handle_config_list(args: argparse.Namespace) -> int:
     """Handle the config list command.
     
@@ -56,15 +181,12 @@ def handle_config_list(args: argparse.Namespace) -> int:
     try:
         # Access the config object directly
         if hasattr(config, "_config"):
-            # Flatten the config for display
-            flat_config = _flatten_config(config._config)
-            
-            # Print configuration values
+            # Print the flattened configuration, which is cached with the config itself
             print("Current configuration:")
             print("----------------------")
             
-            for key in sorted(flat_config.keys()):
-                print(f"{key} = {flat_config[key]}")
+            for key, value in config.flatten().items():
+                print(f"{key} = {value}")
                 
             return 0
         else:
@@ -93,129 +215,83 @@ def handle_config(args: argparse.Namespace) -> int:
         return 1
 
 
-def _args_to_kwargs(args: argparse.Namespace) -> Dict[str, Any]:
-    """Convert command line arguments to keyword arguments for submission.
-    
-    Args:
-        args: Command line arguments
-        
-    Returns:
-        Dictionary of keyword arguments
-    """
-    # Create a dictionary to hold the kwargs
-    kwargs = {}
-    
+# CLI argument name -> submission keyword argument. List and unit conversions
+# happen in the parser's argument types, so values are copied as-is.
+# Arguments left at None are skipped so the submission falls back to config defaults.
+_ARG_MAP = (
     # Job identification
-    if hasattr(args, "BatchName") and args.BatchName is not None:
-        kwargs["batch_name"] = args.BatchName
-    if hasattr(args, "JobName") and args.JobName is not None:
-        kwargs["job_name"] = args.JobName
-    if hasattr(args, "Comment") and args.Comment is not None:
-        kwargs["comment"] = args.Comment
-    if hasattr(args, "Department") and args.Department is not None:
-        kwargs["department"] = args.Department
-        
+    ("BatchName", "batch_name"),
+    ("JobName", "job_name"),
+    ("Comment", "comment"),
+    ("Department", "department"),
+    
     # Priority and pool options
-    if hasattr(args, "Pool") and args.Pool is not None:
-        kwargs["pool"] = args.Pool
-    if hasattr(args, "Group") and args.Group is not None:
-        kwargs["group"] = args.Group
-    if hasattr(args, "Priority") and args.Priority is not None:
-        kwargs["priority"] = args.Priority
-    if hasattr(args, "ConcurrentTasks") and args.ConcurrentTasks is not None:
-        kwargs["concurrent_tasks"] = args.ConcurrentTasks
-    if hasattr(args, "LimitWorkerTasks") and args.LimitWorkerTasks:
-        kwargs["limit_worker_tasks"] = True
-    if hasattr(args, "MachineLimit") and args.MachineLimit is not None:
-        kwargs["machine_limit"] = args.MachineLimit
-    if hasattr(args, "MachineList") and args.MachineList is not None:
-        kwargs["machine_list"] = args.MachineList
-    if hasattr(args, "Limits") and args.Limits is not None:
-        kwargs["limits"] = args.Limits
-        
+    ("Pool", "pool"),
+    ("Group", "group"),
+    ("Priority", "priority"),
+    ("ConcurrentTasks", "concurrent_tasks"),
+    ("MachineLimit", "machine_limit"),
+    ("MachineList", "machine_list"),
+    ("Limits", "limits"),
+    
     # Dependencies options
-    if hasattr(args, "Dependencies") and args.Dependencies is not None:
-        kwargs["job_dependencies"] = args.Dependencies
-    if hasattr(args, "SubmitJobsAsSuspended") and args.SubmitJobsAsSuspended:
-        kwargs["submit_suspended"] = True
-    if hasattr(args, "SubmitNukeScript") and args.SubmitNukeScript:
-        kwargs["submit_script"] = True
-        
+    ("Dependencies", "job_dependencies"),
+    
     # Write node options
-    if hasattr(args, "WriteNodes") and args.WriteNodes is not None:
-        kwargs["write_nodes"] = args.WriteNodes.split(",")
-    if hasattr(args, "WritesAsSeparateJobs") and args.WritesAsSeparateJobs:
-        kwargs["write_nodes_as_separate_jobs"] = True
-    if hasattr(args, "WritesAsSeparateTasks") and args.WritesAsSeparateTasks:
-        kwargs["write_nodes_as_tasks"] = True
-    if hasattr(args, "NodeFrameRange") and args.NodeFrameRange:
-        kwargs["use_nodes_frame_list"] = True
-    if hasattr(args, "RenderOrderDependencies") and args.RenderOrderDependencies:
-        kwargs["render_order_dependencies"] = True
-        
+    ("WriteNodes", "write_nodes"),
+    
     # Frame range options
-    if hasattr(args, "Frames") and args.Frames is not None:
-        kwargs["frame_range"] = args.Frames
-    if hasattr(args, "FramesPerTask") and args.FramesPerTask is not None:
-        kwargs["chunk_size"] = args.FramesPerTask
-        
+    ("Frames", "frame_range"),
+    ("FramesPerTask", "chunk_size"),
+    
     # Nuke options
-    if hasattr(args, "UseNukeX") and args.UseNukeX:
-        kwargs["use_nuke_x"] = True
-    if hasattr(args, "BatchMode") and args.BatchMode:
-        kwargs["use_batch_mode"] = True
-    if hasattr(args, "RenderThreads") and args.RenderThreads is not None:
-        kwargs["render_threads"] = args.RenderThreads
-    if hasattr(args, "UseGPU") and args.UseGPU:
-        kwargs["use_gpu"] = True
-    if hasattr(args, "RAM") and args.RAM is not None:
-        # Convert GB to MB
-        kwargs["max_ram_usage"] = args.RAM * 1024
-    if hasattr(args, "ContinueOnError") and args.ContinueOnError:
-        kwargs["continue_on_error"] = True
-    if hasattr(args, "ReloadBetweenTasks") and args.ReloadBetweenTasks:
-        kwargs["reload_plugins"] = True
-    if hasattr(args, "PerformanceProfiler") and args.PerformanceProfiler:
-        kwargs["use_profiler"] = True
-    if hasattr(args, "XMLDirectory") and args.XMLDirectory is not None:
-        kwargs["profile_dir"] = args.XMLDirectory
-    if hasattr(args, "Proxy") and args.Proxy:
-        kwargs["use_proxy"] = True
-    if hasattr(args, "Views") and args.Views is not None:
-        kwargs["views"] = args.Views.split(",")
-        
+    ("RenderThreads", "render_threads"),
+    ("RAM", "max_ram_usage"),  # Already converted from GB to MB by the parser
+    ("XMLDirectory", "profile_dir"),
+    ("Views", "views"),
+    
     # Graph scope variables
-    if hasattr(args, "GraphScopeVariables") and args.GraphScopeVariables is not None:
-        kwargs["graph_scope_variables"] = args.GraphScopeVariables
-        
+    ("GraphScopeVariables", "graph_scope_variables"),
+    
     # Job completion options
-    if hasattr(args, "OnJobComplete") and args.OnJobComplete is not None:
-        kwargs["on_job_complete"] = args.OnJobComplete
-        
-    # Remove None values to use defaults from config
-    return {k: v for k, v in kwargs.items() if v is not None}
+    ("OnJobComplete", "on_job_complete"),
+)
+
+# CLI store_true flag -> submission keyword argument, set to True only when the flag is given
+_FLAG_MAP = (
+    ("LimitWorkerTasks", "limit_worker_tasks"),
+    ("SubmitJobsAsSuspended", "submit_suspended"),
+    ("SubmitNukeScript", "submit_script"),
+    ("WritesAsSeparateJobs", "write_nodes_as_separate_jobs"),
+    ("WritesAsSeparateTasks", "write_nodes_as_tasks"),
+    ("NodeFrameRange", "use_nodes_frame_list"),
+    ("RenderOrderDependencies", "render_order_dependencies"),
+    ("UseNukeX", "use_nuke_x"),
+    ("BatchMode", "use_batch_mode"),
+    ("UseGPU", "use_gpu"),
+    ("ContinueOnError", "continue_on_error"),
+    ("ReloadBetweenTasks", "reload_plugins"),
+    ("PerformanceProfiler", "use_profiler"),
+    ("Proxy", "use_proxy"),
+)
 
 
-def _flatten_config(config_dict: Dict[str, Any], parent_key: str = "") -> Dict[str, Any]:
-    """Flatten a nested configuration dictionary.
+def _args_to_kwargs(args: argparse.Namespace) -> Dict[str, Any]:
+    """Convert command line arguments to keyword arguments for submission.
     
     Args:
-        config_dict: Nested configuration dictionary
-        parent_key: Parent key for nested values
+        args: Command line arguments
         
     Returns:
-        Flattened configuration dictionary
+        Dictionary of keyword arguments
     """
-    items = []
-    for key, value in config_dict.items():
-        new_key = f"{parent_key}.{key}" if parent_key else key
-        
-        if isinstance(value, dict):
-            items.extend(_flatten_config(value, new_key).items())
-        else:
-            items.append((new_key, value))
-            
-    return dict(items)
+    kwargs = {
+        kwarg: value
+        for arg, kwarg in _ARG_MAP
+        if (value := getattr(args, arg, None)) is not None
+    }
+    kwargs.update({kwarg: True for arg, kwarg in _FLAG_MAP if getattr(args, arg, False)})
+    return kwargs
 
 
 def main() -> int:
@@ -226,12 +302,17 @@ def main() -> int:
     """
     from .parser import parse_args
     
+    # Each run handles one script, so reuse the resolved config between runs
+    enable_config_cache()
+    
     # Parse command line arguments
     args = parse_args()
     
     # Execute the appropriate command
     if args.command == "submit":
         return handle_submit(args)
+    elif args.command == "batch":
+        return handle_submit_batch(args)
     elif args.command == "config":
         return handle_config(args)
     else:
@@ -4,15 +4,30 @@ This module provides the argument parser for the nk2dl command line interface.
 """
 
 import argparse
+import functools
 import sys
 from typing import List, Optional
 
-from ..common.config import config
 from ..common.logging import configure_logging
 
 
+def _csv(value: str) -> List[str]:
+    """Split a comma-separated argument into a list, dropping blank entries."""
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _gb_to_mb(value: str) -> int:
+    """Convert a gigabyte argument to megabytes."""
+    return int(value) * 1024
+
+
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser for nk2dl."""
+    """Create the main argument parser for nk2dl.
+    
+    The parser is built once per process and reused, since parsing does not
+    modify it.
+    """
     parser = argparse.ArgumentParser(
         prog="nk2dl",
         description="Nuke to Deadline Submitter - Submit Nuke scripts to Deadline render farm",
@@ -38,6 +53,12 @@ def create_parser() -> argparse.ArgumentParser:
         choices=["INFO", "DEBUG", "NOTSET"],
         help="Set logging level"
     )
+    parser.add_argument(
+        "--no-config-cache",
+        action="store_true",
+        dest="no_config_cache",
+        help="Reload configuration from its source files instead of the config cache"
+    )
     
     # Create subparsers for commands
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -46,6 +67,10 @@ def create_parser() -> argparse.ArgumentParser:
     submit_parser = subparsers.add_parser("submit", help="Submit a Nuke script to Deadline")
     _setup_submit_parser(submit_parser)
     
+    # Batch command
+    batch_parser = subparsers.add_parser("batch", help="Submit many Nuke scripts from a JSONL jobspec file")
+    _setup_batch_parser(batch_parser)
+    
     # Config command
     config_parser = subparsers.add_parser("config", help="Manage nk2dl configuration")
     _setup_config_parser(config_parser)
@@ -138,6 +163,7 @@ def _setup_submit_parser(parser: argparse.ArgumentParser) -> None:
     resource_group.add_argument(
         "--Limits", 
         metavar="LIST",
+        type=_csv,
         help="Resource limits to use (comma-separated)"
     )
     
@@ -165,6 +191,7 @@ def _setup_submit_parser(parser: argparse.ArgumentParser) -> None:
         "--WriteNodes", "--Writes", "--Nodes", "-w", "-n",
         metavar="NODES",
         dest="WriteNodes",
+        type=_csv,
         help="Write nodes to render (comma-separated, default: all)"
     )
     write_group.add_argument(
@@ -231,7 +258,7 @@ def _setup_submit_parser(parser: argparse.ArgumentParser) -> None:
     nuke_group.add_argument(
         "--RAM", 
         metavar="GB",
-        type=int,
+        type=_gb_to_mb,
         help="Maximum RAM usage in GB"
     )
     nuke_group.add_argument(
@@ -264,6 +291,7 @@ def _setup_submit_parser(parser: argparse.ArgumentParser) -> None:
     nuke_group.add_argument(
         "--Views", 
         metavar="VIEWS",
+        type=_csv,
         help="Views to render (comma-separated, default: all)"
     )
     
@@ -286,6 +314,23 @@ def _setup_submit_parser(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _setup_batch_parser(parser: argparse.ArgumentParser) -> None:
+    """Set up the batch command parser with all options."""
+    parser.add_argument(
+        "--jobspec",
+        metavar="PATH",
+        required=True,
+        help="JSONL file with one submission per line (script_path plus submit_nuke_script keyword arguments)"
+    )
+    parser.add_argument(
+        "--fanout",
+        metavar="COUNT",
+        type=int,
+        default=64,
+        help="Maximum number of submissions in flight at once (default: 64)"
+    )
+
+
 def _setup_config_parser(parser: argparse.ArgumentParser) -> None:
     """Set up the config command parser with all options."""
     # Add subcommands for config operations
@@ -312,6 +357,13 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     parser = create_parser()
     parsed_args = parser.parse_args(args)
     
+    # Bypass the on-disk config cache if requested
+    if parsed_args.no_config_cache:
+        from ..common.config import enable_config_cache, invalidate_config_cache
+        enable_config_cache(False)
+        # Drop a config that was already read from the cache so it's reloaded on next use
+        invalidate_config_cache()
+    
     # Configure logging based on arguments
     if parsed_args.logging:
         configure_logging(level=parsed_args.logging)
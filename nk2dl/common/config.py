@@ -5,14 +5,55 @@ from YAML files and environment variables.
 """
 
 import os
+import functools
+import threading
 import yaml
+import hashlib
+import json
 import logging
-from pathlib import Path
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # Get module-level logger
 logger = logging.getLogger(__name__)
 
+# Parsed YAML files keyed by absolute path, validated by (st_mtime_ns, st_size)
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+# Strings recognised as booleans when coercing environment variable values
+_TRUE_VALUES = frozenset({'true', 'yes', '1', 'on'})
+_FALSE_VALUES = frozenset({'false', 'no', '0', 'off'})
+
+# Whether get_config() reuses the on-disk cache of the resolved configuration.
+# Off for library use; the CLI turns it on with enable_config_cache()
+_config_cache_enabled = False
+
+def _copy_yaml_data(data: Any) -> Any:
+    """Copy parsed YAML data, cloning its dicts and lists.
+    
+    Config files only hold mappings, sequences and immutable scalars, so
+    cloning the containers is equivalent to copy.deepcopy without its memo and
+    dispatch overhead.
+    
+    Args:
+        data: Parsed YAML data
+        
+    Returns:
+        Copy of the data that shares no containers with the original
+    """
+    if isinstance(data, dict):
+        return {key: _copy_yaml_data(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_yaml_data(value) for value in data]
+    return data
+
 class ConfigError(Exception):
     """Base exception for configuration related errors."""
     pass
@@ -28,15 +69,19 @@ class Config:
     4. User configuration file (~/.nk2dl/config.yaml)
     """
     
-    # Default paths for configuration files
-    USER_CONFIG_PATH = Path.home() / '.nk2dl' / 'config.yaml'
+    # Default paths for configuration files (the user config path is resolved
+    # lazily by _default_user_config_path)
     GLOBAL_CONFIG_PATH = '.nk2dl.yaml'
     # PROJECT_CONFIG_PATH is fetched from the env var NK2DL_CONFIG if it exists,
     # otherwise defaults to GLOBAL_CONFIG_PATH
     PROJECT_CONFIG_PATH = GLOBAL_CONFIG_PATH
     
     # Special environment variables that should not be processed as config settings
-    SPECIAL_ENV_VARS = {'NK2DL_CONFIG'}
+    SPECIAL_ENV_VARS = {'NK2DL_CONFIG', 'NK2DL_NO_CACHE'}
+    
+    # On-disk cache of the resolved configuration, reused while its sources are unchanged
+    # (located by _default_cache_path)
+    CACHE_VERSION = 2
     
     DEFAULT_CONFIG = {
         'deadline': {
@@ -48,6 +93,7 @@ class Config:
             'ssl_cert': None,  # Path to SSL certificate
             'timeout': 30,
             'commandline_on_fail': True,  # Whether to use command-line if web service fails
+            'submit_workers': 8,  # Concurrent web service submissions for batched jobs
             
             # Command-line configuration
             'command_path': None,  # Will be auto-detected from DEADLINE_PATH
@@ -78,22 +124,39 @@ class Config:
         }
     }
     
-    def __init__(self, project_config: Optional[str] = None, user_config: Optional[str] = None):
+    def __init__(self, project_config: Optional[str] = None, user_config: Optional[str] = None,
+                 use_cache: bool = False):
         """Initialize configuration.
         
         Args:
             project_config: Optional path to project configuration file
             user_config: Optional path to user configuration file
+            use_cache: Whether to reuse the on-disk cache of the resolved configuration
+                       (ignored when NK2DL_NO_CACHE is set)
         """
         logger.debug("Initializing configuration")
-        self._config: Dict[str, Any] = {}
+        self._config = {}
         self._project_config_path = self._get_project_config_path(project_config)
-        logger.debug(f"Project config path: {self._project_config_path}")
-        self._user_config_path = Path(user_config) if user_config else self.USER_CONFIG_PATH
-        logger.debug(f"User config path: {self._user_config_path}")
+        logger.debug("Project config path: %s", self._project_config_path)
+        self._user_config_path = user_config or self._default_user_config_path()
+        logger.debug("User config path: %s", self._user_config_path)
+        self._use_cache = use_cache
         self.load_config()
     
-    def _get_project_config_path(self, project_config: Optional[str] = None) -> Path:
+    @staticmethod
+    @functools.cache
+    def _default_user_config_path() -> str:
+        """Return the default user config path, resolving the home directory once."""
+        return os.path.join(os.path.expanduser('~'), '.nk2dl', 'config.yaml')
+    
+    @staticmethod
+    @functools.cache
+    def _default_cache_path() -> str:
+        """Return the on-disk config cache path, resolving the cache directory once."""
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(cache_home, 'nk2dl', 'config.json')
+    
+    def _get_project_config_path(self, project_config: Optional[str] = None) -> str:
         """Get the project configuration file path.
         
         The path is determined in the following order:
@@ -108,65 +171,189 @@ class Config:
             Path to project configuration file
         """
         if project_config:
-            logger.debug(f"Using explicitly provided project config: {project_config}")
-            return Path(project_config)
+            logger.debug("Using explicitly provided project config: %s", project_config)
+            return project_config
         
         # Check environment variable
         env_config = os.environ.get('NK2DL_CONFIG')
         if env_config:
-            logger.debug(f"Using project config from NK2DL_CONFIG: {env_config}")
-            return Path(env_config)
+            logger.debug("Using project config from NK2DL_CONFIG: %s", env_config)
+            return env_config
         
-        logger.debug(f"Using default project config path: {self.PROJECT_CONFIG_PATH}")
-        return Path(self.PROJECT_CONFIG_PATH)
+        logger.debug("Using default project config path: %s", self.PROJECT_CONFIG_PATH)
+        return self.PROJECT_CONFIG_PATH
     
-    def load_config(self) -> None:
-        """Load configuration from all sources."""
+    def load_config(self, use_cache: Optional[bool] = None) -> None:
+        """Load configuration from all sources.
+        
+        Args:
+            use_cache: Whether to reuse the on-disk config cache (defaults to the
+                       value given at construction)
+        """
+        if use_cache is None:
+            use_cache = self._use_cache
+        use_cache = use_cache and not os.environ.get('NK2DL_NO_CACHE')
+        
+        cache_key = None
+        if use_cache:
+            cache_key = self._cache_key()
+            cached = self._load_cached_config(cache_key)
+            if cached is not None:
+                logger.debug("Loaded configuration from cache: %s", self._default_cache_path())
+                self._config, self._flat_values = cached
+                return
+        
         # Start with default config
         logger.debug("Loading default configuration")
-        self._config = self.DEFAULT_CONFIG.copy()
+        # Copy each section so merging never modifies the shared defaults; the
+        # defaults are one level of sections holding scalars, so no deep copy is needed
+        self._config = {section: dict(values) for section, values in self.DEFAULT_CONFIG.items()}
         
         # Load project config first
-        logger.debug(f"Attempting to load project config from {self._project_config_path}")
+        logger.debug("Attempting to load project config from %s", self._project_config_path)
         project_config = self._load_yaml_file(self._project_config_path)
         if project_config:
-            logger.debug(f"Project config found and loaded: {self._project_config_path}")
-            logger.debug(f"Project config contents: {project_config}")
+            logger.debug("Project config found and loaded: %s", self._project_config_path)
+            logger.debug("Project config contents: %s", project_config)
             self._update_config(project_config)
         else:
-            logger.debug(f"No project config found at {self._project_config_path}")
+            logger.debug("No project config found at %s", self._project_config_path)
         
         # Load environment variables second
         logger.debug("Loading configuration from environment variables")
         self._load_env_vars()
             
         # Load user config last (now has highest priority)
-        logger.debug(f"Attempting to load user config from {self._user_config_path}")
+        logger.debug("Attempting to load user config from %s", self._user_config_path)
         user_config = self._load_yaml_file(self._user_config_path)
         if user_config:
-            logger.debug(f"User config found and loaded: {self._user_config_path}")
-            logger.debug(f"User config contents: {user_config}")
+            logger.debug("User config found and loaded: %s", self._user_config_path)
+            logger.debug("User config contents: %s", user_config)
             self._update_config(user_config)
         else:
-            logger.debug(f"No user config found at {self._user_config_path}")
+            logger.debug("No user config found at %s", self._user_config_path)
             
         # Log final config
-        logger.debug(f"Final configuration: {self._config}")
+        logger.debug("Final configuration: %s", self._config)
+        
+        if cache_key is not None:
+            self._save_cached_config(cache_key)
+    
+    def _cache_key(self) -> str:
+        """Build a key identifying every input to the resolved configuration.
+        
+        Covers the size and modification time of this module (which holds the
+        defaults) and of both config files, plus all NK2DL_ environment variables,
+        so any change invalidates the cache.
+        """
+        sources = []
+        for path in (__file__, self._project_config_path, self._user_config_path):
+            try:
+                stat = os.stat(path)
+                sources.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                sources.append((os.path.abspath(path), None, None))
+        
+        env_vars = sorted((key, value) for key, value in os.environ.items() if key.startswith('NK2DL_'))
+        key_data = repr((self.CACHE_VERSION, sources, env_vars))
+        return hashlib.sha1(key_data.encode('utf-8')).hexdigest()
     
-    def _load_yaml_file(self, path: Path) -> Optional[Dict[str, Any]]:
-        """Load and parse a YAML configuration file."""
-        if not path.exists():
-            logger.debug(f"Config file does not exist: {path}")
+    def _load_cached_config(self, cache_key: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Load the cached configuration if it was built from the same sources.
+        
+        Returns:
+            Tuple of (nested configuration, flattened values), or None if there is no usable cache
+        """
+        cache_path = self._default_cache_path()
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            cached_key = cached['key']
+            cached_config = cached['config']
+            cached_flat = cached['flat']
+        except FileNotFoundError:
             return None
-            
+        except Exception as e:
+            logger.debug("Ignoring unreadable config cache %s: %s", cache_path, e)
+            return None
+        
+        if cached_key != cache_key:
+            logger.debug("Config cache is stale, reloading configuration from sources")
+            return None
+        return cached_config, cached_flat
+    
+    def _save_cached_config(self, cache_key: str) -> None:
+        """Write the resolved configuration to the on-disk cache.
+        
+        The cache is skipped when the configuration doesn't survive a JSON round
+        trip unchanged (e.g. YAML dates or non-string keys).
+        """
+        cache_path = self._default_cache_path()
+        cached = {'key': cache_key, 'config': self._config, 'flat': self.flatten()}
+        try:
+            data = json.dumps(cached)
+        except (TypeError, ValueError) as e:
+            logger.debug("Not caching configuration that can't be stored as JSON: %s", e)
+            return
+        if json.loads(data) != cached:
+            logger.debug("Not caching configuration that changes when stored as JSON")
+            return
+        
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
         try:
-            with path.open('r') as f:
-                config_data = yaml.safe_load(f)
-                logger.debug(f"Loaded YAML from {path}")
-                return config_data
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            # Replace atomically so concurrent processes never read a partial cache
+            os.replace(temp_path, cache_path)
+            logger.debug("Wrote config cache: %s", cache_path)
         except Exception as e:
+            logger.debug("Failed to write config cache %s: %s", cache_path, e)
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+    
+    def _load_yaml_file(self, path: str) -> Optional[Dict[str, Any]]:
+        """Load and parse a YAML configuration file.
+        
+        Parsed files are cached per process and reused while their modification
+        time and size are unchanged.
+        """
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            logger.debug("Config file does not exist: %s", path)
+            return None
+        except OSError as e:
             logger.error(f"Failed to load config file {path}: {e}")
             raise ConfigError(f"Failed to load config file {path}: {e}")
+        
+        # One open covers existence, permissions and reading; the cache is
+        # validated against the open handle rather than a separate stat
+        with f:
+            stat = os.fstat(f.fileno())
+            cache_key = os.path.abspath(path)
+            cached = _YAML_CACHE.get(cache_key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                _YAML_CACHE.move_to_end(cache_key)
+                logger.debug("Using cached YAML for %s", path)
+                # Callers merge into the result, so hand out a copy
+                return _copy_yaml_data(cached[2])
+            
+            try:
+                # Binary mode lets the loader decode the stream itself
+                config_data = yaml.load(f, Loader=_YamlLoader)
+                logger.debug("Loaded YAML from %s", path)
+            except Exception as e:
+                logger.error(f"Failed to load config file {path}: {e}")
+                raise ConfigError(f"Failed to load config file {path}: {e}")
+        
+        _YAML_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config_data)
+        _YAML_CACHE.move_to_end(cache_key)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+        return _copy_yaml_data(config_data)
     
     def _load_env_vars(self) -> None:
         """Load configuration from environment variables.
@@ -179,31 +366,51 @@ class Config:
             NK2DL_DEADLINE_HOST -> deadline.host
             NK2DL_DEADLINE_USE__WEB__SERVICE -> deadline.use_web_service
         """
+        prefix = 'NK2DL_'
+        prefix_len = len(prefix)
+        debug = logger.isEnabledFor(logging.DEBUG)
         env_vars_found = 0
-        for key, value in os.environ.items():
-            if key.startswith('NK2DL_') and key not in self.SPECIAL_ENV_VARS:
-                # Remove prefix and split into section and key
-                _, section, *key_parts = key.split('_')
-                # Join remaining parts and replace double underscores with single
-                key = '_'.join(key_parts).lower().replace('__', '_')
-                logger.debug(f"Setting config from env var: {section.lower()}.{key} = {value}")
-                self._set_config_value([section.lower(), key], value)
-                env_vars_found += 1
+        for env_key in os.environ:
+            # Reject unrelated variables before doing any other work
+            if not env_key.startswith(prefix) or env_key in self.SPECIAL_ENV_VARS:
+                continue
+            
+            # Remove prefix and split into section and key
+            section, _, key = env_key[prefix_len:].partition('_')
+            section = section.lower()
+            # Replace double underscores with single
+            key = key.lower().replace('__', '_')
+            value = os.environ[env_key]
+            if debug:
+                logger.debug("Setting config from env var: %s.%s = %s", section, key, value)
+            self._set_config_value([section, key], value)
+            env_vars_found += 1
                 
-        logger.debug(f"Found {env_vars_found} NK2DL_ environment variables")
+        logger.debug("Found %d NK2DL_ environment variables", env_vars_found)
     
     def _update_config(self, new_config: Dict[str, Any]) -> None:
-        """Recursively update configuration dictionary."""
-        for key, value in new_config.items():
-            if isinstance(value, dict) and key in self._config:
-                logger.debug(f"Updating nested config section: {key}")
-                self._config[key].update(value)
-            else:
-                logger.debug(f"Setting config key: {key} = {value}")
-                self._config[key] = value
+        """Deep-merge a configuration dictionary into the current configuration.
+        
+        Nested sections are merged key by key, at any depth, using an explicit
+        stack rather than recursion. A dict only merges into an existing dict;
+        any other existing value is replaced.
+        """
+        self._flat = self._flat_values = None
+        stack = [(self._config, new_config, "")]
+        while stack:
+            target, source, prefix = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    logger.debug("Updating nested config section: %s%s", prefix, key)
+                    stack.append((current, value, f"{prefix}{key}."))
+                else:
+                    logger.debug("Setting config key: %s%s = %s", prefix, key, value)
+                    target[key] = value
     
     def _set_config_value(self, path: list, value: str) -> None:
         """Set a configuration value at the specified path."""
+        self._flat = self._flat_values = None
         current = self._config
         for part in path[:-1]:
             if part not in current:
@@ -212,28 +419,79 @@ class Config:
         
         # Convert string value to appropriate type
         original_value = value
-        if value.lower() in ('true', 'yes', '1', 'on'):
+        lowered = value.lower()
+        if lowered in _TRUE_VALUES:
             value = True
-        elif value.lower() in ('false', 'no', '0', 'off'):
+        elif lowered in _FALSE_VALUES:
             value = False
         else:
-            # Try to convert numeric values
-            try:
-                if '.' in value:
-                    value = float(value)
-                else:
+            # Plain integers and decimals are converted without raising; other
+            # strings that start like a number (1e5, 1_000, 1.5e3) fall back to
+            # int()/float(), so ordinary strings never raise
+            digits = value[1:] if value[:1] in ('-', '+') else value
+            if digits.isdecimal():
+                value = int(value)
+            elif '.' in digits and digits.replace('.', '', 1).isdecimal():
+                value = float(value)
+            elif digits.lstrip('.')[:1].isdecimal():
+                try:
                     value = int(value)
-            except (ValueError, TypeError):
-                pass
+                except ValueError:
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        pass
         
-        if original_value != value:
-            logger.debug(f"Converted config value from '{original_value}' to {value} ({type(value).__name__})")
+        if original_value != value and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Converted config value from '%s' to %s (%s)", original_value, value, type(value).__name__)
             
         current[path[-1]] = value
     
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """The nested configuration dictionary."""
+        return self._data
+    
+    @_config.setter
+    def _config(self, value: Dict[str, Any]) -> None:
+        self._data = value
+        self._flat = self._flat_values = None
+    
+    def _build_flat(self) -> Dict[str, Any]:
+        """Index every section and value of the configuration by its dotted key."""
+        flat = {}
+        stack = [(self._data, "")]
+        while stack:
+            section, prefix = stack.pop()
+            for key, value in section.items():
+                full_key = f"{prefix}{key}"
+                flat[full_key] = value
+                if isinstance(value, dict):
+                    stack.append((value, f"{full_key}."))
+        self._flat = flat
+        return flat
+    
+    def flatten(self) -> Dict[str, Any]:
+        """Return every configuration value keyed by its dotted key, in sorted key order.
+        
+        Sections are left out. The result is cached with the configuration, so
+        it is only rebuilt after the configuration changes.
+        """
+        flat_values = self._flat_values
+        if flat_values is None:
+            flat = self._flat
+            if flat is None:
+                flat = self._build_flat()
+            flat_values = {key: flat[key] for key in sorted(flat) if not isinstance(flat[key], dict)}
+            self._flat_values = flat_values
+        return flat_values
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by key.
         
+        Values are looked up in a dotted-key index that is rebuilt lazily after
+        the configuration changes.
+        
         Args:
             key: Dot-separated configuration key (e.g. 'deadline.host')
             default: Default value if key doesn't exist
@@ -241,16 +499,85 @@ class Config:
         Returns:
             Configuration value or default
         """
-        current = self._config
-        for part in key.split('.'):
-            if not isinstance(current, dict) or part not in current:
-                logger.debug(f"Config key not found: {key}, using default: {default}")
-                return default
-            current = current[part]
+        flat = self._flat
+        if flat is None:
+            flat = self._build_flat()
+        
+        try:
+            value = flat[key]
+        except KeyError:
+            logger.debug("Config key not found: %s, using default: %s", key, default)
+            return default
         
-        logger.debug(f"Config get: {key} = {current}")
-        return current
+        logger.debug("Config get: %s = %s", key, value)
+        return value
+
+@functools.cache
+def get_config(project_config: Optional[str] = None, user_config: Optional[str] = None) -> Config:
+    """Return a shared Config for the given config file paths.
+    
+    Calls with the same arguments return the same instance, so the YAML files
+    and environment are only read once per process. Use
+    invalidate_config_cache() to force a reload. The on-disk cache is only used
+    after enable_config_cache().
+    
+    Args:
+        project_config: Optional path to project configuration file
+        user_config: Optional path to user configuration file
+        
+    Returns:
+        Shared Config instance
+    """
+    return Config(project_config, user_config, use_cache=_config_cache_enabled)
+
+def enable_config_cache(enabled: bool = True) -> None:
+    """Turn the on-disk config cache on or off for configs created by get_config().
+    
+    Meant for CLI entry points that run once per script; configs that were
+    already created are not reloaded.
+    
+    Args:
+        enabled: Whether to reuse the on-disk cache of the resolved configuration
+    """
+    global _config_cache_enabled
+    _config_cache_enabled = enabled
+
+def invalidate_config_cache() -> None:
+    """Discard all shared Config instances, including the global config."""
+    get_config.cache_clear()
+    object.__setattr__(config, '_instance', None)
+
+class _LazyConfig:
+    """Stand-in for the global Config instance that builds it on first use.
+    
+    Importing ``config`` is free; the YAML files and environment are only read
+    when an attribute is first accessed. The instance is the one returned by
+    get_config() with default arguments.
+    """
+    
+    __slots__ = ('_instance', '_lock')
+    
+    def __init__(self):
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+    
+    def _resolve(self) -> Config:
+        """Return the global Config, creating it if needed."""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    logger.debug("Creating global config instance")
+                    instance = get_config()
+                    object.__setattr__(self, '_instance', instance)
+        return instance
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
 
-# Global configuration instance
-logger.debug("Creating global config instance")
-config = Config() 
\ No newline at end of file
+# Global configuration instance, created lazily on first use
+config = _LazyConfig()
@@ -1,3 +1,4 @@
+import heapq
 import re
 from typing import List, Optional, Tuple, Union
 
@@ -50,6 +51,18 @@ class FrameRange:
     # Token patterns
     TOKEN_PATTERN = r'(f|first|m|middle|l|last|i|input|h|hero)\b'
     
+    # Compiled once at class definition so each call skips the re module's pattern cache
+    _FRAME_RANGE_RE = re.compile(FRAME_RANGE_PATTERN)
+    _TOKEN_RE = re.compile(TOKEN_PATTERN)
+    _INPUT_TOKEN_RE = re.compile(r'\b(i|input)\b')
+    _NORMALIZE_RE = re.compile(r'[,\s]+')
+    
+    # All substitutable tokens, longest spelling first within each alternation
+    _TOKENS_RE = re.compile(r'\b(first|middle|last|input|hero|f|m|l|i|h)\b')
+    
+    # Knob lines read from Nuke script content
+    _SCRIPT_KNOBS_RE = re.compile(r'^\s*(first_frame|last_frame|heroFrames)\s+(.+)$', re.M)
+    
     def __init__(self, frame_range_str: str = ""):
         """
         Initialize with a frame range string.
@@ -59,7 +72,11 @@ class FrameRange:
         """
         self.original_str = frame_range_str
         self.processed_str = ""
-        self.has_tokens = bool(re.search(self.TOKEN_PATTERN, frame_range_str))
+        self.has_tokens = bool(self._TOKEN_RE.search(frame_range_str))
+        
+        # Cached results, reset whenever token substitution changes processed_str
+        self._valid_for: Optional[Tuple[str, bool]] = None
+        self._expanded: Optional[List[int]] = None
     
     def is_valid_syntax(self) -> bool:
         """
@@ -71,7 +88,9 @@ class FrameRange:
         if not self.original_str:
             return False
         
-        return bool(re.match(self.FRAME_RANGE_PATTERN, self.original_str))
+        if self._valid_for is None or self._valid_for[0] != self.original_str:
+            self._valid_for = (self.original_str, bool(self._FRAME_RANGE_RE.match(self.original_str)))
+        return self._valid_for[1]
     
     @staticmethod
     def normalize_hero_frames(hero_frames: str) -> str:
@@ -89,7 +108,7 @@ class FrameRange:
             return ""
             
         # Replace any combination of spaces and commas with a single space
-        normalized = re.sub(r'[,\s]+', ' ', hero_frames.strip())
+        normalized = FrameRange._NORMALIZE_RE.sub(' ', hero_frames.strip())
         
         # Split by space and rejoin with commas
         frame_list = normalized.split()
@@ -114,41 +133,38 @@ class FrameRange:
         Returns:
             str: Frame range string with tokens substituted
         """
+        self._expanded = None
+        
         if not self.has_tokens:
             self.processed_str = self.original_str
             return self.processed_str
         
-        # Make a copy of the original string for processing
-        result = self.original_str
-        
         # Calculate middle frame if first and last frames are provided
         middle_frame = None
         if first_frame is not None and last_frame is not None:
             middle_frame = int((first_frame + last_frame) / 2)
         
-        # Substitute tokens
+        # Collect replacement values for the tokens we have data for
+        subs = {}
         if first_frame is not None:
-            result = re.sub(r'\bf\b', str(int(first_frame)), result)
-            result = re.sub(r'\bfirst\b', str(int(first_frame)), result)
+            subs['f'] = subs['first'] = str(int(first_frame))
         
         if middle_frame is not None:
-            result = re.sub(r'\bm\b', str(middle_frame), result)
-            result = re.sub(r'\bmiddle\b', str(middle_frame), result)
+            subs['m'] = subs['middle'] = str(middle_frame)
             
         if last_frame is not None:
-            result = re.sub(r'\bl\b', str(int(last_frame)), result)
-            result = re.sub(r'\blast\b', str(int(last_frame)), result)
+            subs['l'] = subs['last'] = str(int(last_frame))
             
         if input_first_frame is not None and input_last_frame is not None:
-            input_range = f"{input_first_frame}-{input_last_frame}"
-            result = re.sub(r'\bi\b', input_range, result)
-            result = re.sub(r'\binput\b', input_range, result)
+            subs['i'] = subs['input'] = f"{input_first_frame}-{input_last_frame}"
             
         if hero_frames is not None:
-            normalized_hero_frames = self.normalize_hero_frames(hero_frames)
-            result = re.sub(r'\bh\b', normalized_hero_frames, result)
-            result = re.sub(r'\bhero\b', normalized_hero_frames, result)
-            
+            subs['h'] = subs['hero'] = self.normalize_hero_frames(hero_frames)
+        
+        # Substitute all tokens in a single pass, leaving unknown ones untouched
+        result = self._TOKENS_RE.sub(lambda match: subs.get(match.group(1), match.group(0)),
+                                     self.original_str)
+        
         self.processed_str = result
         return result
     
@@ -166,6 +182,8 @@ class FrameRange:
         Raises:
             ImportError: If not running in a Nuke environment
         """
+        self._expanded = None
+        
         if not self.has_tokens:
             self.processed_str = self.original_str
             return self.processed_str
@@ -184,13 +202,13 @@ class FrameRange:
             # Get input frame range if a write node is specified
             input_first_frame = None
             input_last_frame = None
-            if write_node_name and re.search(r'\b(i|input)\b', self.original_str):
+            if write_node_name and self._INPUT_TOKEN_RE.search(self.original_str):
                 write_node = nuke.toNode(write_node_name)
                 if write_node:
                     try:
                         input_first_frame = write_node.firstFrame()
                         input_last_frame = write_node.lastFrame()
-                    except:
+                    except Exception:
                         # Fall back to global first/last if we can't get input range
                         input_first_frame = first_frame
                         input_last_frame = last_frame
@@ -212,18 +230,26 @@ class FrameRange:
         Returns:
             str: Frame range string with tokens substituted
         """
+        self._expanded = None
+        
         if not self.has_tokens:
             self.processed_str = self.original_str
             return self.processed_str
         
-        # Extract frame information from the script
-        first_frame_match = re.search(r'first_frame\s+(\d+)', script_content)
-        last_frame_match = re.search(r'last_frame\s+(\d+)', script_content)
-        hero_frames_match = re.search(r'heroFrames\s+(.+?)(?:\n|$)', script_content)
+        # Extract frame information from the script in a single pass, keeping the
+        # first valid value of each knob and stopping once all three are found
+        found = {}
+        for match in self._SCRIPT_KNOBS_RE.finditer(script_content):
+            knob, value = match.group(1), match.group(2).strip()
+            if knob in found or (knob != 'heroFrames' and not value.isdecimal()):
+                continue
+            found[knob] = value
+            if len(found) == 3:
+                break
         
-        first_frame = int(first_frame_match.group(1)) if first_frame_match else None
-        last_frame = int(last_frame_match.group(1)) if last_frame_match else None
-        hero_frames = hero_frames_match.group(1).strip() if hero_frames_match else None
+        first_frame = int(found['first_frame']) if 'first_frame' in found else None
+        last_frame = int(found['last_frame']) if 'last_frame' in found else None
+        hero_frames = found.get('heroFrames')
         
         # We can't reliably extract input frame range from script content, so we'll leave it as None
         return self.substitute_tokens(first_frame, last_frame, hero_frames)
@@ -232,12 +258,23 @@ class FrameRange:
         """
         Expand the processed frame range string into a list of frame numbers.
         
+        Frames are returned in ascending order. Duplicates are kept, so a frame
+        listed twice (e.g. "f,hero" where the first frame is also a hero frame)
+        appears twice. Ranges written in ascending order, which is the common
+        case, are concatenated without sorting; otherwise the already-sorted
+        parts are merged.
+        
+        The result is cached until tokens are substituted again.
+        
         Returns:
             List[int]: List of frame numbers specified by the range
             
         Raises:
             ValueError: If the frame range syntax is invalid or token substitution is needed
         """
+        if self._expanded is not None:
+            return list(self._expanded)
+        
         if not self.processed_str:
             if self.has_tokens:
                 raise ValueError("Token substitution needed before expanding range")
@@ -246,36 +283,57 @@ class FrameRange:
         if not self.is_valid_syntax():
             raise ValueError(f"Invalid frame range syntax: {self.processed_str}")
             
-        result = []
-        parts = self.processed_str.split(',')
+        # Each part expands to an ascending chunk of frames
+        chunks = []
+        in_order = True
+        last = None
         
-        for part in parts:
-            if '-' in part:
-                range_parts = re.match(r'(\d+)-(\d+)(?:x(\d+)|/(\d+))?', part)
-                if range_parts:
-                    try:
-                        start = int(range_parts.group(1))
-                        end = int(range_parts.group(2))
-                        step = int(range_parts.group(3) or range_parts.group(4) or 1)
-                        
-                        if step <= 0:
-                            raise ValueError(f"Step value must be positive in range: {part}")
-                        
-                        if start > end:
-                            raise ValueError(f"Start frame must be less than or equal to end frame in range: {part}")
-                            
-                        result.extend(range(start, end + 1, step))
-                    except (ValueError, TypeError) as e:
-                        raise ValueError(f"Error parsing range '{part}': {str(e)}")
+        for part in self.processed_str.split(','):
+            if part.isdecimal():
+                chunk = [int(part)]
+            elif '-' in part:
+                start_str, _, end_str = part.partition('-')
+                if 'x' in end_str:
+                    end_str, _, step_str = end_str.partition('x')
+                elif '/' in end_str:
+                    end_str, _, step_str = end_str.partition('/')
                 else:
+                    step_str = ''
+                
+                # A trailing 'x' without a step value falls back to a step of 1
+                if not (start_str.isdecimal() and end_str.isdecimal()
+                        and (not step_str or step_str.isdecimal())):
                     raise ValueError(f"Invalid range format: {part}")
-            else:
-                try:
-                    result.append(int(part))
-                except ValueError:
-                    raise ValueError(f"Invalid frame number: {part}")
                 
-        return sorted(result)
+                start = int(start_str)
+                end = int(end_str)
+                step = int(step_str or 1)
+                
+                if step <= 0:
+                    raise ValueError(f"Error parsing range '{part}': Step value must be positive in range: {part}")
+                
+                if start > end:
+                    raise ValueError(f"Error parsing range '{part}': "
+                                     f"Start frame must be less than or equal to end frame in range: {part}")
+                    
+                chunk = range(start, end + 1, step)
+            else:
+                raise ValueError(f"Invalid frame number: {part}")
+            
+            if last is not None and chunk[0] < last:
+                in_order = False
+            last = chunk[-1]
+            chunks.append(chunk)
+        
+        if in_order:
+            result = []
+            for chunk in chunks:
+                result.extend(chunk)
+        else:
+            result = list(heapq.merge(*chunks))
+        
+        self._expanded = result
+        return list(result)
     
     def __str__(self) -> str:
         """String representation of the frame range."""
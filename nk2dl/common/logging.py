@@ -4,12 +4,47 @@ This module provides a centralized logging configuration that integrates
 with the configuration system.
 """
 
+import functools
 import logging
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Tuple
+
+@functools.lru_cache(maxsize=None)
+def _build_handlers(log_format: str, log_file: Optional[str]) -> Tuple[logging.Handler, ...]:
+    """Build the handlers for a logging configuration.
+    
+    Cached so loggers sharing a configuration share one formatter and one set
+    of handlers (and so a log file is only opened once).
+    
+    Args:
+        log_format: Format string for log records
+        log_file: Optional path of a file to log to
+        
+    Returns:
+        Tuple of configured handlers
+    """
+    # Create formatter
+    formatter = logging.Formatter(log_format)
+    
+    # Always add console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
+    
+    # Add file handler if configured
+    if log_file:
+        # Ensure log directory exists
+        log_path = Path(log_file)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    
+    return tuple(handlers)
 
-from .config import config
 
 def setup_logging(name: Optional[str] = None) -> logging.Logger:
     """Set up and return a logger instance.
@@ -24,29 +59,17 @@ def setup_logging(name: Optional[str] = None) -> logging.Logger:
     
     # Only configure if no handlers exist (avoid duplicate handlers)
     if not logger.handlers:
+        # Imported here so importing this module doesn't pull in the config system
+        from .config import config
+        
         # Get logging config
         log_level = config.get('logging.level', 'INFO')
         log_format = config.get('logging.format', 
                               '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         log_file = config.get('logging.file')
         
-        # Create formatter
-        formatter = logging.Formatter(log_format)
-        
-        # Always add console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        
-        # Add file handler if configured
-        if log_file:
-            # Ensure log directory exists
-            log_path = Path(log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+        for handler in _build_handlers(log_format, log_file):
+            logger.addHandler(handler)
         
         # Set log level
         logger.setLevel(getattr(logging, log_level.upper()))
@@ -69,13 +92,44 @@ def configure_logging(level: str = None) -> None:
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, level.upper()))
         
-        # Update nk2dl logger
-        nk2dl_logger = logging.getLogger('nk2dl')
+        # Update nk2dl logger, setting it up first so its configured level doesn't replace this one
+        nk2dl_logger = setup_logging('nk2dl')
         nk2dl_logger.setLevel(getattr(logging, level.upper()))
         
         # Log the level change
         logger.debug(f"Logging level set to {level}")
 
 
-# Create default logger
-logger = setup_logging('nk2dl') 
\ No newline at end of file
+class _LazyLogger:
+    """Stand-in for the 'nk2dl' logger that sets it up on first use.
+    
+    Importing ``logger`` doesn't read the config; the handlers and level from
+    the logging config are applied when the logger is first used.
+    """
+    
+    __slots__ = ('_instance', '_lock')
+    
+    def __init__(self):
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+    
+    def _resolve(self) -> logging.Logger:
+        """Return the 'nk2dl' logger, setting it up if needed."""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = setup_logging('nk2dl')
+                    object.__setattr__(self, '_instance', instance)
+        return instance
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+# Default logger, set up lazily on first use
+logger = _LazyLogger()
+ 
\ No newline at end of file
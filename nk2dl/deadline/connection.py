@@ -4,9 +4,17 @@ This module provides a unified interface for connecting to Deadline using either
 the Web Service API or command-line interface.
 """
 
+import atexit
+import functools
+import logging
 import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -36,6 +44,240 @@ def colored_text(text: str, color_code: str) -> str:
     """
     return f"{color_code}{text}{Colors.RESET}"
 
+# Matches the JobID= lines printed by deadlinecommand after a submission
+_JOB_ID_RE = re.compile(r'^JobID=(\S+)', re.MULTILINE)
+# Matches the Result= and JobID= lines deadlinecommand prints for each job of a batch
+_JOB_RESULT_RE = re.compile(r'^(Result|JobID)=(\S*)', re.MULTILINE)
+# Non-blank lines of deadlinecommand output, without surrounding whitespace
+_OUTPUT_LINE_RE = re.compile(r'^\s*(\S.*?)\s*$', re.MULTILINE)
+
+# Keeps deadlinecommand from opening a console window on Windows. Popen copies it
+# for each call, so one instance can be shared.
+_STARTUPINFO = None
+if os.name == 'nt':
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
+# Maximum number of threads used to write job files for batched submissions
+_MAX_WRITE_WORKERS = 16
+
+# Default number of concurrent Web Service submissions, kept small to avoid
+# contention on the Deadline Repository. Set with deadline.submit_workers.
+_DEFAULT_SUBMIT_WORKERS = 8
+
+# deadlinecommand paths located for each (DEADLINE_PATH, fallback path) pair
+_command_paths: Dict[Tuple[str, Optional[str]], str] = {}
+
+# Guards _command_paths so concurrent connections search the filesystem only once
+_command_paths_lock = threading.Lock()
+
+# Repository paths reported by each deadlinecommand that has been verified in this process
+_repository_paths: Dict[str, str] = {}
+
+# Web Service clients that have been verified in this process, keyed by
+# (host, port, ssl, ssl certificate)
+_web_clients: Dict[Tuple[str, int, bool, Optional[str]], Any] = {}
+
+def _find_deadline_command(default_path: Optional[str] = None) -> str:
+    """Find the deadlinecommand executable for the current DEADLINE_PATH.
+    
+    The located path is remembered per DEADLINE_PATH value and fallback path, so
+    the filesystem is only searched once per process. Failures are not remembered, so fixing the
+    environment takes effect without a restart.
+    
+    Args:
+        default_path: Path to check if neither DEADLINE_PATH nor the macOS
+            DEADLINE_PATH file is set
+        
+    Returns:
+        Path to deadlinecommand
+        
+    Raises:
+        DeadlineError: If deadlinecommand can't be found
+    """
+    # Try to find it in DEADLINE_PATH
+    deadline_bin = os.environ.get('DEADLINE_PATH', "")
+    
+    cache_key = (deadline_bin, default_path)
+    with _command_paths_lock:
+        command_path = _command_paths.get(cache_key)
+        if command_path is not None:
+            return command_path
+        
+        # On OSX, we look for the DEADLINE_PATH file if the environment variable does not exist.
+        # Opening it directly checks for it and reads it with one call.
+        search_bin = deadline_bin
+        if search_bin == "":
+            try:
+                with open("/Users/Shared/Thinkbox/DEADLINE_PATH") as f:
+                    search_bin = f.read().strip()
+            except OSError:
+                pass
+        
+        command_path = default_path
+        if search_bin:
+            command_path = os.path.join(search_bin, "deadlinecommand")
+            if sys.platform == 'win32':
+                command_path += '.exe'
+        
+        if not command_path or not os.path.exists(command_path):
+            raise DeadlineError(
+                "Could not find deadlinecommand. Please ensure Deadline is installed "
+                "and DEADLINE_PATH environment variable is set correctly."
+            )
+        
+        _command_paths[cache_key] = command_path
+        return command_path
+
+@functools.lru_cache(maxsize=8)
+def _command_prefix(command_path: str) -> Tuple[str, ...]:
+    """Get the leading arguments used to run deadlinecommand.
+    
+    A dotnet command string is split into its parts, and the result is cached
+    since the same command path is used for every call in a process.
+    
+    Args:
+        command_path: Path to deadlinecommand, or a dotnet command string
+        
+    Returns:
+        Tuple of arguments that run deadlinecommand
+    """
+    if "dotnet" in command_path:
+        return tuple(command_path.split())
+    return (command_path,)
+
+@functools.cache
+def _current_user() -> str:
+    """Get the name of the submitting user, looked up once per process.
+    
+    getpass.getuser() falls back to the password database, which may be
+    served over the network, so it isn't repeated for every job.
+    
+    Returns:
+        The current user name
+    """
+    import getpass
+    return getpass.getuser()
+
+def _format_info_file(info: Dict[str, Any]) -> str:
+    """Format a job or plugin info dictionary as the contents of a Deadline .job file.
+    
+    Values are converted to strings as they are formatted, so no intermediate
+    dictionary of string values is needed.
+    
+    Args:
+        info: Dictionary of string keys and values of any type
+        
+    Returns:
+        Newline-terminated key=value lines
+    """
+    return "".join([f"{key}={value}\n" for key, value in info.items()])
+
+_temp_dir: Optional[str] = None
+_temp_dir_lock = threading.Lock()
+
+def _get_temp_dir() -> str:
+    """Get the directory job files are written to.
+    
+    The directory is created on first use and shared by every submission in
+    the process, so repeated submissions don't each create and remove their
+    own directory. It is removed when the process exits.
+    
+    Returns:
+        Path of the temporary directory
+    """
+    global _temp_dir
+    with _temp_dir_lock:
+        if _temp_dir is None or not os.path.isdir(_temp_dir):
+            _temp_dir = tempfile.mkdtemp(prefix="nk2dl_")
+            atexit.register(shutil.rmtree, _temp_dir, ignore_errors=True)
+        return _temp_dir
+
+def _write_job_files(job_data: str, plugin_data: str, temp_paths: List[str]) -> Tuple[str, str]:
+    """Write job and plugin info to temporary .job files for deadlinecommand.
+    
+    deadlinecommand only reads submission info from files, so each file is
+    encoded up front and written with a single unbuffered call, then removed
+    again by _remove_files.
+    
+    Args:
+        job_data: Contents of the job info file
+        plugin_data: Contents of the plugin info file
+        temp_paths: List the created file paths are appended to, for cleanup
+        
+    Returns:
+        Tuple of (job info path, plugin info path)
+    """
+    temp_dir = _get_temp_dir()
+    
+    with tempfile.NamedTemporaryFile(mode='wb', buffering=0, suffix='.job', dir=temp_dir, delete=False) as job_file:
+        temp_paths.append(job_file.name)
+        job_file.write(job_data.encode('utf-8'))
+        
+    with tempfile.NamedTemporaryFile(mode='wb', buffering=0, suffix='.job', dir=temp_dir, delete=False) as plugin_file:
+        temp_paths.append(plugin_file.name)
+        plugin_file.write(plugin_data.encode('utf-8'))
+    
+    return job_file.name, plugin_file.name
+
+def _parse_job_results(output: str, job_count: int, error: str = "") -> List[Union[str, DeadlineError]]:
+    """Match the jobs of a -SubmitMultipleJobs call to their results.
+    
+    deadlinecommand reports each job in submission order, printing a JobID=
+    line for a job that was queued and a Result= line other than Success for
+    one that wasn't.
+    
+    Args:
+        output: Standard output of deadlinecommand
+        job_count: Number of jobs that were submitted
+        error: Error output of deadlinecommand, used for jobs without a result
+        
+    Returns:
+        The job ID, or the error it failed with, for each job in submission order
+    """
+    results: List[Union[str, DeadlineError]] = []
+    for key, value in _JOB_RESULT_RE.findall(output):
+        if len(results) == job_count:
+            break
+        if key == "JobID":
+            results.append(value)
+        elif value != "Success":
+            results.append(DeadlineError(f"Deadline reported Result={value}"))
+    
+    message = f"Command line error: {error}" if error else "No job ID found in submission output"
+    results.extend(DeadlineError(message) for _ in range(job_count - len(results)))
+    return results
+
+def _remove_files(paths: List[str]) -> None:
+    """Remove temporary files, ignoring ones that are already gone.
+    
+    Args:
+        paths: Paths of the files to remove
+    """
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to clean up temporary file {path}: {e}")
+
+def _auxiliary_files(job_info: Dict[str, Any]) -> List[str]:
+    """Get the auxiliary files to pass to deadlinecommand for a job.
+    
+    Args:
+        job_info: Job information dictionary
+        
+    Returns:
+        List of auxiliary file paths (empty if none are specified)
+    """
+    aux_files = job_info.get("AuxiliaryFiles")
+    if not aux_files:
+        return []
+    if isinstance(aux_files, list):
+        return aux_files
+    return [aux_files]
+
 class DeadlineConnection:
     """Manages connection to Deadline.
     
@@ -52,6 +294,10 @@ class DeadlineConnection:
         # Don't initialize connection in __init__ to make testing easier
         self._initialized = False
         
+        # Guards connecting and falling back to the command line, since a
+        # connection is shared by the threads of batched submissions
+        self._lock = threading.RLock()
+        
         # For command line, verify the command path exists - but only if we're using command line
         if not self.use_web_service:
             self._setup_command_line()
@@ -59,14 +305,36 @@ class DeadlineConnection:
     def ensure_connected(self):
         """Ensure connection is initialized."""
         if not self._initialized:
-            if self.use_web_service:
-                self._init_web_service()
-            else:
-                self._init_command_line()
-            self._initialized = True
+            with self._lock:
+                if not self._initialized:
+                    if self.use_web_service:
+                        self._init_web_service()
+                    else:
+                        self._init_command_line()
+                    self._initialized = True
+    
+    def _fall_back_to_command_line(self) -> None:
+        """Switch this connection from the Web Service to the command line.
+        
+        Threads sharing the connection may fail at the same time; the first one
+        switches the connection and the others reuse the command line it set up.
+        use_web_service is only cleared once the command line is ready, so no
+        thread submits with a half-configured connection.
+        """
+        with self._lock:
+            if not self.use_web_service:
+                return
+            self._setup_command_line()
+            self._init_command_line()
+            self.use_web_service = False
     
     def _init_web_service(self) -> None:
-        """Initialize web service connection."""
+        """Initialize web service connection.
+        
+        Clients are shared by every connection to the same Web Service, so the
+        connection test is made once per process and later connections reuse
+        the client's HTTP connection.
+        """
         try:
             from Deadline.DeadlineConnect import DeadlineCon as Connect
         except ImportError:
@@ -74,9 +342,7 @@ class DeadlineConnection:
                 fallback_msg = "Failed to import Deadline Web Service API. Attempting fallback to command line."
                 logger.warning(colored_text(fallback_msg, Colors.RED))
                 try:
-                    self._setup_command_line()
-                    self.use_web_service = False
-                    self._init_command_line()
+                    self._fall_back_to_command_line()
                     logger.info("Web Service connection failed. Successfully connected via command line.")
                     return
                 except Exception as e:
@@ -94,6 +360,13 @@ class DeadlineConnection:
         use_ssl = config.get('deadline.ssl', False)
         ssl_cert = config.get('deadline.ssl_cert')
         
+        client_key = (host, port, use_ssl, ssl_cert)
+        web_client = _web_clients.get(client_key)
+        if web_client is not None:
+            logger.debug("Reusing verified Deadline Web Service client for %s:%s", host, port)
+            self._web_client = web_client
+            return
+        
         try:
             if use_ssl:
                 if not ssl_cert:
@@ -113,15 +386,14 @@ class DeadlineConnection:
                 groups = self._web_client.Groups.GetGroupNames()
                 if groups is None or not isinstance(groups, list):
                     raise DeadlineError(f"Invalid response from Groups.GetGroupNames(): {groups}")
+                _web_clients[client_key] = self._web_client
                 logger.info(f"Successfully connected to Deadline Web Service at {host}:{port}")
             except Exception as e:
                 if config.get('deadline.commandline_on_fail', True):
                     fallback_msg = f"Failed to test Deadline Web Service connection at {host}:{port}: {e}. Attempting fallback to command line."
                     logger.warning(colored_text(fallback_msg, Colors.RED))
                     try:
-                        self._setup_command_line()
-                        self.use_web_service = False
-                        self._init_command_line()
+                        self._fall_back_to_command_line()
                         logger.info("Web Service connection failed. Successfully connected via command line.")
                         return
                     except Exception as fallback_error:
@@ -138,9 +410,7 @@ class DeadlineConnection:
                 fallback_msg = f"Failed to connect to Deadline Web Service at {host}:{port}. Attempting fallback to command line."
                 logger.warning(colored_text(fallback_msg, Colors.RED))
                 try:
-                    self._setup_command_line()
-                    self.use_web_service = False
-                    self._init_command_line()
+                    self._fall_back_to_command_line()
                     logger.info("Web Service connection failed. Successfully connected via command line.")
                     return
                 except Exception as fallback_error:
@@ -154,31 +424,34 @@ class DeadlineConnection:
                 )
     
     def _init_command_line(self) -> None:
-        """Initialize command-line interface."""
+        """Initialize command-line interface.
+        
+        Starting deadlinecommand is slow, so each command path is only tested
+        once per process; later connections reuse the result.
+        """
+        if self._command_path in _repository_paths:
+            logger.debug("Reusing verified deadlinecommand at %s", self._command_path)
+            return
+        
         # Test connection by getting repository path directly
         args = [self._command_path, "-GetRepositoryPath"]
         
-        startupinfo = None
-        if os.name == 'nt':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        
         try:
             proc = subprocess.Popen(
                 args,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                startupinfo=startupinfo
+                startupinfo=_STARTUPINFO,
+                close_fds=True
             )
             output, errors = proc.communicate()
             
-            if sys.version_info[0] > 2:
-                output = output.decode()
-            
-            path = output.strip()
+            path = output.decode().strip()
             if not path:
                 raise DeadlineError("Empty repository path returned")
+            
+            _repository_paths[self._command_path] = path
                 
             logger.info("Successfully connected to Deadline via command-line")
             
@@ -200,33 +473,24 @@ class DeadlineConnection:
                 if config.get('deadline.commandline_on_fail', True):
                     fallback_msg = f"Failed to get groups via web service: {e}. Falling back to command line."
                     logger.warning(colored_text(fallback_msg, Colors.RED))
-                    self._setup_command_line()
-                    self.use_web_service = False
-                    self._init_command_line()
+                    self._fall_back_to_command_line()
                     return self.get_groups()  # Retry with command line
                 else:
                     raise DeadlineError(f"Failed to get groups via web service: {e}")
         else:
-            if "dotnet" in self._command_path:
-                # For dotnet command string, split into command parts
-                command_parts = self._command_path.split()
-                command_parts.append("-Groups")
-                args = command_parts
-            else:
-                args = [self._command_path, "-Groups"]
+            args = self._command_args("-Groups")
             try:
                 proc = subprocess.Popen(
                     args,
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
+                    stderr=subprocess.PIPE,
+                    startupinfo=_STARTUPINFO,
+                    close_fds=True
                 )
                 output, errors = proc.communicate()
                 
-                if sys.version_info[0] > 2:
-                    output = output.decode()
-                
-                return [g.strip() for g in output.splitlines() if g.strip()]
+                return _OUTPUT_LINE_RE.findall(output.decode())
             except Exception as e:
                 raise DeadlineError(f"Failed to get groups: {e}")
     
@@ -245,21 +509,11 @@ class DeadlineConnection:
         """
         self.ensure_connected()
         
-        # Set UserName to current user if not specified
-        if 'UserName' not in job_info:
-            import getpass
-            job_info['UserName'] = getpass.getuser()
-        
-        # Convert all values to strings
-        def stringify_dict(d: Dict[str, Any]) -> Dict[str, str]:
-            return {k: str(v) for k, v in d.items()}
-        
-        job_info_str = stringify_dict(job_info)
-        plugin_info_str = stringify_dict(plugin_info)
-        
         if self.use_web_service:
             # Submit via web service using direct JSON API
             logger.info(f"Submitting job via web service")
+            
+            job_info_str, plugin_info_str = self._stringify_job(job_info, plugin_info)
 
             try:
                 import json
@@ -270,8 +524,9 @@ class DeadlineConnection:
                     "PluginInfo": plugin_info_str
                 }
                 
-                # Log the JSON payload for debugging
-                logger.info(f"Submitting job JSON payload via deadline web service:\n{json.dumps(payload, indent=2)}")
+                # Log the JSON payload for debugging, only serializing it when debug logging is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Submitting job JSON payload via deadline web service:\n%s", json.dumps(payload, indent=2))
                 
                 # Submit job with correct arguments to the API
                 job_response = self._web_client.Jobs.SubmitJob(job_info_str, plugin_info_str)
@@ -284,18 +539,20 @@ class DeadlineConnection:
                     # Extract just the ID from the response dictionary
                     job_id = job_response['Props']['_id']
                     # Format the response in the log
-                    logger.debug(f"===== WEB SERVICE RESPONSE START =====\n{json.dumps(job_response, indent=2)}\n===== WEB SERVICE RESPONSE END =====")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("===== WEB SERVICE RESPONSE START =====\n%s\n===== WEB SERVICE RESPONSE END =====", json.dumps(job_response, indent=2))
                 elif isinstance(job_response, str):
                     job_id = job_response
                 else:
                     # Try to find any ID property in the response
                     if isinstance(job_response, dict):
                         # Log the response for debugging with clear formatting
-                        logger.debug(f"===== WEB SERVICE RESPONSE START =====\n{json.dumps(job_response, indent=2)}\n===== WEB SERVICE RESPONSE END =====")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("===== WEB SERVICE RESPONSE START =====\n%s\n===== WEB SERVICE RESPONSE END =====", json.dumps(job_response, indent=2))
                         # Look for '_id' anywhere in the dictionary
                         if '_id' in job_response:
                             job_id = job_response['_id']
-                            logger.debug(f"Found job ID in response: {job_id}")
+                            logger.debug("Found job ID in response: %s", job_id)
                         else:
                             raise DeadlineError(f"Could not find job ID in response: {job_response}")
                     else:
@@ -308,9 +565,7 @@ class DeadlineConnection:
                 if config.get('deadline.commandline_on_fail', True):
                     fallback_msg = f"Failed to submit job via web service: {e}. Falling back to command line."
                     logger.warning(colored_text(fallback_msg, Colors.RED))
-                    self._setup_command_line()
-                    self.use_web_service = False
-                    self._init_command_line()
+                    self._fall_back_to_command_line()
                     return self.submit_job(job_info, plugin_info)  # Retry with command line
                 else:
                     raise DeadlineError(f"Failed to submit job via web service: {e}")
@@ -318,80 +573,28 @@ class DeadlineConnection:
             # Command line submission using files
             logger.info(f"Submitting job via deadline command line")
 
-            import tempfile
-            job_info_path = None
-            plugin_info_path = None
+            temp_paths = []
             
             try:
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.job', delete=False) as job_file:
-                    for key, value in job_info_str.items():
-                        job_file.write(f"{key}={value}\n")
-                    job_info_path = job_file.name
+                # Build each file's contents up front and write it in one call
+                job_data, plugin_data = self._serialize_job(job_info, plugin_info)
+                job_info_path, plugin_info_path = _write_job_files(job_data, plugin_data, temp_paths)
                     
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.job', delete=False) as plugin_file:
-                    for key, value in plugin_info_str.items():
-                        plugin_file.write(f"{key}={value}\n")
-                    plugin_info_path = plugin_file.name
-                
-                # Log the files for debugging
-                with open(job_info_path, 'r') as f:
-                    job_data = f.read()
-                with open(plugin_info_path, 'r') as f:
-                    plugin_data = f.read()
-                    
-                logger.info(f"Submitting job info via deadline command line:\n{job_data}")
-                logger.info(f"Submitting plugin info via deadline command line:\n{plugin_data}")
+                logger.debug("Submitting job info via deadline command line:\n%s", job_data)
+                logger.debug("Submitting plugin info via deadline command line:\n%s", plugin_data)
                 
                 # Submit via command line
-                if "dotnet" in self._command_path:
-                    # For dotnet command string, split into command parts
-                    command_parts = self._command_path.split()
-                    command_parts.extend([job_info_path, plugin_info_path])
-                    args = command_parts
-                else:
-                    args = [self._command_path, job_info_path, plugin_info_path]
-                
-                # Add auxiliary files if specified in job_info
-                if "AuxiliaryFiles" in job_info:
-                    aux_files = job_info["AuxiliaryFiles"]
-                    if isinstance(aux_files, list):
-                        args.extend(aux_files)
-                    else:
-                        args.append(aux_files)
-                
-                startupinfo = None
-                if os.name == 'nt':
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+                args = self._command_args(job_info_path, plugin_info_path, *_auxiliary_files(job_info))
                 
                 try:
-                    proc = subprocess.Popen(
-                        args,
-                        stdin=subprocess.PIPE,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        startupinfo=startupinfo
-                    )
-                    output, errors = proc.communicate()
-                    
-                    if sys.version_info[0] > 2:
-                        output = output.decode()
-                        if errors:
-                            errors = errors.decode()
-                    
-                    # Check for errors
-                    if errors and "error" in errors.lower():
-                        raise DeadlineError(f"Command line error: {errors}")
-                    
-                    # Log the response for debugging with clear formatting
-                    logger.debug(f"===== COMMAND LINE RESPONSE START =====\n{output}\n===== COMMAND LINE RESPONSE END =====")
+                    output = self._run_submit_command(args)
                     
                     # Parse job ID from output
-                    for line in output.splitlines():
-                        if line.startswith("JobID="):
-                            job_id = line[6:].strip()
-                            logger.info(f"Job submitted successfully with ID: {job_id}")
-                            return job_id
+                    match = _JOB_ID_RE.search(output)
+                    if match:
+                        job_id = match.group(1)
+                        logger.info(f"Job submitted successfully with ID: {job_id}")
+                        return job_id
                             
                     raise DeadlineError("No job ID found in submission output")
                     
@@ -399,50 +602,195 @@ class DeadlineConnection:
                     raise DeadlineError(f"Failed to submit job via command line: {e}")
                     
             finally:
-                # Clean up temporary files
-                if job_info_path and os.path.exists(job_info_path):
-                    try:
-                        os.unlink(job_info_path)
-                    except Exception as e:
-                        logger.warning(f"Failed to clean up job info file {job_info_path}: {e}")
-                if plugin_info_path and os.path.exists(plugin_info_path):
-                    try:
-                        os.unlink(plugin_info_path)
-                    except Exception as e:
-                        logger.warning(f"Failed to clean up plugin info file {plugin_info_path}: {e}")
+                _remove_files(temp_paths)
 
-    def _setup_command_line(self) -> None:
-        """Set up command line path for fallback."""
-        # Try to find it in DEADLINE_PATH
-        deadline_bin = ""
+    def submit_jobs(self, jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Union[str, DeadlineError]]:
+        """Submit several independent jobs to Deadline.
+        
+        Via the command line all jobs are submitted with one deadlinecommand
+        -SubmitMultipleJobs call, so Deadline only starts up once. Via the Web
+        Service the jobs are submitted as concurrent requests from a thread pool
+        of deadline.submit_workers threads, since they are independent of each other.
+        
+        A job that fails doesn't fail the others, since Deadline has already
+        queued them, so each job's result is returned instead of raising.
+        
+        Args:
+            jobs: List of (job_info, plugin_info) dictionary pairs
+            
+        Returns:
+            The job ID, or the DeadlineError it failed with, for each job in the same order as jobs
+            
+        Raises:
+            DeadlineError: If Deadline can't be reached or deadlinecommand can't be run
+        """
+        self.ensure_connected()
+        
+        def submit_one(job: Tuple[Dict[str, Any], Dict[str, Any]]) -> Union[str, DeadlineError]:
+            try:
+                return self.submit_job(*job)
+            except DeadlineError as e:
+                return e
+        
+        if len(jobs) <= 1:
+            return [submit_one(job) for job in jobs]
+        
+        if self.use_web_service:
+            max_workers = max(1, int(config.get('deadline.submit_workers', _DEFAULT_SUBMIT_WORKERS)))
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+                return list(executor.map(submit_one, jobs))
+        
+        logger.info(f"Submitting {len(jobs)} jobs via deadline command line")
+        
+        temp_paths = []
+        
         try:
-            deadline_bin = os.environ['DEADLINE_PATH']
-        except KeyError:
-            # If the error is a key error it means that DEADLINE_PATH is not set
-            pass
+            job_files_data = []
+            for job_info, plugin_info in jobs:
+                job_data, plugin_data = self._serialize_job(job_info, plugin_info)
+                job_files_data.append((job_data, plugin_data))
+                
+                logger.debug("Submitting job info via deadline command line:\n%s", job_data)
+                logger.debug("Submitting plugin info via deadline command line:\n%s", plugin_data)
             
-        # On OSX, we look for the DEADLINE_PATH file if the environment variable does not exist.
-        if deadline_bin == "" and os.path.exists("/Users/Shared/Thinkbox/DEADLINE_PATH"):
-            with open("/Users/Shared/Thinkbox/DEADLINE_PATH") as f:
-                deadline_bin = f.read().strip()
-
-        if deadline_bin:
-            self._command_path = os.path.join(deadline_bin, "deadlinecommand")
-            if sys.platform == 'win32':
-                self._command_path += '.exe'
+            # Job files are written in parallel, which matters on slow or networked temp dirs
+            with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(jobs))) as executor:
+                job_file_paths = list(executor.map(
+                    lambda data: _write_job_files(data[0], data[1], temp_paths), job_files_data))
+            
+            args = self._command_args("-SubmitMultipleJobs")
+            for (job_info, _), (job_info_path, plugin_info_path) in zip(jobs, job_file_paths):
+                args.extend(["-job", job_info_path, plugin_info_path, *_auxiliary_files(job_info)])
+            
+            try:
+                output, errors = self._run_command(args)
+            except Exception as e:
+                raise DeadlineError(f"Failed to submit jobs via command line: {e}")
+            
+            # Some jobs may have been queued even if others failed, so their IDs are kept
+            results = _parse_job_results(output, len(jobs), errors)
+            job_ids = [result for result in results if isinstance(result, str)]
+            if job_ids:
+                logger.info(f"Jobs submitted successfully with IDs: {', '.join(job_ids)}")
+            if len(job_ids) != len(jobs):
+                logger.error(f"{len(jobs) - len(job_ids)} of {len(jobs)} jobs failed to submit")
+            return results
+            
+        finally:
+            _remove_files(temp_paths)
+    
+    @staticmethod
+    def _stringify_job(job_info: Dict[str, Any], plugin_info: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Prepare job and plugin info for submission.
         
-        if not self._command_path or not os.path.exists(self._command_path):
-            raise DeadlineError(
-                "Could not find deadlinecommand. Please ensure Deadline is installed "
-                "and DEADLINE_PATH environment variable is set correctly."
-            )
+        Sets UserName to the current user if not specified and converts all
+        values to strings.
+        
+        Args:
+            job_info: Job information dictionary
+            plugin_info: Plugin-specific information dictionary
+            
+        Returns:
+            Tuple of (job_info, plugin_info) with string values
+        """
+        if 'UserName' not in job_info:
+            job_info['UserName'] = _current_user()
+        
+        job_info_str = {k: str(v) for k, v in job_info.items()}
+        plugin_info_str = {k: str(v) for k, v in plugin_info.items()}
+        return job_info_str, plugin_info_str
+    
+    @staticmethod
+    def _serialize_job(job_info: Dict[str, Any], plugin_info: Dict[str, Any]) -> Tuple[str, str]:
+        """Prepare the job and plugin info file contents for a command line submission.
+        
+        Sets UserName to the current user if not specified and formats both
+        dictionaries in a single pass each.
+        
+        Args:
+            job_info: Job information dictionary
+            plugin_info: Plugin-specific information dictionary
+            
+        Returns:
+            Tuple of (job info file contents, plugin info file contents)
+        """
+        if 'UserName' not in job_info:
+            job_info['UserName'] = _current_user()
+        
+        return _format_info_file(job_info), _format_info_file(plugin_info)
+    
+    def _command_args(self, *args: str) -> List[str]:
+        """Build a deadlinecommand argument list.
+        
+        Args:
+            *args: Arguments to pass to deadlinecommand
+            
+        Returns:
+            Full argument list including the command itself
+        """
+        return [*_command_prefix(self._command_path), *args]
+    
+    def _run_command(self, args: List[str]) -> Tuple[str, str]:
+        """Run deadlinecommand and return its output.
+        
+        Args:
+            args: Full argument list
+            
+        Returns:
+            Tuple of decoded (standard output, error output)
+        """
+        proc = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            startupinfo=_STARTUPINFO,
+            close_fds=True
+        )
+        output, errors = proc.communicate()
+        
+        # Log the response for debugging with clear formatting
+        output = output.decode()
+        logger.debug("===== COMMAND LINE RESPONSE START =====\n%s\n===== COMMAND LINE RESPONSE END =====", output)
+        return output, errors.decode() if errors else ""
+    
+    def _run_submit_command(self, args: List[str]) -> str:
+        """Run a deadlinecommand submission and return its output.
+        
+        Args:
+            args: Full argument list
+            
+        Returns:
+            Decoded standard output
+            
+        Raises:
+            DeadlineError: If deadlinecommand reports an error
+        """
+        output, errors = self._run_command(args)
+        
+        # Check for errors
+        if errors and "error" in errors.lower():
+            raise DeadlineError(f"Command line error: {errors}")
+        
+        return output
+
+    def _setup_command_line(self) -> None:
+        """Set up command line path for fallback."""
+        self._command_path = _find_deadline_command(self._command_path)
 
 # Global connection instance - but don't initialize it yet
-_connection = None
+_connection: Optional[DeadlineConnection] = None
+_connection_lock = threading.Lock()
 
 def get_connection() -> DeadlineConnection:
-    """Get the global connection instance, creating it if needed."""
+    """Get the global connection instance, creating it if needed.
+    
+    The instance is created at most once, even when several threads ask for
+    it at the same time. Once created it is returned without taking the lock.
+    """
     global _connection
     if _connection is None:
-        _connection = DeadlineConnection()
-    return _connection 
\ No newline at end of file
+        with _connection_lock:
+            if _connection is None:
+                _connection = DeadlineConnection()
+    return _connection
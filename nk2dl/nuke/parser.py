@@ -16,6 +16,8 @@ from ..common.errors import ParserError
 class NukeKnob:
     """Class representing a Nuke knob."""
     
+    __slots__ = ('name', '_value')
+    
     def __init__(self, name: str, value: Any):
         self.name = name
         self._value = value
@@ -36,6 +38,8 @@ class NukeKnob:
 class GSVKnob(NukeKnob):
     """Class representing a Graph Scope Variables knob."""
     
+    __slots__ = ('values',)
+    
     def __init__(self, name: str, values: Dict[str, Any]):
         super().__init__(name, values)
         self.values = values
@@ -56,6 +60,8 @@ class GSVKnob(NukeKnob):
 class NukeNode:
     """Class representing a node in a Nuke script."""
     
+    __slots__ = ('node_name', 'node_type', '_knobs')
+    
     def __init__(self, name: str, node_type: str):
         self.node_name = name
         self.node_type = node_type
@@ -75,9 +81,10 @@ class NukeNode:
         
     def __getitem__(self, key):
         """Get a knob by name."""
-        if key in self._knobs:
+        try:
             return self._knobs[key]
-        raise KeyError(f"Knob '{key}' not found in node '{self.node_name}'")
+        except KeyError:
+            raise KeyError(f"Knob '{key}' not found in node '{self.node_name}'") from None
     
     def firstFrame(self) -> int:
         """Get the first frame of the node's input.
@@ -99,6 +106,8 @@ class NukeNode:
 class RootNode(NukeNode):
     """Class representing the root node of a Nuke script."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("root", "Root")
         # Add default knobs
@@ -111,6 +120,8 @@ class RootNode(NukeNode):
 class WriteNode(NukeNode):
     """Class representing a Write node in a Nuke script."""
     
+    __slots__ = ()
+    
     def __init__(self, name: str):
         super().__init__(name, "Write")
         # Add default knobs
@@ -190,7 +201,8 @@ class NukeParser:
             List of nodes
         """
         if node_type:
-            return [node for node in self.nodes.values() if node.Class() == node_type]
+            # Compare the slot directly rather than calling Class() for every node
+            return [node for node in self.nodes.values() if node.node_type == node_type]
         return list(self.nodes.values())
         
 
@@ -5,20 +5,97 @@ This module provides functionality for submitting Nuke scripts to Deadline rende
 
 import os
 import json
+import logging
+import inspect
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union, Tuple
 import re
 import itertools
 import shutil
 import datetime
+import functools
+import threading
+import time
 
 from ..common.config import config
 from ..common.errors import SubmissionError
 from ..common.logging import logger
 from ..common.framerange import FrameRange
-from ..deadline.connection import get_connection
+from ..deadline.connection import DeadlineConnection, get_connection
 from . import utils as nuke_utils
 
+# Frame range forms that decide how each write node's frames are chosen
+_INPUT_FRAME_RANGE_RE = re.compile(r'\b(i|input)\b')
+_NUMERIC_FRAME_RANGE_RE = re.compile(r'^\d+\-\d+$')
+_TOKEN_FRAME_RANGE_RE = re.compile(r'^(?:[fm]\-[lm]|first\-last|first\-middle|middle\-last)$')
+
+# Guards the process-wide Nuke session, which can only hold one open script at a time
+_script_session_lock = threading.Lock()
+
+# How long a script found on disk is trusted before it is checked again, in seconds
+_SCRIPT_EXISTS_TTL = 30.0
+# Script path -> time (monotonic) until which it is known to exist
+_script_exists_cache: Dict[str, float] = {}
+
+def _script_exists(script_path: Path) -> bool:
+    """Check that a script file exists, reusing recent positive results.
+    
+    Scripts usually live on shared storage, so bulk submissions of the same
+    script stat it once rather than once per submission. Missing scripts are
+    never cached, so a script saved after a failed check is picked up at once.
+    
+    Args:
+        script_path: Path to the Nuke script
+        
+    Returns:
+        True if the script is an existing file
+    """
+    key = str(script_path)
+    now = time.monotonic()
+    if _script_exists_cache.get(key, 0.0) > now:
+        return True
+    
+    if not os.path.isfile(key):
+        _script_exists_cache.pop(key, None)
+        return False
+    
+    _script_exists_cache[key] = now + _SCRIPT_EXISTS_TTL
+    return True
+
+# Token aliases accepted in job name, comment and ExtraInfo templates, by token type,
+# in the order they are replaced
+_TEMPLATE_TOKENS = {
+    'script_stem': ("{ss}", "{nss}", "{nks}", "{sstem}", "{nstem}", "{nkstem}", "{scriptstem}", "{script_stem}", "{nukescriptstem}", "{nukescript_stem}", "{nuke_script_stem}"),
+    'script_name': ("{s}", "{ns}", "{nk}", "{script}", "{scriptname}", "{script_name}", "{nukescript}", "{nuke_script}"),
+    'file_stem': ("{fs}", "{fns}", "{os}", "{fstem}", "{ostem}", "{filestem}", "{file_stem}", "{filenamestem}", "{filename_stem}", "{outputstem}", "{output_stem}"),
+    'batch_name': ("{b}", "{bn}", "{batch}", "{batchname}", "{batch_name}"),
+    'frame_range': ("{x}", "{f}", "{fr}", "{range}", "{framerange}"),
+    'write_node': ("{w}", "{wn}", "{write}", "{writenode}", "{write_node}", "{write_name}"),
+    'output': ("{o}", "{fn}", "{file}", "{filename}", "{file_name}", "{output}"),
+    'render_order': ("{r}", "{ro}", "{renderorder}", "{render_order}"),
+    'gsv': ("{g}", "{gsv}", "{gsvs}", "{GSVs}", "{graphscopevars}", "{graphscopevariables}", "{graph_scope_vars}", "{graph_scope_variables}"),
+}
+
+@functools.lru_cache(maxsize=256)
+def _template_tokens(template: str) -> Tuple[Tuple[str, str], ...]:
+    """Get the tokens used in a template, looked up once per template.
+    
+    Templates repeat for every write node of a submission, so the token scan
+    is only done for the first one.
+    
+    Args:
+        template: Template string with tokens
+        
+    Returns:
+        Tuple of (token, token type) pairs in replacement order
+    """
+    return tuple(
+        (token, token_type)
+        for token_type, tokens in _TEMPLATE_TOKENS.items()
+        for token in tokens
+        if token in template
+    )
+
 class NukeSubmission:
     """Handles submission of Nuke scripts to Deadline."""
 
@@ -74,7 +151,10 @@ class NukeSubmission:
                 use_nodes_frame_list: bool = False,
                 
                 # Graph Scope Variables parameters (Nuke 15.2+)
-                graph_scope_variables: Optional[Union[List[str], List[List[str]]]] = None):
+                graph_scope_variables: Optional[Union[List[str], List[List[str]]]] = None,
+                
+                # Deadline connection
+                connection: Optional[DeadlineConnection] = None):
         
         """Initialize a Nuke script submission.
         
@@ -164,9 +244,18 @@ class NukeSubmission:
                                      
                                   If no values are provided for a key (e.g., "key:" or just "key"), 
                                   all available values for that key will be used.
+            
+            # Deadline connection
+            connection: Deadline connection to submit through (defaults to the global connection)
         """
 
         self._script_will_close = False
+        self._connection = connection
+        # Write nodes, node lookups and render orders of the open script
+        self._clear_script_caches()
+        # Job and plugin settings shared by every job of a submission
+        self._job_info_template = None
+        self._plugin_info_template = None
 
         # If render_order_dependencies is True, implicitly set write_nodes_as_separate_jobs to True as well
         if render_order_dependencies:
@@ -179,7 +268,7 @@ class NukeSubmission:
         # Check if write_nodes_as_tasks is enabled with a custom frame range but use_nodes_frame_list is disabled
         if write_nodes_as_tasks and frame_range and not use_nodes_frame_list and not (
             frame_range.lower() in ['f-l', 'first-last', 'f', 'm', 'l', 'first', 'middle', 'last', 'i', 'input'] or
-            re.match(r'^\d+\-\d+$', frame_range)  # Allow numeric frame ranges like "1001-1100"
+            _NUMERIC_FRAME_RANGE_RE.match(frame_range)  # Allow numeric frame ranges like "1001-1100"
         ):
             raise SubmissionError("Custom frame list is not supported when submitting write nodes as separate tasks. "
                                  "Please use global (f-l) or input (i) frame ranges, or enable use_nodes_frame_list.")
@@ -189,7 +278,7 @@ class NukeSubmission:
         self.script_path_same_as_current_nuke_session = script_path_same_as_current_nuke_session
 
         self.script_path = Path(script_path)
-        if not self.script_path.exists():
+        if not _script_exists(self.script_path):
             raise SubmissionError(f"Nuke script does not exist: {script_path}")
             
         self.frame_range = frame_range
@@ -243,6 +332,8 @@ class NukeSubmission:
         self.render_mode = render_mode if render_mode else config.get('submission.render_mode', 'full')
         self.render_order_dependencies = render_order_dependencies if isinstance(render_order_dependencies, bool) else config.get('submission.render_order_dependencies', False)
         self.job_dependencies = job_dependencies
+        # User-specified dependency IDs, parsed once (can be comma or space separated)
+        self.job_dependency_ids = [dep_id for dep_id in re.split(r'[,\s]+', job_dependencies) if dep_id] if job_dependencies else []
         self.write_nodes_as_tasks = write_nodes_as_tasks if isinstance(write_nodes_as_tasks, bool) else config.get('submission.write_nodes_as_tasks', False)
         self.write_nodes_as_separate_jobs = write_nodes_as_separate_jobs if isinstance(write_nodes_as_separate_jobs, bool) else config.get('submission.write_nodes_as_separate_jobs', False)
         self.submit_alphabetically = submit_alphabetically if isinstance(submit_alphabetically, bool) else config.get('submission.submit_alphabetically', False)
@@ -267,11 +358,7 @@ class NukeSubmission:
         if self.graph_scope_variables:
             # Check Nuke version for GSV support (requires 15.2+)
             nuke_version_str = nuke_utils.nuke_version(self.nuke_version) if self.nuke_version else nuke_utils.nuke_version()
-            try:
-                major, minor = map(int, nuke_version_str.split('.')[:2])
-                supports_gsv = (major > 15) or (major == 15 and minor >= 2)
-            except ValueError:
-                supports_gsv = False
+            supports_gsv = nuke_utils.supports_gsv(nuke_version_str)
                 
             if not supports_gsv:
                 logger.warning(f"Graph Scope Variables (GSV) were specified but are not supported in Nuke {nuke_version_str}. "
@@ -288,7 +375,7 @@ class NukeSubmission:
                 
                 try:
                     # Only substitute tokens if it's not "i" or "input"
-                    if not re.search(r'\b(i|input)\b', frame_range):
+                    if not _INPUT_FRAME_RANGE_RE.search(frame_range):
                         self._get_frame_range_from_nuke()
                     else:
                         # For input token, we need to specify the write node
@@ -341,6 +428,7 @@ class NukeSubmission:
             if not self.script_path_same_as_current_nuke_session:
                 # Open the script
                 nuke.scriptOpen(str(self.script_path.absolute()))
+                self._clear_script_caches()
                 # Mark as same as current session now
                 self.script_path_same_as_current_nuke_session = True
                 # Track that we opened a script
@@ -355,6 +443,7 @@ class NukeSubmission:
             if not self.script_path_same_as_current_nuke_session:
                 # Open the script
                 nuke.scriptOpen(str(self.script_path.absolute()))
+                self._clear_script_caches()
                 # Mark as same as current session now
                 self.script_path_same_as_current_nuke_session = True
                 # Track that we opened a script
@@ -362,6 +451,131 @@ class NukeSubmission:
             
             return nuke
 
+    def _clear_script_caches(self) -> None:
+        """Forget everything cached about the open script."""
+        self._all_write_nodes = None
+        self._node_names = {}
+        self._node_cache = {}
+        self._write_node_cache = {}
+        self._render_order_cache = {}
+
+    def _get_all_write_nodes(self) -> List[Any]:
+        """Get all Write nodes in the script.
+        
+        The node graph is only walked once per opened script; later calls reuse
+        the same list. Node names are looked up at the same time.
+        
+        Returns:
+            List of Write nodes
+        """
+        nuke = self._ensure_script_can_be_parsed()
+        if self._all_write_nodes is None:
+            self._all_write_nodes = nuke.allNodes('Write')
+            for node in self._all_write_nodes:
+                name = self._node_names[id(node)] = node.name()
+                self._write_node_cache[name] = node
+        return self._all_write_nodes
+
+    def _get_node_name(self, node) -> str:
+        """Get a node's name, asking Nuke only for nodes not seen before.
+        
+        Args:
+            node: The Nuke node
+            
+        Returns:
+            The node's name
+        """
+        name = self._node_names.get(id(node))
+        if name is None:
+            name = self._node_names[id(node)] = node.name()
+        return name
+
+    def _get_node(self, name: str) -> Any:
+        """Get a node by name, looking each name up in Nuke only once per opened script.
+        
+        Args:
+            name: Node name (or full path for nodes inside groups)
+            
+        Returns:
+            The node, or None if it doesn't exist
+        """
+        nuke = self._ensure_script_can_be_parsed()
+        if name not in self._node_cache:
+            self._node_cache[name] = nuke.toNode(name)
+        return self._node_cache[name]
+
+    def _get_write_node(self, name: str) -> Any:
+        """Get a Write node by name.
+        
+        Write nodes returned by the class-filtered allNodes('Write') query are
+        known without asking Nuke for their Class(); other names are checked once
+        per opened script.
+        
+        Args:
+            name: Node name (or full path for nodes inside groups)
+            
+        Returns:
+            The Write node, or None if there is no Write node with that name
+        """
+        if name not in self._write_node_cache:
+            node = self._get_node(name)
+            self._write_node_cache[name] = node if node and node.Class() == "Write" else None
+        return self._write_node_cache[name]
+
+    def _get_render_order(self, node, gsv_combination=None) -> int:
+        """Get a write node's render order, defaulting to 0.
+        
+        Values are cached per node and GSV combination, since the same nodes are
+        sorted, grouped and named repeatedly during a submission.
+        
+        Args:
+            node: The Nuke write node
+            gsv_combination: Optional tuple of (key, value) pairs for GSV currently applied
+            
+        Returns:
+            The node's render order
+        """
+        key = (self._get_node_name(node), gsv_combination)
+        render_order = self._render_order_cache.get(key)
+        if render_order is None:
+            knob = node.knobs().get('render_order')
+            render_order = int(knob.value()) if knob is not None else 0
+            self._render_order_cache[key] = render_order
+        return render_order
+
+    def _cache_render_orders(self, nodes: List[Any], gsv_combination=None) -> None:
+        """Read the render orders of many write nodes with a single TCL call.
+        
+        Fills the render order cache used by _get_render_order. If the bulk read
+        isn't available (e.g. with the script parser) or fails, nothing is cached
+        and render orders are read per node instead.
+        
+        Args:
+            nodes: Write nodes to read
+            gsv_combination: Optional tuple of (key, value) pairs for GSV currently applied
+        """
+        names = [
+            name for name in map(self._get_node_name, nodes)
+            if (name, gsv_combination) not in self._render_order_cache
+        ]
+        if len(names) < 2:
+            return
+        
+        nuke = self._ensure_script_can_be_parsed()
+        try:
+            result = nuke.tcl("list " + " ".join(f"[value {{{name}.render_order}}]" for name in names))
+            values = [int(float(value)) for value in result.split()]
+        except Exception as e:
+            logger.debug(f"Bulk render order read failed, reading per node: {e}")
+            return
+        
+        if len(values) != len(names):
+            logger.debug(f"Bulk render order read returned {len(values)} values for {len(names)} nodes, reading per node")
+            return
+        
+        for name, render_order in zip(names, values):
+            self._render_order_cache[(name, gsv_combination)] = render_order
+
     def _get_node_pretty_path(self, node, gsv_combination=None) -> str:
         """Get a node's file path while preserving frame number placeholders.
         
@@ -410,11 +624,7 @@ class NukeSubmission:
 
             # Check Nuke version before attempting to use GSV
             nuke_version_str = nuke_utils.nuke_version(self.nuke_version) if self.nuke_version else nuke_utils.nuke_version()
-            try:
-                major, minor = map(int, nuke_version_str.split('.')[:2])
-                supports_gsv = (major > 15) or (major == 15 and minor >= 2)
-            except ValueError:
-                supports_gsv = False
+            supports_gsv = nuke_utils.supports_gsv(nuke_version_str)
             
             if supports_gsv:
                 # Ensure the script is open
@@ -433,106 +643,70 @@ class NukeSubmission:
         # Start with the template
         result = template
         
-        # Define token groups
-        script_stem_tokens = ["{ss}", "{nss}", "{nks}", "{sstem}", "{nstem}", "{nkstem}", "{scriptstem}", "{script_stem}", "{nukescriptstem}", "{nukescript_stem}", "{nuke_script_stem}"]
-        script_name_tokens = ["{s}", "{ns}", "{nk}", "{script}", "{scriptname}", "{script_name}", "{nukescript}", "{nuke_script}"]
-        file_stem_tokens = ["{fs}", "{fns}", "{os}", "{fstem}", "{ostem}", "{filestem}", "{file_stem}", "{filenamestem}", "{filename_stem}", "{outputstem}", "{output_stem}"]
-        batch_name_tokens = ["{b}", "{bn}", "{batch}", "{batchname}", "{batch_name}"]
-        write_node_tokens = ["{w}", "{wn}", "{write}", "{writenode}", "{write_node}", "{write_name}"]
-        output_tokens = ["{o}", "{fn}", "{file}", "{filename}", "{file_name}", "{output}"]
-        render_order_tokens = ["{r}", "{ro}", "{renderorder}", "{render_order}"]
-        frame_range_tokens = ["{x}", "{f}", "{fr}", "{range}", "{framerange}"]
-        gsv_tokens = ["{g}", "{gsv}", "{gsvs}", "{GSVs}", "{graphscopevars}", "{graphscopevariables}", "{graph_scope_vars}", "{graph_scope_variables}"]
-        
-        # Include all token groups
-        allowed_token_groups = [
-            script_stem_tokens,
-            script_name_tokens,
-            file_stem_tokens,
-            batch_name_tokens,
-            frame_range_tokens,
-            write_node_tokens,
-            output_tokens,
-            render_order_tokens,
-            gsv_tokens
-        ]
+        # The output file name is shared by the file stem and output tokens, so it's only looked up once
+        output_filename = None
         
         # Replace tokens with their values
-        for token_group in allowed_token_groups:
-            for token in token_group:
-                # Skip token replacement if it's not in the template
-                if token not in result:
-                    continue
-                
-                # Initialize value to empty string as a fallback
-                value = ""
-                
-                # Get the value for each token type
-                if token in script_stem_tokens:
-                    value = self.script_stem
-                elif token in script_name_tokens:
-                    value = self.script_filename
-                elif token in file_stem_tokens:
-                    # File stem tokens require a write node to get output path
-                    if write_node:
-                        # Ensure the script is open
-                        nuke = self._ensure_script_can_be_parsed()
-
-                        node = nuke.toNode(write_node)
-                        if node and node.Class() == "Write":
-                            try:
-                                output_file = self._get_node_pretty_path(node, gsv_combination)
-                                # Extract stem from the output path
-                                output_stem = os.path.splitext(os.path.basename(output_file))[0]
-                                value = output_stem
-                            except:
-                                logger.warning(f"Failed to get output filename stem for write node {write_node}")
-                                value = self.script_stem  # Fallback to script stem
-                        else:
+        for token, token_type in _template_tokens(template):
+            # Initialize value to empty string as a fallback
+            value = ""
+            
+            # Get the value for each token type
+            if token_type == 'script_stem':
+                value = self.script_stem
+            elif token_type == 'script_name':
+                value = self.script_filename
+            elif token_type == 'file_stem':
+                # File stem tokens require a write node to get output path
+                if write_node:
+                    node = self._get_write_node(write_node)
+                    if node:
+                        try:
+                            if output_filename is None:
+                                output_filename = os.path.basename(self._get_node_pretty_path(node, gsv_combination))
+                            # Extract stem from the output path
+                            value = os.path.splitext(output_filename)[0]
+                        except Exception:
+                            logger.warning(f"Failed to get output filename stem for write node {write_node}")
                             value = self.script_stem  # Fallback to script stem
                     else:
                         value = self.script_stem  # Fallback to script stem
-                elif token in batch_name_tokens:
-                    value = self.batch_name
-                elif token in frame_range_tokens:
-                    value = self.frame_range
-                elif token in gsv_tokens:
-                    # Check Nuke version before attempting to use GSV tokens
-                    nuke_version_str = nuke_utils.nuke_version(self.nuke_version) if self.nuke_version else nuke_utils.nuke_version()
-                    try:
-                        major, minor = map(int, nuke_version_str.split('.')[:2])
-                        supports_gsv = (major > 15) or (major == 15 and minor >= 2)
-                    except ValueError:
-                        supports_gsv = False
-                    
-                    if supports_gsv and gsv_combination:
-                        # Format as key1=value1,key2=value2
-                        value = ",".join([f"{key}={val}" for key, val in gsv_combination])
-                    else:
-                        value = ""  # Empty string if no GSV combination or not supported
-                elif write_node and token in write_node_tokens + output_tokens + render_order_tokens:
-                    # Ensure the script is open
-                    nuke = self._ensure_script_can_be_parsed()
-
-                    node = nuke.toNode(write_node)
-                    if node and node.Class() == "Write":
-                        if token in write_node_tokens:
-                            value = write_node
-                        elif token in render_order_tokens:
-                            value = "0"  # Default value
-                            if 'render_order' in node.knobs():
-                                value = str(int(node['render_order'].value()))
-                        elif token in output_tokens:
-                            # Try to get output filename
-                            try:
-                                output_file = self._get_node_pretty_path(node, gsv_combination)
-                                value = os.path.basename(output_file)
-                            except:
-                                logger.warning(f"Failed to get output filename for write node {write_node}")
-                                value = ""
+                else:
+                    value = self.script_stem  # Fallback to script stem
+            elif token_type == 'batch_name':
+                value = self.batch_name
+            elif token_type == 'frame_range':
+                value = self.frame_range
+            elif token_type == 'gsv':
+                # Check Nuke version before attempting to use GSV tokens
+                nuke_version_str = nuke_utils.nuke_version(self.nuke_version) if self.nuke_version else nuke_utils.nuke_version()
+                supports_gsv = nuke_utils.supports_gsv(nuke_version_str)
                 
-                # Replace the token with its value
-                result = result.replace(token, value)
+                if supports_gsv and gsv_combination:
+                    # Format as key1=value1,key2=value2
+                    value = ",".join([f"{key}={val}" for key, val in gsv_combination])
+                else:
+                    value = ""  # Empty string if no GSV combination or not supported
+            elif write_node:
+                # Write node, output and render order tokens
+                node = self._get_write_node(write_node)
+                if node:
+                    if token_type == 'write_node':
+                        value = write_node
+                    elif token_type == 'render_order':
+                        value = str(self._get_render_order(node, gsv_combination))
+                    elif token_type == 'output':
+                        # Try to get output filename
+                        try:
+                            if output_filename is None:
+                                output_filename = os.path.basename(self._get_node_pretty_path(node, gsv_combination))
+                            value = output_filename
+                        except Exception:
+                            logger.warning(f"Failed to get output filename for write node {write_node}")
+                            value = ""
+            
+            # Replace the token with its value
+            result = result.replace(token, value)
         
         return result
 
@@ -681,11 +855,7 @@ class NukeSubmission:
         try:
             # Check Nuke version for GSV support (requires 15.2+)
             nuke_version_str = nuke_utils.nuke_version(self.nuke_version) if self.nuke_version else nuke_utils.nuke_version()
-            try:
-                major, minor = map(int, nuke_version_str.split('.')[:2])
-                supports_gsv = (major > 15) or (major == 15 and minor >= 2)
-            except ValueError:
-                supports_gsv = False
+            supports_gsv = nuke_utils.supports_gsv(nuke_version_str)
                 
             if not supports_gsv:
                 logger.warning(f"Graph Scope Variables (GSV) are not supported in Nuke {nuke_version_str}. Requires Nuke 15.2 or higher.")
@@ -844,34 +1014,30 @@ class NukeSubmission:
         Returns:
             True if the node is outputting a movie format, False otherwise
         """
-        nuke = self._ensure_script_can_be_parsed()
-        node = nuke.toNode(write_node)
+        node = self._get_write_node(write_node)
         
-        if node and node.Class() == "Write" and 'file_type' in node.knobs():
+        if node and 'file_type' in node.knobs():
             file_type = node['file_type'].value()
             movie_formats = ['mov', 'mxf']
             return file_type.lower() in movie_formats
             
         return False
 
-    def _prepare_job_info(self, gsv_combination=None) -> Dict[str, Any]:
-        """Prepare job information for Deadline submission.
+    def _get_job_info_template(self) -> Dict[str, Any]:
+        """Get the job info settings shared by every job of this submission.
+        
+        The template is built once per submission; callers copy it before
+        adding per-job values such as the name, comment and output paths.
         
-        Args:
-            gsv_combination: Optional tuple of (key, value) pairs for GSV
-            
         Returns:
-            Dictionary containing job information
+            Dictionary containing the shared job information
         """
-        # Process job_name with tokens if it's for a specific write node
-        if self.write_nodes and len(self.write_nodes) == 1:
-            self.job_name = self._replace_job_name_tokens(self.job_name_template, self.write_nodes[0], gsv_combination)
-        else:
-            self.job_name = self._replace_job_name_tokens(self.job_name_template, None, gsv_combination)
+        if self._job_info_template is not None:
+            return self._job_info_template
         
         # Create base job info dictionary
         job_info = {
-            "Name": self.job_name,
+            "Name": "",
             "Plugin": "Nuke",
             "Frames": self.frame_range,
             "ChunkSize": self.chunk_size,
@@ -889,6 +1055,53 @@ class NukeSubmission:
             job_info["BatchName"] = self.batch_name
         if self.department:
             job_info["Department"] = self.department
+            
+        # If using write nodes as tasks, set special frame range
+        if self.write_nodes_as_tasks and self.write_nodes:
+            # When using write nodes as tasks, frames should be 0 to (number of write nodes - 1)
+            job_info["Frames"] = f"0-{len(self.write_nodes) - 1}"
+            
+            # Set chunk size to 1 to ensure each task processes one write node
+            job_info["ChunkSize"] = 1
+        
+        # Add user-specified job dependencies if any, with proper indexing
+        job_info.update((f"JobDependency{i}", dep_id) for i, dep_id in enumerate(self.job_dependency_ids))
+        
+        # Log a warning if submit_script_as_auxiliary_file is False
+        if not self.submit_script_as_auxiliary_file:
+            logger.warning("submit_script_as_auxiliary_file is False. Deadline will still copy the Nuke script to the worker as an auxiliary file if path mapping is enabled in the Nuke plugin under the Deadline repository plugin settings.")
+        
+        # Add the script as an auxiliary file if requested
+        if self.submit_script_as_auxiliary_file:
+            # Determine which script path to use
+            script_file_path = str(self.script_path.absolute())
+            if self.submit_copied_script and self.copied_script_paths:
+                script_file_path = self.copied_script_paths[0]
+            
+            job_info["AuxiliaryFiles"] = script_file_path
+        
+        self._job_info_template = job_info
+        return job_info
+        
+    def _prepare_job_info(self, gsv_combination=None) -> Dict[str, Any]:
+        """Prepare job information for Deadline submission.
+        
+        Args:
+            gsv_combination: Optional tuple of (key, value) pairs for GSV
+            
+        Returns:
+            Dictionary containing job information
+        """
+        # Process job_name with tokens if it's for a specific write node
+        if self.write_nodes and len(self.write_nodes) == 1:
+            self.job_name = self._replace_job_name_tokens(self.job_name_template, self.write_nodes[0], gsv_combination)
+        else:
+            self.job_name = self._replace_job_name_tokens(self.job_name_template, None, gsv_combination)
+        
+        # Start from the settings shared by every job of this submission
+        job_info = dict(self._get_job_info_template())
+        job_info["Name"] = self.job_name
+        
         if self.comment:
             # Process comment tokens if it contains any
             if any(token in self.comment for token in ["{", "}"]):
@@ -914,38 +1127,7 @@ class NukeSubmission:
                         job_info[f"ExtraInfo{i}"] = self._replace_extrainfo_tokens(extra_info_item, None, gsv_combination)
                 else:
                     job_info[f"ExtraInfo{i}"] = extra_info_item
-            
-        # If using write nodes as tasks, set special frame range
-        if self.write_nodes_as_tasks and self.write_nodes:
-            # When using write nodes as tasks, frames should be 0 to (number of write nodes - 1)
-            job_info["Frames"] = f"0-{len(self.write_nodes) - 1}"
-            
-            # Set chunk size to 1 to ensure each task processes one write node
-            job_info["ChunkSize"] = 1
-        
-        # Add user-specified job dependencies if any
-        if self.job_dependencies:
-            # Parse dependencies (can be comma or space separated)
-            dep_list = re.split(r'[,\s]+', self.job_dependencies.strip())
-            
-            # Add each dependency with proper indexing
-            for i, dep_id in enumerate(dep_list):
-                if dep_id:  # Skip empty strings
-                    job_info[f"JobDependency{i}"] = dep_id
-        
-        # Log a warning if submit_script_as_auxiliary_file is False
-        if not self.submit_script_as_auxiliary_file:
-            logger.warning("submit_script_as_auxiliary_file is False. Deadline will still copy the Nuke script to the worker as an auxiliary file if path mapping is enabled in the Nuke plugin under the Deadline repository plugin settings.")
-        
-        # Add the script as an auxiliary file if requested
-        if self.submit_script_as_auxiliary_file:
-            # Determine which script path to use
-            script_file_path = str(self.script_path.absolute())
-            if self.submit_copied_script and self.copied_script_paths:
-                script_file_path = self.copied_script_paths[0]
-            
-            job_info["AuxiliaryFiles"] = script_file_path
-        
+
         return job_info
         
     def _add_output_filenames_to_job_info(self, job_info: Dict[str, Any], gsv_combination=None) -> None:
@@ -963,8 +1145,8 @@ class NukeSubmission:
         if self.write_nodes_as_tasks and self.write_nodes:
             # For write nodes as tasks: add all specified write nodes
             for i, write_node_name in enumerate(self.write_nodes):
-                node = nuke.toNode(write_node_name)
-                if node and node.Class() == "Write" and not node['disable'].value():
+                node = self._get_write_node(write_node_name)
+                if node and not node['disable'].value():
                     output_path = self._get_node_pretty_path(node, gsv_combination)
                     if output_path:
                         job_info[f"OutputFilename{i}"] = output_path
@@ -972,8 +1154,8 @@ class NukeSubmission:
         elif self.write_nodes and len(self.write_nodes) == 1:
             # For a single write node: add just that one
             write_node_name = self.write_nodes[0]
-            node = nuke.toNode(write_node_name)
-            if node and node.Class() == "Write" and not node['disable'].value():
+            node = self._get_write_node(write_node_name)
+            if node and not node['disable'].value():
                 output_path = self._get_node_pretty_path(node, gsv_combination)
                 if output_path:
                     job_info["OutputFilename0"] = output_path
@@ -981,7 +1163,7 @@ class NukeSubmission:
         elif not self.write_nodes:
             # If no write node specified: find all enabled write nodes
             write_nodes = []
-            for node in nuke.allNodes('Write'):
+            for node in self._get_all_write_nodes():
                 if not node['disable'].value():
                     write_nodes.append(node)
             
@@ -994,15 +1176,18 @@ class NukeSubmission:
         # If using dependencies, don't add OutputFilename entries as they'll be set per job
         # They are added in the submit method when handling each write node
         
-    def _prepare_plugin_info(self, gsv_combination=None) -> Dict[str, Any]:
-        """Prepare plugin information for Deadline submission.
+    def _get_plugin_info_template(self) -> Dict[str, Any]:
+        """Get the plugin info settings shared by every job of this submission.
+        
+        The template is built once per submission; callers copy it before
+        adding per-job values such as write nodes and GSVs.
         
-        Args:
-            gsv_combination: Optional tuple of (key, value) pairs for GSV
-            
         Returns:
-            Dictionary containing plugin information
+            Dictionary containing the shared plugin information
         """
+        if self._plugin_info_template is not None:
+            return self._plugin_info_template
+        
         # Determine which script path to use
         script_file_path = str(self.script_path.absolute())
         if self.submit_copied_script and self.copied_script_paths:
@@ -1049,6 +1234,21 @@ class NukeSubmission:
         if self.use_proxy:
             plugin_info["UseProxy"] = "1"
         
+        self._plugin_info_template = plugin_info
+        return plugin_info
+    
+    def _prepare_plugin_info(self, gsv_combination=None) -> Dict[str, Any]:
+        """Prepare plugin information for Deadline submission.
+        
+        Args:
+            gsv_combination: Optional tuple of (key, value) pairs for GSV
+            
+        Returns:
+            Dictionary containing plugin information
+        """
+        # Start from the settings shared by every job of this submission
+        plugin_info = dict(self._get_plugin_info_template())
+        
         # Handle write nodes differently based on submission mode
         if self.write_nodes_as_tasks and self.write_nodes:
             # For write_nodes_as_tasks: Add individual write nodes with frame ranges
@@ -1062,7 +1262,7 @@ class NukeSubmission:
             explicit_frame_range = (self.frame_range and 
                                   not self.fr.has_tokens and 
                                   not self.use_nodes_frame_list and 
-                                  re.match(r'^\d+\-\d+$', self.frame_range))
+                                  _NUMERIC_FRAME_RANGE_RE.match(self.frame_range))
             
             if explicit_frame_range:
                 # Parse explicit frame range
@@ -1103,6 +1303,85 @@ class NukeSubmission:
         
         return plugin_info
     
+    def _prepare_write_node_job(self, job_info: Dict[str, Any], plugin_info: Dict[str, Any], write_node: str,
+                                write_node_frames: Dict[str, Tuple[int, int]],
+                                gsv_combination=None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Prepare the job and plugin info for rendering a single write node as its own job.
+        
+        Args:
+            job_info: Job info shared by all write nodes
+            plugin_info: Plugin info shared by all write nodes
+            write_node: Name of the write node to render
+            write_node_frames: Mapping of write node names to (start, end) frames to render
+            gsv_combination: Optional tuple of (key, value) pairs for GSV to apply
+            
+        Returns:
+            Tuple of (job_info, plugin_info) for this write node
+        """
+        # Clone job info for this write node
+        node_job_info = job_info.copy()
+        node_plugin_info = plugin_info.copy()
+        
+        # Check if this is a movie format and set BatchModeIsMovie if needed
+        # Skip for write_nodes_as_tasks as mentioned in the requirements
+        if not self.write_nodes_as_tasks and self._is_movie_format(write_node):
+            node_plugin_info["BatchModeIsMovie"] = "True"
+            # Set a very large chunk size to ensure entire movie renders on one machine
+            node_job_info["ChunkSize"] = "1000000"
+        
+        # Update job name to include write node
+        if gsv_combination:
+            node_job_info["Name"] = self._get_gsv_job_name(gsv_combination, write_node)
+        else:
+            node_job_info["Name"] = self._replace_job_name_tokens(self.job_name_template, write_node)
+        
+        # Update comment with tokens for this write node
+        if "Comment" in node_job_info and any(token in node_job_info["Comment"] for token in ["{", "}"]):
+            node_job_info["Comment"] = self._replace_comment_tokens(self.comment, write_node, gsv_combination)
+        
+        # Update ExtraInfo fields with tokens for this write node
+        for i, extra_info_item in enumerate(self.extra_info):
+            extra_info_key = f"ExtraInfo{i}"
+            if extra_info_key in node_job_info and any(token in extra_info_item for token in ["{", "}"]):
+                node_job_info[extra_info_key] = self._replace_extrainfo_tokens(extra_info_item, write_node, gsv_combination)
+        
+        # Add output filename for this write node
+        node_obj = self._get_write_node(write_node)
+        if node_obj and not node_obj['disable'].value():
+            output_path = self._get_node_pretty_path(node_obj, gsv_combination)
+            if output_path:
+                node_job_info["OutputFilename0"] = output_path
+        
+        # Specify which write node to render
+        # For write_nodes_as_separate_jobs: Format is WriteNode=Write1 (single write node per job)
+        node_plugin_info["WriteNode"] = write_node
+        
+        # Override frame range if use_nodes_frame_list is enabled and frame range is available
+        if write_node in write_node_frames:
+            start_frame, end_frame = write_node_frames[write_node]
+            node_job_info["Frames"] = f"{start_frame}-{end_frame}"
+        
+        return node_job_info, node_plugin_info
+
+    @staticmethod
+    def _record_job_results(jobs_by_render_order: Dict[int, List[str]], failures: List[str],
+                            submitted: List[Tuple[str, int]], results: List[Union[str, Exception]]) -> None:
+        """Track the IDs of submitted jobs by render order and log the jobs that failed.
+        
+        Args:
+            jobs_by_render_order: Job IDs by render order, updated in place
+            failures: Descriptions of the jobs that failed, updated in place
+            submitted: List of (description, render order) for each job, in submission order
+            results: Job ID or error for each job, as returned by DeadlineConnection.submit_jobs
+        """
+        for (description, render_order), result in zip(submitted, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to submit job for {description}: {result}")
+                failures.append(f"{description}: {result}")
+            else:
+                jobs_by_render_order.setdefault(render_order, []).append(result)
+                logger.info(f"Successfully submitted job for {description}. Job ID: {result}")
+
     def _get_write_node_frame_ranges(self, gsv_combination=None) -> List[Tuple[str, int, int]]:
         """Get frame ranges for each write node using Nuke API.
         
@@ -1138,13 +1417,12 @@ class NukeSubmission:
                     except Exception as e:
                         logger.warning(f"Failed to set GSV value {key}={value}: {e}")
         
-        # Get write nodes by render order
-        write_nodes_by_order = self._get_write_nodes_by_render_order(gsv_combination)
-        
-        # Flatten the list of write nodes
-        all_write_nodes = []
-        for render_order in sorted(write_nodes_by_order.keys()):
-            all_write_nodes.extend(write_nodes_by_order[render_order])
+        # Get write nodes in render order, sorted alphabetically within each render order if requested
+        write_nodes_info = self._get_write_nodes_info(gsv_combination)
+        all_write_nodes = [
+            node_name for node_name, _ in
+            self._topological_sort_write_nodes(write_nodes_info, alphabetical=self.submit_alphabetically)
+        ]
         
         logger.debug(f"Processing frame ranges for {len(all_write_nodes)} write nodes: {all_write_nodes}")
         
@@ -1165,11 +1443,11 @@ class NukeSubmission:
         
         if self.frame_range:
             # Check if it's an "input" frame range
-            if re.search(r'\b(i|input)\b', self.frame_range):
+            if _INPUT_FRAME_RANGE_RE.search(self.frame_range):
                 is_input_frame_range = True
                 logger.debug("Using input frame range mode")
             # Check if it's a numeric frame range like "1001-2000"
-            elif re.match(r'^\d+\-\d+$', self.frame_range):
+            elif _NUMERIC_FRAME_RANGE_RE.match(self.frame_range):
                 try:
                     parts = self.frame_range.split('-')
                     default_start = int(parts[0])
@@ -1179,10 +1457,7 @@ class NukeSubmission:
                 except (ValueError, IndexError):
                     logger.warning(f"Invalid numeric frame range: {self.frame_range}, using root frame range")
             # Check if it's a token frame range like "f-l", "first-last", etc.
-            elif (re.match(r'^[fm]\-[lm]$', self.frame_range) or 
-                  re.match(r'^first\-last$', self.frame_range) or 
-                  re.match(r'^first\-middle$', self.frame_range) or 
-                  re.match(r'^middle\-last$', self.frame_range)):
+            elif _TOKEN_FRAME_RANGE_RE.match(self.frame_range):
                 has_explicit_frame_range = True
                 logger.debug(f"Using token-based frame range: {self.frame_range}")
         else:
@@ -1193,8 +1468,8 @@ class NukeSubmission:
         try:
             # For each write node, determine its frame range
             for node_name in all_write_nodes:
-                node = nuke.toNode(node_name)
-                if node and node.Class() == "Write":
+                node = self._get_write_node(node_name)
+                if node:
                     frame_range_source = "unknown"
                     # Case 1: If use_nodes_frame_list is true and the node has use_limit enabled,
                     # use the node's first/last knobs
@@ -1204,7 +1479,7 @@ class NukeSubmission:
                             node_end = int(node['last'].value())
                             frame_range_source = "node use_limit"
                             write_node_info.append((node_name, node_start, node_end))
-                            logger.debug(f"Write node {node_name}: Using frame range from node's use_limit: {node_start}-{node_end}")
+                            logger.debug("Write node %s: Using frame range from node's use_limit: %s-%s", node_name, node_start, node_end)
                             continue
                     
                     # Case 2: If we're using input frame range (explicit or implicit),
@@ -1216,52 +1491,52 @@ class NukeSubmission:
                             node_end = node.lastFrame()
                             frame_range_source = "node input"
                             write_node_info.append((node_name, node_start, node_end))
-                            logger.debug(f"Write node {node_name}: Using frame range from node's input: {node_start}-{node_end}")
+                            logger.debug("Write node %s: Using frame range from node's input: %s-%s", node_name, node_start, node_end)
                             continue
                         except Exception as e:
                             logger.warning(f"Failed to get input frame range for node {node_name}: {e}")
                             # Fall back to root frame range
                             write_node_info.append((node_name, root_first_frame, root_last_frame))
-                            logger.debug(f"Write node {node_name}: Falling back to root frame range: {root_first_frame}-{root_last_frame}")
+                            logger.debug("Write node %s: Falling back to root frame range: %s-%s", node_name, root_first_frame, root_last_frame)
                             continue
                     
                     # Case 3: If we have an explicit frame range from the user, use that
                     elif has_explicit_frame_range:
                         frame_range_source = "explicit user range"
                         write_node_info.append((node_name, default_start, default_end))
-                        logger.debug(f"Write node {node_name}: Using explicit frame range: {default_start}-{default_end}")
+                        logger.debug("Write node %s: Using explicit frame range: %s-%s", node_name, default_start, default_end)
                         continue
                     
                     # Case 4: Fall back to root frame range
                     frame_range_source = "root fallback"
                     write_node_info.append((node_name, root_first_frame, root_last_frame))
-                    logger.debug(f"Write node {node_name}: Using root frame range: {root_first_frame}-{root_last_frame}")
+                    logger.debug("Write node %s: Using root frame range: %s-%s", node_name, root_first_frame, root_last_frame)
             
-            # Summary debug log
-            frame_range_summary = ", ".join([f"{name}: {start}-{end}" for name, start, end in write_node_info])
-            logger.debug(f"Final write node frame ranges: {frame_range_summary}")
+            # Summary debug log, only built when it will be shown
+            if logger.isEnabledFor(logging.DEBUG):
+                frame_range_summary = ", ".join([f"{name}: {start}-{end}" for name, start, end in write_node_info])
+                logger.debug("Final write node frame ranges: %s", frame_range_summary)
             
             return write_node_info
         except Exception as e:
             logger.error(f"Failed to get write node frame ranges: {e}")
             raise SubmissionError(f"Failed to get write node frame ranges: {e}")
     
-    def _get_write_nodes_by_render_order(self, gsv_combination=None) -> Dict[int, List[str]]:
-        """Get write nodes grouped by render order using Nuke API.
+    def _get_write_nodes_info(self, gsv_combination=None) -> List[Tuple[str, int]]:
+        """Get the write nodes to submit with their render orders, in script order.
         
         Args:
             gsv_combination: Optional tuple of (key, value) pairs for GSV to apply
             
         Returns:
-            Dictionary mapping render orders to lists of write node names
+            List of (write node name, render order) tuples, filtered to the requested write nodes
         """
         # Ensure the script is open
         nuke = self._ensure_script_can_be_parsed()
         
         # Debug logging
-        logger.debug(f"_get_write_nodes_by_render_order called with write_nodes: {self.write_nodes}")
+        logger.debug(f"_get_write_nodes_info called with write_nodes: {self.write_nodes}")
         
-        write_nodes_by_order = {}
         write_nodes_info = []
         
         try:
@@ -1278,17 +1553,18 @@ class NukeSubmission:
                             logger.warning(f"Failed to set GSV value {key}={value}: {e}")
             
             # Find all Write nodes
-            all_write_nodes = nuke.allNodes('Write')
+            all_write_nodes = self._get_all_write_nodes()
             logger.debug(f"Found {len(all_write_nodes)} Write nodes in nukescript: {nuke.root().name()}")
             
+            # Read every render order in one call rather than one knob at a time
+            self._cache_render_orders(all_write_nodes, gsv_combination)
+            
             for node in all_write_nodes:
-                node_name = node.name()
-                logger.debug(f"Processing write node: {node_name}")
+                node_name = self._get_node_name(node)
+                logger.debug("Processing write node: %s", node_name)
                 
                 # Get render order, default to 0
-                render_order = 0
-                if 'render_order' in node.knobs():
-                    render_order = int(node['render_order'].value())
+                render_order = self._get_render_order(node, gsv_combination)
                 
                 # Store node information for sorting
                 write_nodes_info.append((node_name, render_order))
@@ -1308,72 +1584,54 @@ class NukeSubmission:
                 
                 if len(filtered_nodes) == 0:
                     # If no nodes matched, log each requested node and whether it exists
+                    script_write_nodes = {node_name for node_name, _ in write_nodes_info}
                     for requested_node in self.write_nodes:
-                        exists = requested_node in [node[0] for node in write_nodes_info]
-                        logger.debug(f"Requested node '{requested_node}' exists in script: {exists}")
+                        exists = requested_node in script_write_nodes
+                        logger.debug("Requested node '%s' exists in script: %s", requested_node, exists)
                 
                 write_nodes_info = filtered_nodes
             
-            # Handle sorting based on options
-            if self.submit_in_render_order and self.submit_alphabetically:
-                # Sort by render order first, then alphabetically within render order groups
-                write_nodes_info.sort(key=lambda x: (x[1], x[0]))
-            elif self.submit_in_render_order:
-                # Sort by render order only
-                write_nodes_info.sort(key=lambda x: x[1])
-            elif self.submit_alphabetically:
-                # Sort alphabetically by node name
-                write_nodes_info.sort(key=lambda x: x[0])
-            # Otherwise, keep the original order (or filtered order if write_nodes was specified)
-            
-            # Group by render order for later processing
-            for node_name, render_order in write_nodes_info:
-                if render_order not in write_nodes_by_order:
-                    write_nodes_by_order[render_order] = []
-                write_nodes_by_order[render_order].append(node_name)
-            
-            logger.debug(f"Final write_nodes_by_order: {write_nodes_by_order}")
-            return write_nodes_by_order
+            return write_nodes_info
         except Exception as e:
-            logger.error(f"Failed to get write nodes by render order: {e}")
-            raise SubmissionError(f"Failed to get write nodes by render order: {e}")
+            logger.error(f"Failed to get write nodes: {e}")
+            raise SubmissionError(f"Failed to get write nodes: {e}")
 
-    def _get_sorted_write_nodes(self, gsv_combination=None) -> List[str]:
+    def _get_sorted_write_nodes(self, gsv_combination=None) -> List[Tuple[str, int]]:
         """Get write nodes sorted according to submission options.
         
         Args:
             gsv_combination: Optional tuple of (key, value) pairs for GSV to apply
             
         Returns:
-            List of write node names sorted as specified by options
+            List of (write node name, render order) tuples sorted as specified by options
         """
-        write_nodes_by_order = self._get_write_nodes_by_render_order(gsv_combination)
-        sorted_nodes = []
-        
-        # Process the write nodes based on the sorting options
-        if self.submit_in_render_order:
-            # Go through render orders in ascending order
-            for render_order in sorted(write_nodes_by_order.keys()):
-                nodes_in_order = write_nodes_by_order[render_order]
-                
-                # If also sorting alphabetically, sort this group
-                if self.submit_alphabetically:
-                    nodes_in_order.sort()
-                
-                sorted_nodes.extend(nodes_in_order)
-        else:
-            # Collect all nodes
-            all_nodes = []
-            for render_order in sorted(write_nodes_by_order.keys()):
-                all_nodes.extend(write_nodes_by_order[render_order])
-            
-            # If sorting alphabetically, sort the collected nodes
-            if self.submit_alphabetically:
-                all_nodes.sort()
-            
-            sorted_nodes = all_nodes
+        write_nodes_info = self._get_write_nodes_info(gsv_combination)
+        
+        # Alphabetical submission ignores render order entirely
+        if self.submit_alphabetically and not self.submit_in_render_order:
+            return sorted(write_nodes_info, key=lambda x: x[0])
+        
+        return self._topological_sort_write_nodes(write_nodes_info, alphabetical=self.submit_alphabetically)
+
+    @staticmethod
+    def _topological_sort_write_nodes(write_nodes_info: List[Tuple[str, int]],
+                                      alphabetical: bool = False) -> List[Tuple[str, int]]:
+        """Order write nodes for submission by ascending render order.
+        
+        Render order is the only ordering constraint between write nodes, so this
+        is a single stable sort and can't form a cycle. Ties are broken by name
+        when alphabetical and by original position otherwise.
+        
+        Args:
+            write_nodes_info: List of (write node name, render order) tuples
+            alphabetical: Whether to break render order ties alphabetically
             
-        return sorted_nodes
+        Returns:
+            List of (write node name, render order) tuples in submission order
+        """
+        if alphabetical:
+            return sorted(write_nodes_info, key=lambda x: (x[1], x[0]))
+        return sorted(write_nodes_info, key=lambda x: x[1])
 
     def _copy_script(self) -> List[str]:
         """Copy the Nuke script to the specified location(s) based on config.
@@ -1408,11 +1666,17 @@ class NukeSubmission:
         try:
             project_dir = root['project_directory'].evaluate()
             logger.debug(f"Evaluated project directory: {project_dir}")
-        except:
+        except Exception:
             logger.warning("Failed to evaluate project directory from Nuke root")
 
         copied_paths = []
         
+        # Substitute the project directory once and write it straight into each copy,
+        # rather than copying the script and then rewriting every copy
+        script_content = None
+        if project_dir is not None:
+            script_content = self._get_script_with_project_directory(project_dir)
+        
         # Get copy configurations from config
         # First check for the single configuration case
         single_config = {
@@ -1462,8 +1726,8 @@ class NukeSubmission:
                     base_dir = Path(self.output_path)
                 elif relative_to == 'OUTPUT' and self.write_nodes and len(self.write_nodes) == 1:
                     # Get output path from the first write node
-                    node = nuke.toNode(self.write_nodes[0])
-                    if node and node.Class() == "Write":
+                    node = self._get_write_node(self.write_nodes[0])
+                    if node:
                         output_file = self._get_node_pretty_path(node)
                         base_dir = Path(os.path.dirname(output_file))
                     else:
@@ -1496,11 +1760,13 @@ class NukeSubmission:
                 
                 # Copy the script
                 logger.info(f"Copying script from {self.script_path} to {target_path}")
-                shutil.copy2(self.script_path, target_path)
-                
-                # If we have a project directory, update it in the copied script
-                if project_dir is not None:
-                    self._update_project_directory_in_script(target_path, project_dir)
+                if script_content is not None:
+                    with open(target_path, 'w') as f:
+                        f.write(script_content)
+                    shutil.copymode(self.script_path, target_path)
+                    logger.debug(f"Updated project_directory in {target_path} to {project_dir}")
+                else:
+                    shutil.copy2(self.script_path, target_path)
                 
                 # Add to copied paths
                 copied_paths.append(str(target_path))
@@ -1514,18 +1780,20 @@ class NukeSubmission:
         
         return copied_paths
         
-    def _update_project_directory_in_script(self, script_path: Union[str, Path], project_dir: str) -> None:
-        """Update the project_directory knob in the copied script.
+    def _get_script_with_project_directory(self, project_dir: str) -> Optional[str]:
+        """Get the script contents with the project_directory knob set to a fixed path.
         
-        This ensures that the copied script has the evaluated project directory value
+        This ensures that copied scripts have the evaluated project directory value
         rather than a Python expression.
         
         Args:
-            script_path: Path to the copied script file
             project_dir: Evaluated project directory path
+            
+        Returns:
+            Updated script contents, or None if the script couldn't be read or updated
         """
         try:
-            with open(script_path, 'r') as f:
+            with open(self.script_path, 'r') as f:
                 content = f.read()
             
             # Look for project_directory line and replace it
@@ -1534,17 +1802,11 @@ class NukeSubmission:
             pattern = r'(project_directory\s+)(\".*?\")'
             replacement = f'\\1"{project_dir}"'
             
-            # Apply replacement
-            modified_content = re.sub(pattern, replacement, content)
-            
-            # Write back to file
-            with open(script_path, 'w') as f:
-                f.write(modified_content)
-                
-            logger.debug(f"Updated project_directory in {script_path} to {project_dir}")
+            return re.sub(pattern, replacement, content)
             
         except Exception as e:
             logger.warning(f"Failed to update project_directory in copied script: {e}")
+            return None
         
     def submit(self) -> Dict[int, List[str]]:
         """Submit the Nuke script to Deadline.
@@ -1555,13 +1817,25 @@ class NukeSubmission:
         Raises:
             SubmissionError: If submission fails
         """
-        try:
-            # Initialize dictionary to track jobs by render order
-            jobs_by_render_order = {}
+        return self._submit_prepared_jobs(self._prepare_jobs())
+
+    def _prepare_jobs(self) -> List[Tuple[Optional[int], List[Tuple[str, int, Dict[str, Any], Dict[str, Any]]]]]:
+        """Build the job and plugin info of every job to submit.
+        
+        This is the part of a submission that needs the script open, so it is kept
+        separate from talking to Deadline. The script is closed again afterwards
+        if it was opened here.
+        
+        Returns:
+            List of (previous render order, jobs) batches in submission order. Each job is a
+            (description, render order, job info, plugin info) tuple, and depends on the
+            submitted jobs of the previous render order when that isn't None
             
-            # Get Deadline connection
-            deadline = get_connection()
-            logger.info(f"Connected to Deadline: {deadline}")
+        Raises:
+            SubmissionError: If the jobs can't be prepared
+        """
+        try:
+            batches = []
             
             # If write_nodes_as_separate_jobs is True but no write nodes are provided,
             # automatically get all enabled write nodes from the script
@@ -1571,9 +1845,9 @@ class NukeSubmission:
                 
                 # Get all enabled Write nodes
                 enabled_write_nodes = []
-                for node in nuke.allNodes('Write'):
+                for node in self._get_all_write_nodes():
                     if not node['disable'].value():
-                        enabled_write_nodes.append(node.name())
+                        enabled_write_nodes.append(self._get_node_name(node))
                 
                 if enabled_write_nodes:
                     self.write_nodes = enabled_write_nodes
@@ -1591,30 +1865,32 @@ class NukeSubmission:
             if self.copy_script:
                 self._copy_script()
             
+            # Shared job settings depend on the write nodes and copied script paths set above
+            self._job_info_template = None
+            self._plugin_info_template = None
+            
             # If using GSVs, submit multiple jobs for each combination
             if self.graph_scope_variables and self.gsv_combinations:
+                # Jobs that don't depend on other jobs of this submission
+                independent_jobs = []
+                
                 for gsv_combination in self.gsv_combinations:
                     # Prepare job and plugin info with GSV information
                     job_info = self._prepare_job_info(gsv_combination)
                     plugin_info = self._prepare_plugin_info(gsv_combination)
+                    gsv_label = ",".join(f"{key}={val}" for key, val in gsv_combination)
                     
                     # If using write nodes as tasks with GSVs
                     if self.write_nodes_as_tasks and self.write_nodes and len(self.write_nodes) > 1:
-                        # Submit as a single job with all write nodes as tasks
-                        job_id = deadline.submit_job(job_info, plugin_info)
-                        
-                        # For jobs rendering multiple write nodes with different render orders, use key 0
-                        if 0 not in jobs_by_render_order:
-                            jobs_by_render_order[0] = []
-                        jobs_by_render_order[0].append(job_id)
-                        
-                        logger.info(f"GSV job submitted with write nodes as tasks. Job ID: {job_id}")
+                        # A single job with all write nodes as tasks. For jobs rendering multiple
+                        # write nodes with different render orders, use key 0
+                        independent_jobs.append((f"GSV combination {gsv_label}", 0, job_info, plugin_info))
                     
                     # If using separate jobs or dependencies with GSVs
                     elif (self.write_nodes_as_separate_jobs or self.render_order_dependencies) and self.write_nodes and len(self.write_nodes) > 1:
                         # Get write node frame ranges if use_nodes_frame_list is enabled
                         write_node_frames = {}
-                        if self.use_nodes_frame_list or re.search(r'\b(i|input)\b', self.frame_range):
+                        if self.use_nodes_frame_list or _INPUT_FRAME_RANGE_RE.search(self.frame_range):
                             write_node_info = self._get_write_node_frame_ranges(gsv_combination)
                             for node_name, start_frame, end_frame in write_node_info:
                                 write_node_frames[node_name] = (start_frame, end_frame)
@@ -1622,102 +1898,34 @@ class NukeSubmission:
                         # Get sorted write nodes
                         sorted_write_nodes = self._get_sorted_write_nodes(gsv_combination)
                         
-                        # Count existing dependencies from the user-specified ones
-                        dependency_count = 0
-                        if self.job_dependencies:
-                            dependency_count = len(re.split(r'[,\s]+', self.job_dependencies.strip()))
+                        # Map each render order to the one before it for dependencies
+                        unique_render_orders = sorted({render_order for _, render_order in sorted_write_nodes})
+                        previous_render_orders = dict(zip(unique_render_orders[1:], unique_render_orders))
                         
-                        # Get render orders for all write nodes
-                        nuke = self._ensure_script_can_be_parsed()
-                        write_node_render_orders = {}
-                        for write_node in sorted_write_nodes:
-                            node_obj = nuke.toNode(write_node)
-                            render_order = 0
-                            if node_obj and 'render_order' in node_obj.knobs():
-                                render_order = int(node_obj['render_order'].value())
-                            write_node_render_orders[write_node] = render_order
-                        
-                        # Find all unique render orders and sort them
-                        unique_render_orders = sorted(set(write_node_render_orders.values()))
-                        
-                        # Submit each node based on sorting options
-                        for write_node in sorted_write_nodes:
-                            # Get render order for this node
-                            render_order = write_node_render_orders[write_node]
-                            
-                            # Clone job info for this write node and GSV combination
-                            node_job_info = job_info.copy()
-                            node_plugin_info = plugin_info.copy()
-                            
-                            # Check if this is a movie format and set BatchModeIsMovie if needed
-                            # Skip for write_nodes_as_tasks as mentioned in the requirements
-                            if not self.write_nodes_as_tasks and self._is_movie_format(write_node):
-                                node_plugin_info["BatchModeIsMovie"] = "True"
-                                # Set a very large chunk size to ensure entire movie renders on one machine
-                                node_job_info["ChunkSize"] = "1000000"
-                            
-                            # Update job name to include write node
-                            node_job_info["Name"] = self._get_gsv_job_name(gsv_combination, write_node)
-                            
-                            # Update comment with tokens for this write node
-                            if "Comment" in node_job_info and any(token in node_job_info["Comment"] for token in ["{", "}"]):
-                                node_job_info["Comment"] = self._replace_comment_tokens(self.comment, write_node, gsv_combination)
-                            
-                            # Update ExtraInfo fields with tokens for this write node
-                            for i, extra_info_item in enumerate(self.extra_info):
-                                extra_info_key = f"ExtraInfo{i}"
-                                if extra_info_key in node_job_info and any(token in extra_info_item for token in ["{", "}"]):
-                                    node_job_info[extra_info_key] = self._replace_extrainfo_tokens(extra_info_item, write_node, gsv_combination)
-                            
-                            # Add output filename for this write node
-                            node_obj = nuke.toNode(write_node)
-                            if node_obj and node_obj.Class() == "Write" and not node_obj['disable'].value():
-                                output_path = self._get_node_pretty_path(node_obj, gsv_combination)
-                                if output_path:
-                                    node_job_info["OutputFilename0"] = output_path
-                            
-                            # Specify which write node to render
-                            # For write_nodes_as_separate_jobs: Format is WriteNode=Write1 (single write node per job)
-                            node_plugin_info["WriteNode"] = write_node
-                            
-                            # Override frame range if use_nodes_frame_list is enabled and frame range is available
-                            if (self.use_nodes_frame_list or re.search(r'\b(i|input)\b', self.frame_range)) and write_node in write_node_frames:
-                                start_frame, end_frame = write_node_frames[write_node]
-                                node_job_info["Frames"] = f"{start_frame}-{end_frame}"
-                            
-                            # Set dependencies if using render_order_dependencies
-                            if self.render_order_dependencies:
-                                # Find the index of the current render order in our sorted list
-                                current_index = unique_render_orders.index(render_order)
-                                
-                                # If this is not the lowest render order
-                                if current_index > 0:
-                                    # Get the immediate previous render order
-                                    previous_order = unique_render_orders[current_index - 1]
-                                    
-                                    # Add all jobs from the previous render order as dependencies
-                                    if previous_order in jobs_by_render_order:
-                                        for i, dep_id in enumerate(jobs_by_render_order[previous_order]):
-                                            node_job_info[f"JobDependency{i + dependency_count}"] = dep_id
-                            
-                            # Submit to Deadline
-                            job_id = deadline.submit_job(node_job_info, node_plugin_info)
-                            
-                            # Track job ID by render order
-                            if render_order not in jobs_by_render_order:
-                                jobs_by_render_order[render_order] = []
-                            jobs_by_render_order[render_order].append(job_id)
+                        if self.render_order_dependencies:
+                            # Nodes sharing a render order don't depend on each other, so each
+                            # render order is a batch depending on the render order before it
+                            for render_order, level in itertools.groupby(sorted_write_nodes, key=lambda x: x[1]):
+                                batches.append((previous_render_orders.get(render_order), [
+                                    (f"write node {write_node} ({gsv_label})", render_order, *self._prepare_write_node_job(
+                                        job_info, plugin_info, write_node, write_node_frames, gsv_combination))
+                                    for write_node, _ in level
+                                ]))
+                        else:
+                            # Independent jobs are submitted together after the last combination
+                            independent_jobs.extend(
+                                (f"write node {write_node} ({gsv_label})", render_order, *self._prepare_write_node_job(
+                                    job_info, plugin_info, write_node, write_node_frames, gsv_combination))
+                                for write_node, render_order in sorted_write_nodes
+                            )
                     
                     else:
-                        # Regular submission without separate jobs/tasks
-                        job_id = deadline.submit_job(job_info, plugin_info)
-                        
-                        # For standard submission, use render order 0
-                        if 0 not in jobs_by_render_order:
-                            jobs_by_render_order[0] = []
-                        jobs_by_render_order[0].append(job_id)
+                        # Regular submission without separate jobs/tasks, using render order 0
+                        independent_jobs.append((f"GSV combination {gsv_label}", 0, job_info, plugin_info))
                 
-                logger.info(f"Submitted jobs with GSV combinations. Jobs by render order: {jobs_by_render_order}")
+                # Submit the independent jobs of every combination in one batch
+                if independent_jobs:
+                    batches.append((None, independent_jobs))
                 
             # Standard submission without GSVs
             else:
@@ -1725,24 +1933,15 @@ class NukeSubmission:
                 job_info = self._prepare_job_info()
                 plugin_info = self._prepare_plugin_info()
                 
-                logger.debug(f"Job info:\n{json.dumps(job_info, indent=4)}")
-                logger.debug(f"Plugin info:\n{json.dumps(plugin_info, indent=4)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Job info:\n%s", json.dumps(job_info, indent=4))
+                    logger.debug("Plugin info:\n%s", json.dumps(plugin_info, indent=4))
                 
                 # If using write nodes as tasks
                 if self.write_nodes_as_tasks and self.write_nodes and len(self.write_nodes) > 1:
-                    # Handle submission with write nodes as tasks
-                    # Submit as a single job
-                    try:
-                        job_id = deadline.submit_job(job_info, plugin_info)
-                        
-                        # For jobs rendering multiple write nodes with different render orders, use key 0
-                        if 0 not in jobs_by_render_order:
-                            jobs_by_render_order[0] = []
-                        jobs_by_render_order[0].append(job_id)
-                        
-                        logger.info(f"Job submitted with write nodes as tasks. Job ID: {job_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to submit job with write nodes as tasks: {e}")
+                    # Submit as a single job. For jobs rendering multiple write nodes with
+                    # different render orders, use key 0
+                    batches.append((None, [(f"{self.script_filename} with write nodes as tasks", 0, job_info, plugin_info)]))
                 
                 # If using separate jobs or dependencies
                 elif (self.write_nodes_as_separate_jobs or self.render_order_dependencies) and self.write_nodes and len(self.write_nodes) > 1:
@@ -1750,7 +1949,7 @@ class NukeSubmission:
                     
                     # Get write node frame ranges if use_nodes_frame_list is enabled
                     write_node_frames = {}
-                    if self.use_nodes_frame_list or re.search(r'\b(i|input)\b', self.frame_range):
+                    if self.use_nodes_frame_list or _INPUT_FRAME_RANGE_RE.search(self.frame_range):
                         write_node_info = self._get_write_node_frame_ranges()
                         logger.info(f"Write node frame ranges: {write_node_info}")
                         for node_name, start_frame, end_frame in write_node_info:
@@ -1760,120 +1959,31 @@ class NukeSubmission:
                     sorted_write_nodes = self._get_sorted_write_nodes()
                     logger.info(f"Sorted write nodes: {sorted_write_nodes}")
                     
-                    # Count existing dependencies from the user-specified ones
-                    dependency_count = 0
-                    if self.job_dependencies:
-                        dependency_count = len(re.split(r'[,\s]+', self.job_dependencies.strip()))
-                    
-                    # Get render orders for all write nodes
-                    nuke = self._ensure_script_can_be_parsed()
-                    write_node_render_orders = {}
-                    for write_node in sorted_write_nodes:
-                        node_obj = nuke.toNode(write_node)
-                        render_order = 0
-                        if node_obj and 'render_order' in node_obj.knobs():
-                            render_order = int(node_obj['render_order'].value())
-                        write_node_render_orders[write_node] = render_order
-                    
-                    logger.info(f"Write node render orders: {write_node_render_orders}")
-                    
-                    # Find all unique render orders and sort them
-                    unique_render_orders = sorted(set(write_node_render_orders.values()))
+                    # Map each render order to the one before it for dependencies
+                    unique_render_orders = sorted({render_order for _, render_order in sorted_write_nodes})
+                    previous_render_orders = dict(zip(unique_render_orders[1:], unique_render_orders))
                     logger.info(f"Unique render orders: {unique_render_orders}")
                     
-                    # Submit each node based on sorting options
-                    for write_node in sorted_write_nodes:
-                        logger.info(f"Processing write node: {write_node}")
-                        
-                        # Get render order for this node
-                        render_order = write_node_render_orders[write_node]
-                        
-                        # Clone job info for this write node
-                        node_job_info = job_info.copy()
-                        node_plugin_info = plugin_info.copy()
-                        
-                        # Check if this is a movie format and set BatchModeIsMovie if needed
-                        # Skip for write_nodes_as_tasks as mentioned in the requirements
-                        if not self.write_nodes_as_tasks and self._is_movie_format(write_node):
-                            node_plugin_info["BatchModeIsMovie"] = "True"
-                            # Set a very large chunk size to ensure entire movie renders on one machine
-                            node_job_info["ChunkSize"] = "1000000"
-                        
-                        # Update job name to include write node
-                        node_job_info["Name"] = self._replace_job_name_tokens(self.job_name_template, write_node)
-                        
-                        # Update comment with tokens for this write node
-                        if "Comment" in node_job_info and any(token in node_job_info["Comment"] for token in ["{", "}"]):
-                            node_job_info["Comment"] = self._replace_comment_tokens(self.comment, write_node)
-                        
-                        # Update ExtraInfo fields with tokens for this write node
-                        for i, extra_info_item in enumerate(self.extra_info):
-                            extra_info_key = f"ExtraInfo{i}"
-                            if extra_info_key in node_job_info and any(token in extra_info_item for token in ["{", "}"]):
-                                node_job_info[extra_info_key] = self._replace_extrainfo_tokens(extra_info_item, write_node)
-                        
-                        # Add output filename for this write node
-                        node_obj = nuke.toNode(write_node)
-                        if node_obj and node_obj.Class() == "Write" and not node_obj['disable'].value():
-                            output_path = self._get_node_pretty_path(node_obj)
-                            if output_path:
-                                node_job_info["OutputFilename0"] = output_path
-                        
-                        # Specify which write node to render
-                        # For write_nodes_as_separate_jobs: Format is WriteNode=Write1 (single write node per job)
-                        node_plugin_info["WriteNode"] = write_node
-                        
-                        # Override frame range if use_nodes_frame_list is enabled and frame range is available
-                        if (self.use_nodes_frame_list or re.search(r'\b(i|input)\b', self.frame_range)) and write_node in write_node_frames:
-                            start_frame, end_frame = write_node_frames[write_node]
-                            node_job_info["Frames"] = f"{start_frame}-{end_frame}"
-                        
-                        # Set dependencies if using render_order_dependencies
-                        if self.render_order_dependencies:
-                            # Find the index of the current render order in our sorted list
-                            current_index = unique_render_orders.index(render_order)
-                            
-                            # If this is not the lowest render order
-                            if current_index > 0:
-                                # Get the immediate previous render order
-                                previous_order = unique_render_orders[current_index - 1]
-                                
-                                # Add all jobs from the previous render order as dependencies
-                                if previous_order in jobs_by_render_order:
-                                    for i, dep_id in enumerate(jobs_by_render_order[previous_order]):
-                                        node_job_info[f"JobDependency{i + dependency_count}"] = dep_id
-                        
-                        logger.info(f"Submitting job for write node {write_node}")
-                        logger.debug(f"Job info for {write_node}: {node_job_info}")
-                        logger.debug(f"Plugin info for {write_node}: {node_plugin_info}")
-                        
-                        # Submit to Deadline
-                        try:
-                            job_id = deadline.submit_job(node_job_info, node_plugin_info)
-                            
-                            # Track job ID by render order
-                            if render_order not in jobs_by_render_order:
-                                jobs_by_render_order[render_order] = []
-                            jobs_by_render_order[render_order].append(job_id)
-                            
-                            logger.info(f"Successfully submitted job for {write_node}. Job ID: {job_id}")
-                        except Exception as e:
-                            logger.error(f"Failed to submit job for write node {write_node}: {e}")
+                    node_jobs = []
+                    for write_node, render_order in sorted_write_nodes:
+                        logger.info(f"Processing write node: {write_node} (render order {render_order})")
+                        node_job_info, node_plugin_info = self._prepare_write_node_job(
+                            job_info, plugin_info, write_node, write_node_frames)
+                        logger.debug("Job info for %s: %s", write_node, node_job_info)
+                        logger.debug("Plugin info for %s: %s", write_node, node_plugin_info)
+                        node_jobs.append((f"write node {write_node}", render_order, node_job_info, node_plugin_info))
                     
-                    logger.info(f"Jobs submitted as separate jobs. Jobs by render order: {jobs_by_render_order}")
+                    if self.render_order_dependencies:
+                        # Nodes sharing a render order don't depend on each other, so each
+                        # render order is a batch depending on the render order before it
+                        for render_order, level in itertools.groupby(node_jobs, key=lambda x: x[1]):
+                            batches.append((previous_render_orders.get(render_order), list(level)))
+                    else:
+                        # Independent jobs are submitted together in one batch
+                        batches.append((None, node_jobs))
                 else:
-                    # Regular submission without separate jobs/tasks
-                    try:
-                        job_id = deadline.submit_job(job_info, plugin_info)
-                        
-                        # For standard submission, use render order 0
-                        if 0 not in jobs_by_render_order:
-                            jobs_by_render_order[0] = []
-                        jobs_by_render_order[0].append(job_id)
-                        
-                        logger.info(f"Job submitted successfully. Job ID: {job_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to submit regular job: {e}")
+                    # Regular submission without separate jobs/tasks, using render order 0
+                    batches.append((None, [(self.script_filename, 0, job_info, plugin_info)]))
             
             # Close the script if we opened it
             if self._script_will_close:
@@ -1881,9 +1991,10 @@ class NukeSubmission:
                 nuke.scriptClose()
                 nuke.scriptClear()
                 self._script_will_close = False
-                logger.info(f"Script {self.script_path} closed after submission")
+                self._clear_script_caches()
+                logger.info(f"Script {self.script_path} closed after preparing jobs")
             
-            return jobs_by_render_order
+            return batches
                     
         except Exception as e:
             # Close the script if we opened it, even if submission failed
@@ -1892,11 +2003,82 @@ class NukeSubmission:
                     nuke = self._ensure_script_can_be_parsed()
                     nuke.scriptClose()
                     self._script_will_close = False
-                except:
+                    self._clear_script_caches()
+                except Exception:
                     pass  # Don't let script closing error mask the original error
             
             raise SubmissionError(f"Failed to submit job: {e}")
 
+    def _submit_prepared_jobs(self, batches: List[Tuple[Optional[int], List[Tuple[str, int, Dict[str, Any], Dict[str, Any]]]]]) -> Dict[int, List[str]]:
+        """Submit jobs built by _prepare_jobs to Deadline.
+        
+        Each batch is submitted in one call once the batches before it have job IDs,
+        so it can depend on the jobs of the previous render order.
+        
+        Args:
+            batches: List of (previous render order, jobs) batches, as returned by _prepare_jobs
+            
+        Returns:
+            Dictionary where keys are render order values (int) and values are lists of job IDs (str)
+            
+        Raises:
+            SubmissionError: If submission fails or none of the jobs were submitted
+        """
+        # Initialize dictionary to track jobs by render order, and the jobs that weren't submitted
+        jobs_by_render_order = {}
+        failures = []
+        
+        try:
+            # Get Deadline connection
+            deadline = self._connection or get_connection()
+            logger.info(f"Connected to Deadline: {deadline}")
+            
+            # Count existing dependencies from the user-specified ones
+            dependency_count = len(self.job_dependency_ids)
+            
+            for previous_order, jobs in batches:
+                # Add all jobs from the immediate previous render order as dependencies.
+                # If none of them were submitted, this batch would render too early
+                dependencies = {}
+                if previous_order is not None:
+                    if previous_order not in jobs_by_render_order:
+                        reason = f"no jobs were submitted for render order {previous_order}"
+                        for description, *_ in jobs:
+                            logger.error(f"Skipping job for {description}: {reason}")
+                            failures.append(f"{description}: {reason}")
+                        continue
+                    dependencies = {
+                        f"JobDependency{i + dependency_count}": dep_id
+                        for i, dep_id in enumerate(jobs_by_render_order[previous_order])
+                    }
+                
+                for _, _, job_info, _ in jobs:
+                    job_info.update(dependencies)
+                
+                # Submit to Deadline and track the job IDs by render order
+                try:
+                    results = deadline.submit_jobs([(job_info, plugin_info) for _, _, job_info, plugin_info in jobs])
+                except Exception as e:
+                    results = [e] * len(jobs)
+                self._record_job_results(
+                    jobs_by_render_order, failures,
+                    [(description, render_order) for description, render_order, _, _ in jobs],
+                    results)
+        
+        except Exception as e:
+            raise SubmissionError(f"Failed to submit job: {e}")
+        
+        if failures:
+            if not jobs_by_render_order:
+                raise SubmissionError("Failed to submit jobs:\n" + "\n".join(failures))
+            logger.warning(f"{len(failures)} job(s) were not submitted: {'; '.join(failures)}")
+        
+        logger.info(f"Jobs by render order: {jobs_by_render_order}")
+        return jobs_by_render_order
+
+# Keyword arguments accepted by submit_nuke_script, for checking submission options up front
+SUBMISSION_KWARGS = frozenset(inspect.signature(NukeSubmission.__init__).parameters) - {'self', 'script_path'}
+
 
 def submit_nuke_script(script_path: str, **kwargs) -> Dict[int, List[str]]:
     """Submit a Nuke script to Deadline.
@@ -1962,10 +2144,25 @@ def submit_nuke_script(script_path: str, **kwargs) -> Dict[int, List[str]]:
           - use_nodes_frame_list: Whether to use node-specific frame lists
           - parse_output_paths_to_deadline: Whether to parse output paths to add as OutputFilename entries in job info.
                                            Defaults to True if script_path_same_as_current_nuke_session is True
+          
+          # Deadline connection
+          - connection: DeadlineConnection to reuse across submissions (defaults to the global connection).
+                        Not used when the submission is handed off to a subprocess.
     
     Returns:
         Dictionary where keys are render order values (int) and values are lists of job IDs (str)
+
+    Raises:
+        SubmissionError: If an unknown submission parameter is given
     """
+    # Reject typos before a Nuke subprocess is launched rather than inside it
+    unknown_kwargs = kwargs.keys() - SUBMISSION_KWARGS
+    if unknown_kwargs:
+        raise SubmissionError(f"Unknown submission parameters: {', '.join(sorted(unknown_kwargs))}")
+
+    # A live connection can't be serialized for a subprocess, so keep it out of kwargs
+    connection = kwargs.pop('connection', None)
+    
     # Extract parameters needed for determining script path
     script_path_same_as_current_nuke_session = kwargs.get('script_path_same_as_current_nuke_session', False)
     use_parser_instead_of_nuke = kwargs.get('use_parser_instead_of_nuke', False)
@@ -1979,7 +2176,6 @@ def submit_nuke_script(script_path: str, **kwargs) -> Dict[int, List[str]]:
     running_in_nuke_gui = False
     try:
         import psutil
-        import os
         current_process = psutil.Process(os.getpid())
         parent_process_name = current_process.name()
         running_in_nuke_gui = "Nuke" in parent_process_name
@@ -2013,5 +2209,9 @@ def submit_nuke_script(script_path: str, **kwargs) -> Dict[int, List[str]]:
         kwargs['script_path_same_as_current_nuke_session']=False
 
     # Proceed with submission within the current process if submitted script is same as currently open script
-    submission = NukeSubmission(script_path=script_path, **kwargs)
-    return submission.submit() 
\ No newline at end of file
+    # The Nuke session (or parser) holds a single open script, so concurrent callers take turns
+    # preparing their jobs, then talk to Deadline without holding up the others
+    with _script_session_lock:
+        submission = NukeSubmission(script_path=script_path, connection=connection, **kwargs)
+        batches = submission._prepare_jobs()
+    return submission._submit_prepared_jobs(batches)
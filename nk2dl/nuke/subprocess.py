@@ -5,15 +5,39 @@ when direct parsing of the script in the current Nuke session is not possible.
 """
 
 import os
+import re
 import sys
 import json
 import tempfile
+import threading
 import subprocess as sp
 from typing import Dict, List, Any, Optional
 
 from ..common.framerange import FrameRange
 from ..common.logging import logger
 
+# Name template tokens whose values can only be found by parsing the script
+_PARSING_REQUIRED_TOKENS = (
+    # File stem tokens
+    "{fs}", "{fns}", "{os}", "{fstem}", "{ostem}", "{filestem}", "{file_stem}",
+    "{filenamestem}", "{filename_stem}", "{outputstem}", "{output_stem}",
+    # Output tokens
+    "{o}", "{fn}", "{file}", "{filename}", "{file_name}", "{output}",
+    # Render order tokens
+    "{r}", "{ro}", "{renderorder}", "{render_order}",
+    # GSV tokens
+    "{g}", "{gsv}", "{gsvs}", "{GSVs}", "{graphscopevars}", "{graphscopevariables}",
+    "{graph_scope_vars}", "{graph_scope_variables}",
+)
+
+# Write node tokens require parsing only if write_nodes not specified
+_WRITE_NODE_TOKENS = ("{w}", "{wn}", "{write}", "{writenode}", "{write_node}", "{write_name}")
+
+# Each token set is matched with one regex scan per field rather than a substring search per token
+_PARSING_REQUIRED_RE = re.compile("|".join(map(re.escape, _PARSING_REQUIRED_TOKENS)))
+_PARSING_REQUIRED_WITH_WRITE_NODES_RE = re.compile(
+    "|".join(map(re.escape, _PARSING_REQUIRED_TOKENS + _WRITE_NODE_TOKENS)))
+
 def serialize_kwargs(kwargs: Dict[str, Any]) -> str:
     """Serialize kwargs to a JSON string that can be safely included in Python code."""
     return json.dumps(kwargs).replace("'", "\\'").replace('"', '\\"')
@@ -43,7 +67,7 @@ def submit_script_via_subprocess(script_path: str,
         # Clean up
         try:
             os.unlink(temp_file)
-        except:
+        except OSError:
             pass
 
 def create_submission_script(script_path: str, kwargs: Dict[str, Any]) -> str:
@@ -121,70 +145,59 @@ def execute_submission_script(script_path: str, use_parser_instead_of_nuke: bool
         stderr=sp.PIPE,
         text=True,
         env=env,
-        bufsize=1  # Line buffered
+        bufsize=1,  # Line buffered
+        close_fds=True  # Don't leak descriptors opened by the Nuke host into the child
     )
     
-    # Variables to store the complete stdout and stderr
-    all_stdout = []
+    # Echo stderr from a background thread, so a chatty stream can never block
+    # the other one; stderr is kept for error reporting
     all_stderr = []
     
-    # Read and display output in real-time
-    while True:
-        # Read from stdout
-        stdout_line = process.stdout.readline()
-        if stdout_line:
-            print(stdout_line, end='')  # Print to console in real-time
-            all_stdout.append(stdout_line)
-        
-        # Read from stderr
-        stderr_line = process.stderr.readline()
-        if stderr_line:
-            print(stderr_line, end='', file=sys.stderr)  # Print to stderr in real-time
-            all_stderr.append(stderr_line)
-        
-        # Check if process has finished
-        if process.poll() is not None:
-            # Read any remaining output
-            for line in process.stdout:
-                print(line, end='')
-                all_stdout.append(line)
-            for line in process.stderr:
-                print(line, end='', file=sys.stderr)
-                all_stderr.append(line)
-            break
+    def echo_stderr():
+        for line in process.stderr:
+            print(line, end='', file=sys.stderr)  # Print to stderr in real-time
+            all_stderr.append(line)
+    
+    stderr_thread = threading.Thread(target=echo_stderr, daemon=True)
+    stderr_thread.start()
     
-    # Combine all captured output
-    stdout = ''.join(all_stdout)
+    # Echo stdout as it arrives, keeping only the JSON result between the markers
+    start_marker = "NK2DL_JSON_BEGIN"
+    end_marker = "NK2DL_JSON_END"
+    json_lines = None
+    json_str = None
+    for line in process.stdout:
+        print(line, end='')  # Print to console in real-time
+        if json_str is not None:
+            continue
+        marker = line.strip()
+        if marker == start_marker and json_lines is None:
+            json_lines = []
+        elif marker == end_marker and json_lines is not None:
+            json_str = ''.join(json_lines).strip()
+        elif json_lines is not None:
+            json_lines.append(line)
+    
+    process.wait()
+    stderr_thread.join()
     stderr = ''.join(all_stderr)
     
     # Check if the process failed
     if process.returncode != 0:
         logger.error(f"Subprocess failed with exit code {process.returncode}")
         logger.error(f"STDERR: {stderr}")
-        logger.error(f"STDOUT: {stdout}")
         raise RuntimeError(f"Subprocess failed: {stderr}")
     
-    # Extract JSON output between markers
+    if json_str is None:
+        logger.error("Could not find JSON markers in subprocess output (see output above)")
+        logger.error(f"STDERR: {stderr}")
+        raise RuntimeError(f"No JSON output markers found in subprocess output")
+    
+    # Parse JSON
     try:
-        # Find the JSON output between markers
-        start_marker = "NK2DL_JSON_BEGIN"
-        end_marker = "NK2DL_JSON_END"
-        
-        start_idx = stdout.find(start_marker)
-        end_idx = stdout.find(end_marker)
-        
-        if start_idx == -1 or end_idx == -1:
-            logger.error(f"Could not find JSON markers in output - STDOUT: {stdout}")
-            logger.error(f"STDERR: {stderr}")
-            raise RuntimeError(f"No JSON output markers found in subprocess output")
-        
-        # Extract the JSON string between markers
-        json_str = stdout[start_idx + len(start_marker):end_idx].strip()
-        
-        # Parse JSON
         return json.loads(json_str)
     except Exception as e:
-        logger.error(f"Failed to parse subprocess output - STDOUT: {stdout}")
+        logger.error(f"Failed to parse subprocess output: {json_str}")
         logger.error(f"STDERR: {stderr}")
         logger.error(f"Exception: {str(e)}")
         raise RuntimeError(f"Failed to parse subprocess output: {e}")
@@ -208,28 +221,15 @@ def script_parsing_required(**kwargs):
     comment = kwargs.get('comment', '')
     extra_info = kwargs.get('extra_info', '')
     
-    # Define token groups that require script parsing
-    file_stem_tokens    = ["{fs}", "{fns}", "{os}", "{fstem}", "{ostem}", "{filestem}", "{file_stem}", 
-                           "{filenamestem}", "{filename_stem}", "{outputstem}", "{output_stem}"]
-    output_tokens       = ["{o}", "{fn}", "{file}", "{filename}", "{file_name}", "{output}"]
-    render_order_tokens = ["{r}", "{ro}", "{renderorder}", "{render_order}"]
-    gsv_tokens          = ["{g}", "{gsv}", "{gsvs}", "{GSVs}", "{graphscopevars}", "{graphscopevariables}", 
-                           "{graph_scope_vars}", "{graph_scope_variables}"]
-    
-    # Write node tokens require parsing only if write_nodes not specified
-    write_node_tokens = ["{w}", "{wn}", "{write}", "{writenode}", "{write_node}", "{write_name}"]
-    
-    # Combine all token groups that require parsing
-    parsing_required_tokens = file_stem_tokens + output_tokens + render_order_tokens + gsv_tokens
-    
-    # If write_nodes is not specified, add write_node_tokens to parsing_required_tokens
-    if not write_nodes:
-        parsing_required_tokens.extend(write_node_tokens)
+    # Write node tokens only need the script parsed if write_nodes is not specified
+    parsing_required_re = _PARSING_REQUIRED_RE if write_nodes else _PARSING_REQUIRED_WITH_WRITE_NODES_RE
     
     # Check if any of the string fields contain tokens requiring parsing
+    if isinstance(extra_info, (list, tuple)):
+        extra_info = "\n".join(map(str, extra_info))
     fields_to_check = [job_name, batch_name, comment, extra_info]
     for field in fields_to_check:
-        if any(token in field for token in parsing_required_tokens):
+        if field and parsing_required_re.search(field):
             return True
 
     # Extract rem relevant parameters
@@ -4,14 +4,25 @@ This module provides utility functions for working with Nuke, including
 functions to get the Nuke module, get node file paths, and get Nuke version.
 """
 
+import logging
 import re
 import os
-from typing import Any, Optional, Union
+import functools
+from typing import Any, Optional, Tuple, Union
 
 from ..common.config import config
 from ..common.errors import SubmissionError
 from ..common.logging import logger
 
+# First Nuke version with Graph Scope Variables
+GSV_MIN_VERSION = (15, 2)
+
+# Frame number placeholders in file paths, e.g. '####' and '%04d'
+_HASH_PLACEHOLDER_RE = re.compile(r'#+')
+_PRINTF_PLACEHOLDER_RE = re.compile(r'%\d*d')
+# Graph Scope Variables left in evaluated file paths, e.g. '%{shotcode}'
+_GSV_VARIABLE_RE = re.compile(r'%\{([^}]+)\}')
+
 # Global variable to store nuke module when imported
 _nuke_module = None
 _parser_module = None
@@ -80,120 +91,92 @@ def node_pretty_path(node) -> str:
         return ""
         
     try:
+        # Each call into Nuke crosses into C++, so look the knob and node name up once
+        file_knob = node['file']
+        debug = logger.isEnabledFor(logging.DEBUG)
+        node_name = node.name() if debug else None
+        
         # Get the original unexpanded file path expression
-        original_path = node['file'].value()
-        logger.debug(f"{node.name()} Original path: {original_path}")
+        original_path = file_knob.value()
+        if debug:
+            logger.debug("%s Original path: %s", node_name, original_path)
 
         # Evaluate the path (which will substitute the current frame number)
-        evaluated_path = node['file'].evaluate()
-        logger.debug(f"{node.name()} Nuke evaluated path: {evaluated_path}")
+        evaluated_path = file_knob.evaluate()
+        if debug:
+            logger.debug("%s Nuke evaluated path: %s", node_name, evaluated_path)
 
         # Check if the original path had frame number placeholders
-        has_hash_placeholder = re.search(r'#+', original_path) is not None
-        has_printf_placeholder = re.search(r'%\d*d', original_path) is not None
+        has_hash_placeholder = _HASH_PLACEHOLDER_RE.search(original_path) is not None
+        has_printf_placeholder = _PRINTF_PLACEHOLDER_RE.search(original_path) is not None
         
         if has_hash_placeholder or has_printf_placeholder:
             # Split the path into directory and filename
             directory, filename = os.path.split(evaluated_path)
             original_directory, original_filename = os.path.split(original_path)
             
-            # Check if the original filename contains placeholders
-            if has_hash_placeholder and re.search(r'#+', original_filename):
-                # Extract the hash sequence (e.g., '####')
-                hash_match = re.search(r'(#+)', original_filename)
-                if hash_match:
-                    placeholder = hash_match.group(1)
-                    # Find position of hash placeholder in original filename
-                    parts = original_filename.split(placeholder)
+            # Check if the original filename contains placeholders, preferring
+            # a hash sequence (e.g., '####') over a printf format (e.g., '%04d')
+            placeholder_match = (
+                (has_hash_placeholder and _HASH_PLACEHOLDER_RE.search(original_filename)) or
+                (has_printf_placeholder and _PRINTF_PLACEHOLDER_RE.search(original_filename))
+            )
+            if placeholder_match:
+                placeholder = placeholder_match.group(0)
+                # Find position of placeholder in original filename
+                parts = original_filename.split(placeholder)
+                
+                # If we have parts before and after the placeholder, use them for context
+                if len(parts) >= 2:
+                    prefix = parts[0]
+                    suffix = parts[1] if len(parts) > 1 else ''
                     
-                    # If we have parts before and after the placeholder, use them for context
-                    if len(parts) >= 2:
-                        prefix = parts[0]
-                        suffix = parts[1] if len(parts) > 1 else ''
-                        
-                        # Create a pattern to find the frame number in the evaluated filename
-                        if prefix:
-                            prefix_pattern = re.escape(prefix)
-                            if suffix:
-                                suffix_pattern = re.escape(suffix)
-                                pattern = f"{prefix_pattern}(\\d+){suffix_pattern}"
-                            else:
-                                pattern = f"{prefix_pattern}(\\d+)"
-                        elif suffix:
+                    # Create a pattern to find the frame number in the evaluated filename
+                    if prefix:
+                        prefix_pattern = re.escape(prefix)
+                        if suffix:
                             suffix_pattern = re.escape(suffix)
-                            pattern = f"(\\d+){suffix_pattern}"
+                            pattern = f"{prefix_pattern}(\\d+){suffix_pattern}"
                         else:
-                            pattern = r"(\d+)"
-                        
-                        # Find and replace the frame number with the original placeholder
-                        frame_match = re.search(pattern, filename)
-                        if frame_match:
-                            frame_num = frame_match.group(1)
-                            fixed_filename = filename.replace(frame_num, placeholder, 1)
-                            evaluated_path = os.path.join(directory, fixed_filename)
-            
-            elif has_printf_placeholder and re.search(r'%\d*d', original_filename):
-                # Extract the printf format (e.g., '%04d')
-                printf_match = re.search(r'(%\d*d)', original_filename)
-                if printf_match:
-                    placeholder = printf_match.group(1)
-                    # Find position of printf placeholder in original filename
-                    parts = original_filename.split(placeholder)
+                            pattern = f"{prefix_pattern}(\\d+)"
+                    elif suffix:
+                        suffix_pattern = re.escape(suffix)
+                        pattern = f"(\\d+){suffix_pattern}"
+                    else:
+                        pattern = r"(\d+)"
                     
-                    # If we have parts before and after the placeholder, use them for context
-                    if len(parts) >= 2:
-                        prefix = parts[0]
-                        suffix = parts[1] if len(parts) > 1 else ''
-                        
-                        # Create a pattern to find the frame number in the evaluated filename
-                        if prefix:
-                            prefix_pattern = re.escape(prefix)
-                            if suffix:
-                                suffix_pattern = re.escape(suffix)
-                                pattern = f"{prefix_pattern}(\\d+){suffix_pattern}"
-                            else:
-                                pattern = f"{prefix_pattern}(\\d+)"
-                        elif suffix:
-                            suffix_pattern = re.escape(suffix)
-                            pattern = f"(\\d+){suffix_pattern}"
-                        else:
-                            pattern = r"(\d+)"
-                        
-                        # Find and replace the frame number with the original placeholder
-                        frame_match = re.search(pattern, filename)
-                        if frame_match:
-                            frame_num = frame_match.group(1)
-                            fixed_filename = filename.replace(frame_num, placeholder, 1)
-                            evaluated_path = os.path.join(directory, fixed_filename)
+                    # Find and replace the frame number with the original placeholder
+                    frame_match = re.search(pattern, filename)
+                    if frame_match:
+                        frame_num = frame_match.group(1)
+                        fixed_filename = filename.replace(frame_num, placeholder, 1)
+                        evaluated_path = os.path.join(directory, fixed_filename)
 
         # Check if the path contains GSV variables like %{shotcode}
-        gsv_pattern = r'%\{([^}]+)\}'
-        gsv_matches = re.finditer(gsv_pattern, evaluated_path)
-        
-        # If unevaluated GSV variables are found, evaluate them
-        if re.search(gsv_pattern, evaluated_path):
+        if _GSV_VARIABLE_RE.search(evaluated_path):
             try:
                 # Get the root node to access GSV knob
                 root_node = nuke_module().root()
                 if 'gsv' in root_node.knobs():
                     gsv_knob = root_node['gsv']
                     
-                    # For each GSV variable found, replace with its value
-                    for match in re.finditer(gsv_pattern, evaluated_path):
+                    def replace_gsv_variable(match):
                         var_name = match.group(1)
                         var_value = gsv_knob.getGsvValue(var_name)
 
-                        logger.debug(f"Found unevaluated GSV variable: {var_name} = {var_value}")       
+                        logger.debug("Found unevaluated GSV variable: %s = %s", var_name, var_value)
 
-                        if var_value:
-                            # Replace the GSV placeholder with its value
-                            gsv_placeholder = match.group(0)  # %{var_name}
-                            evaluated_path = evaluated_path.replace(gsv_placeholder, var_value)
+                        # Replace the GSV placeholder with its value, leaving it if there is none
+                        return var_value if var_value else match.group(0)
+                    
+                    # Replace every GSV variable in a single pass
+                    evaluated_path = _GSV_VARIABLE_RE.sub(replace_gsv_variable, evaluated_path)
             except Exception as e:
                 logger.warning(f"Error evaluating GSV variables: {e}")
 
         # If no placeholders or replacement failed, return the evaluated path
-        logger.debug(f"{node.name()} Pretty path: {evaluated_path}")
+        if debug:
+            logger.debug("%s Pretty path: %s", node_name, evaluated_path)
         return evaluated_path
         
     except Exception as e:
@@ -242,4 +225,36 @@ def nuke_version(nuke_version: Optional[Union[str, int, float]] = None) -> str:
     nuke = nuke_module()
     major = nuke.NUKE_VERSION_MAJOR
     minor = nuke.NUKE_VERSION_MINOR
-    return f"{major}.{minor}" 
\ No newline at end of file
+    return f"{major}.{minor}" 
+
+
+@functools.lru_cache(maxsize=32)
+def parse_version(version_str: str) -> Tuple[int, int]:
+    """Parse the major and minor numbers from a Nuke version string.
+    
+    Args:
+        version_str: Version string such as "15.1"
+        
+    Returns:
+        Tuple of (major, minor)
+        
+    Raises:
+        ValueError: If the string does not start with numeric major and minor parts
+    """
+    major, minor = map(int, version_str.split('.', 2)[:2])
+    return major, minor
+
+
+def supports_gsv(version_str: str) -> bool:
+    """Check whether a Nuke version supports Graph Scope Variables (15.2+).
+    
+    Args:
+        version_str: Version string such as "15.2"
+        
+    Returns:
+        True if the version supports GSVs, False if it doesn't or can't be parsed
+    """
+    try:
+        return parse_version(version_str) >= GSV_MIN_VERSION
+    except ValueError:
+        return False
@@ -1,10 +1,14 @@
 """Tests for the CLI parser."""
 
+import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import patch
 
 from nk2dl.cli.parser import parse_args, create_parser
+from nk2dl.cli.commands import _args_to_kwargs, _read_jobspecs
+from nk2dl.common.errors import NK2DLError
 
 
 class TestCLIParser(unittest.TestCase):
@@ -55,6 +59,62 @@ class TestCLIParser(unittest.TestCase):
             self.assertEqual(args.FramesPerTask, 10)
             self.assertTrue(args.UseNukeX)
 
+    def test_batch_command(self):
+        """Test parsing batch command arguments."""
+        args = parse_args(['batch', '--jobspec', 'jobs.jsonl', '--fanout', '8'])
+        self.assertEqual(args.command, 'batch')
+        self.assertEqual(args.jobspec, 'jobs.jsonl')
+        self.assertEqual(args.fanout, 8)
+        
+        args = parse_args(['batch', '--jobspec', 'jobs.jsonl'])
+        self.assertEqual(args.fanout, 64)
+
+    def test_list_arguments(self):
+        """Test comma-separated arguments are split by the parser."""
+        args = parse_args(['submit', 'test.nk', '--WriteNodes', 'Write1, Write2,', '--RAM', '2'])
+        self.assertEqual(args.WriteNodes, ['Write1', 'Write2'])
+        self.assertEqual(args.RAM, 2048)
+        
+    def test_args_to_kwargs(self):
+        """Test converting parsed submit arguments to submission kwargs."""
+        args = parse_args([
+            'submit', 'test.nk',
+            '--Priority', '75',
+            '--WriteNodes', 'Write1,Write2',
+            '--RAM', '4',
+            '--UseNukeX'
+        ])
+        kwargs = _args_to_kwargs(args)
+        self.assertEqual(kwargs, {
+            'priority': 75,
+            'write_nodes': ['Write1', 'Write2'],
+            'max_ram_usage': 4096,
+            'use_nuke_x': True,
+        })
+
+    def test_read_jobspecs(self):
+        """Test reading jobspecs and rejecting unknown submission options."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            jobspec_path = os.path.join(temp_dir, 'jobs.jsonl')
+            with open(jobspec_path, 'w') as f:
+                f.write('{"script_path": "a.nk", "priority": 75}\n\n{"script_path": "b.nk"}\n')
+            self.assertEqual(_read_jobspecs(jobspec_path), [
+                (1, {'script_path': 'a.nk', 'priority': 75}),
+                (3, {'script_path': 'b.nk'}),
+            ])
+            
+            with open(jobspec_path, 'w') as f:
+                f.write('{"script_path": "a.nk", "priorty": 75}\n')
+            with self.assertRaises(NK2DLError) as context:
+                _read_jobspecs(jobspec_path)
+            self.assertIn("priorty", str(context.exception))
+            
+            with open(jobspec_path, 'w') as f:
+                f.write('{"script_path": "a.nk", "connection": "deadline-server"}\n')
+            with self.assertRaises(NK2DLError) as context:
+                _read_jobspecs(jobspec_path)
+            self.assertIn("connection", str(context.exception))
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
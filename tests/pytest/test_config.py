@@ -1,10 +1,14 @@
 """Tests for the configuration system."""
 
+import json
 import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 import pytest
 import yaml
+from unittest.mock import patch
 
 from nk2dl.common.config import Config, ConfigError
 
@@ -171,4 +175,182 @@ def test_nonexistent_key():
     """Test getting nonexistent configuration key."""
     config = Config()
     assert config.get('nonexistent.key') is None
-    assert config.get('nonexistent.key', 'default') == 'default' 
\ No newline at end of file
+    assert config.get('nonexistent.key', 'default') == 'default' 
+
+
+def test_config_cache():
+    """Test that the on-disk config cache is reused until a source changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_config = Path(tmpdir) / 'project.yaml'
+        with project_config.open('w') as f:
+            yaml.safe_dump({'deadline': {'host': 'cached_host'}}, f)
+        
+        cache_path = Path(tmpdir) / 'cache' / 'config.json'
+        with patch.object(Config, '_default_cache_path', staticmethod(lambda: cache_path)):
+            config = Config(project_config=str(project_config), user_config='nonexistent.yaml', use_cache=True)
+            assert config.get('deadline.host') == 'cached_host'
+            cached = json.loads(cache_path.read_text())
+            assert cached['config']['deadline']['host'] == 'cached_host'
+            assert cached['flat']['deadline.host'] == 'cached_host'
+            
+            # Unchanged sources are served from the cache without reading YAML
+            with patch.object(Config, '_load_yaml_file') as mock_load:
+                config = Config(project_config=str(project_config), user_config='nonexistent.yaml', use_cache=True)
+                mock_load.assert_not_called()
+            assert config.get('deadline.host') == 'cached_host'
+            
+            # Environment variables are part of the cache key
+            with patch.dict(os.environ, {'NK2DL_DEADLINE_HOST': 'env_host'}):
+                config = Config(project_config=str(project_config), user_config='nonexistent.yaml', use_cache=True)
+                assert config.get('deadline.host') == 'env_host'
+            
+            # Editing a config file invalidates the cache
+            with project_config.open('w') as f:
+                yaml.safe_dump({'deadline': {'host': 'edited_host', 'port': 1234}}, f)
+            config = Config(project_config=str(project_config), user_config='nonexistent.yaml', use_cache=True)
+            assert config.get('deadline.host') == 'edited_host'
+            
+            # A cache that isn't valid JSON is ignored and rewritten
+            cache_path.write_bytes(b'\x80\x04not json')
+            config = Config(project_config=str(project_config), user_config='nonexistent.yaml', use_cache=True)
+            assert config.get('deadline.host') == 'edited_host'
+            assert json.loads(cache_path.read_text())['config']['deadline']['port'] == 1234
+
+
+def test_get_config_cache_opt_in():
+    """Test that get_config only uses the on-disk cache once it is enabled."""
+    from nk2dl.common.config import enable_config_cache, get_config, invalidate_config_cache
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / 'config.json'
+        with patch.object(Config, '_default_cache_path', staticmethod(lambda: cache_path)):
+            invalidate_config_cache()
+            try:
+                get_config('nonexistent.yaml', 'also_nonexistent.yaml')
+                assert not cache_path.exists()
+                
+                enable_config_cache()
+                invalidate_config_cache()
+                get_config('nonexistent.yaml', 'also_nonexistent.yaml')
+                assert cache_path.exists()
+            finally:
+                enable_config_cache(False)
+                invalidate_config_cache()
+
+
+def test_flatten():
+    """Test that flatten lists values by dotted key in sorted order, without sections."""
+    config = Config(project_config='nonexistent.yaml', user_config='nonexistent.yaml')
+    config._update_config({'deadline': {'host': 'flat_host'}, 'extra': {'nested': {'value': 1}}})
+    
+    flat = config.flatten()
+    assert list(flat) == sorted(flat)
+    assert flat['deadline.host'] == 'flat_host'
+    assert flat['extra.nested.value'] == 1
+    assert 'deadline' not in flat and 'extra.nested' not in flat
+    assert config.flatten() is flat
+    
+    config._set_config_value(['deadline', 'host'], 'new_host')
+    assert config.flatten()['deadline.host'] == 'new_host'
+
+def test_yaml_parse_cache():
+    """Test that unchanged YAML files are parsed once per process."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_config = Path(tmpdir) / 'project.yaml'
+        with project_config.open('w') as f:
+            yaml.safe_dump({'deadline': {'host': 'yaml_host'}}, f)
+        
+        with patch('nk2dl.common.config.yaml.load', wraps=yaml.load) as mock_load:
+            first = Config(project_config=str(project_config), user_config='nonexistent.yaml')
+            second = Config(project_config=str(project_config), user_config='nonexistent.yaml')
+            assert mock_load.call_count == 1
+        
+        assert first.get('deadline.host') == second.get('deadline.host') == 'yaml_host'
+
+def test_lazy_global_config():
+    """Test that the global config is only built on first attribute access."""
+    from nk2dl.common.config import _LazyConfig
+    
+    lazy_config = _LazyConfig()
+    assert lazy_config._instance is None
+    
+    assert lazy_config.get('nonexistent.key', 'default') == 'default'
+    assert isinstance(lazy_config._instance, Config)
+
+def test_defaults_not_modified():
+    """Test that loading a config file doesn't leak into other Config instances."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_config = Path(tmpdir) / 'project.yaml'
+        with project_config.open('w') as f:
+            yaml.safe_dump({'deadline': {'host': 'project_host'}}, f)
+        
+        Config(project_config=str(project_config), user_config='nonexistent.yaml')
+        
+        assert Config.DEFAULT_CONFIG['deadline']['host'] == 'localhost'
+        other = Config(project_config='nonexistent.yaml', user_config='also_nonexistent.yaml')
+        assert other.get('deadline.host') == 'localhost'
+
+def test_update_config_deep_merge():
+    """Test that nested sections are merged at any depth."""
+    config = Config(project_config='nonexistent.yaml', user_config='also_nonexistent.yaml')
+    config._config = {'a': {'b': {'c': 1, 'd': 2}, 'e': 3}, 'f': 4}
+    
+    config._update_config({'a': {'b': {'c': 10}}, 'f': {'g': 5}})
+    
+    assert config._config == {'a': {'b': {'c': 10, 'd': 2}, 'e': 3}, 'f': {'g': 5}}
+
+def test_get_flat_index():
+    """Test that get reflects config changes made after a lookup."""
+    config = Config(project_config='nonexistent.yaml', user_config='also_nonexistent.yaml')
+    assert config.get('deadline.host') == 'localhost'
+    assert config.get('deadline')['host'] == 'localhost'
+    
+    config._update_config({'deadline': {'host': 'merged_host'}})
+    assert config.get('deadline.host') == 'merged_host'
+    
+    config._set_config_value(['deadline', 'host'], 'env_host')
+    assert config.get('deadline.host') == 'env_host'
+    
+    config._config = {'deadline': {'port': 1234}}
+    assert config.get('deadline.host') is None
+    assert config.get('deadline.port') == 1234
+
+def test_env_value_coercion():
+    """Test type coercion of environment variable values."""
+    config = Config(project_config='nonexistent.yaml', user_config='also_nonexistent.yaml')
+    expected = {
+        'yes': True, 'Off': False, '42': 42, '-7': -7, '1.5': 1.5, '-0.25': -0.25,
+        '1e5': 1e5, '1_000': 1000, '-2.5e-3': -2.5e-3, '.5e1': 5.0,
+        'render.example.com': 'render.example.com', '1.2.3': '1.2.3', '4k': '4k', 'abc': 'abc', '': '',
+    }
+    for raw, value in expected.items():
+        config._set_config_value(['test', 'key'], raw)
+        assert config.get('test.key') == value
+        assert type(config.get('test.key')) is type(value)
+
+def test_get_config_shared():
+    """Test that get_config shares instances until the cache is invalidated."""
+    from nk2dl.common.config import config, get_config, invalidate_config_cache
+    
+    invalidate_config_cache()
+    try:
+        first = get_config('nonexistent.yaml', 'also_nonexistent.yaml')
+        assert get_config('nonexistent.yaml', 'also_nonexistent.yaml') is first
+        assert get_config() is not first
+        assert config._resolve() is get_config()
+        
+        invalidate_config_cache()
+        assert get_config('nonexistent.yaml', 'also_nonexistent.yaml') is not first
+    finally:
+        invalidate_config_cache()
+
+def test_logging_import_leaves_config_lazy():
+    """Test that importing the logging module doesn't build the global config."""
+    code = (
+        "import nk2dl.common.logging\n"
+        "from nk2dl.common.config import config\n"
+        "assert config._instance is None\n"
+    )
+    package_root = Path(__file__).resolve().parents[2]
+    result = subprocess.run([sys.executable, "-c", code], cwd=package_root, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
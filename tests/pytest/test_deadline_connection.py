@@ -1,12 +1,25 @@
 """Tests for the Deadline connection module."""
 
 import os
+import threading
+import time
 import pytest
 from unittest.mock import MagicMock, patch
 
 from nk2dl.common.config import Config
 from nk2dl.common.errors import DeadlineError
-from nk2dl.deadline.connection import DeadlineConnection
+from nk2dl.deadline.connection import DeadlineConnection, _command_paths, _repository_paths, _web_clients
+
+@pytest.fixture(autouse=True)
+def clear_verified_commands():
+    """Forget deadlinecommand paths and Web Service clients verified by earlier tests."""
+    _command_paths.clear()
+    _repository_paths.clear()
+    _web_clients.clear()
+    yield
+    _command_paths.clear()
+    _repository_paths.clear()
+    _web_clients.clear()
 
 @pytest.fixture
 def mock_config():
@@ -149,13 +162,12 @@ def test_submit_job_command_line(mock_config):
         job_id = conn.submit_job(job_info, plugin_info)
         assert job_id == '12345'
         
-        # Verify temp files were written correctly
-        mock_job_file.write.assert_any_call('Plugin=Nuke\n')
-        mock_job_file.write.assert_any_call('Name=Test Job\n')
-        mock_job_file.write.assert_any_call('Frames=1-10\n')
+        # Verify temp files were each written in a single call
+        mock_job_file.write.assert_called_once()
+        job_data = mock_job_file.write.call_args[0][0]
+        assert job_data.startswith(b'Plugin=Nuke\nName=Test Job\nFrames=1-10\n')
         
-        mock_plugin_file.write.assert_any_call('Version=13.0\n')
-        mock_plugin_file.write.assert_any_call('SceneFile=/path/to/scene.nk\n')
+        mock_plugin_file.write.assert_called_once_with(b'Version=13.0\nSceneFile=/path/to/scene.nk\n')
 
 def test_submit_job_web_service(mock_config):
     """Test job submission via web service."""
@@ -284,4 +296,244 @@ def test_submit_job_web_service_error(mock_config):
             
             with pytest.raises(DeadlineError) as exc_info:
                 conn.submit_job(job_info, plugin_info)
-            assert "Failed to submit job via web service" in str(exc_info.value) 
\ No newline at end of file
+            assert "Failed to submit job via web service" in str(exc_info.value) 
+def test_submit_jobs_command_line(mock_config):
+    """Test submitting several jobs with a single deadlinecommand call."""
+    with patch.object(DeadlineConnection, '_setup_command_line'), \
+         patch('subprocess.Popen') as mock_popen:
+        
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = (b'JobID=111\nResult=Success\nJobID=222\n', b'')
+        mock_popen.return_value = mock_process
+        
+        conn = DeadlineConnection()
+        conn._command_path = '/path/to/deadlinecommand'
+        conn._initialized = True
+        
+        jobs = [
+            ({'Plugin': 'Nuke', 'Name': 'Job A'}, {'WriteNode': 'WriteA'}),
+            ({'Plugin': 'Nuke', 'Name': 'Job B'}, {'WriteNode': 'WriteB'}),
+        ]
+        job_ids = conn.submit_jobs(jobs)
+        assert job_ids == ['111', '222']
+        
+        # All jobs go through one process
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert args[:2] == ['/path/to/deadlinecommand', '-SubmitMultipleJobs']
+        assert args.count('-job') == 2
+        
+        # Temporary job files are cleaned up
+        for path in args[2:]:
+            if path != '-job':
+                assert not os.path.exists(path)
+
+def test_submit_jobs_missing_job_ids(mock_config):
+    """Test that jobs without a job ID are reported without losing the others."""
+    with patch.object(DeadlineConnection, '_setup_command_line'), \
+         patch('subprocess.Popen') as mock_popen:
+        
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = (
+            b'Result=Success\nJobID=111\nResult=Failed\nResult=Success\nJobID=333\n', b'')
+        mock_popen.return_value = mock_process
+        
+        conn = DeadlineConnection()
+        conn._command_path = '/path/to/deadlinecommand'
+        conn._initialized = True
+        
+        jobs = [({'Name': 'Job A'}, {}), ({'Name': 'Job B'}, {}), ({'Name': 'Job C'}, {}), ({'Name': 'Job D'}, {})]
+        results = conn.submit_jobs(jobs)
+        
+        assert results[0] == '111'
+        assert isinstance(results[1], DeadlineError)
+        assert "Result=Failed" in str(results[1])
+        assert results[2] == '333'
+        assert isinstance(results[3], DeadlineError)
+        assert "No job ID found" in str(results[3])
+
+def test_submit_jobs_web_service(mock_config):
+    """Test that Web Service batches return job IDs in submission order."""
+    with patch('nk2dl.deadline.connection.config') as mock_config, \
+         patch.dict('sys.modules', {'Deadline': MagicMock(), 'Deadline.DeadlineConnect': MagicMock()}):
+        
+        mock_config.get.side_effect = lambda key, default=None: {
+            'deadline.use_web_service': True,
+            'deadline.host': 'testhost',
+            'deadline.port': 8081,
+            'deadline.ssl': False
+        }.get(key, default)
+        
+        mock_client = MagicMock()
+        mock_client.Groups.GetGroupNames.return_value = ['none']
+        mock_client.Jobs.SubmitJob.side_effect = lambda job_info, plugin_info: f"id-{job_info['Name']}"
+        
+        with patch('Deadline.DeadlineConnect.DeadlineCon', return_value=mock_client):
+            conn = DeadlineConnection()
+            jobs = [({'Plugin': 'Nuke', 'Name': str(i)}, {'WriteNode': f'Write{i}'}) for i in range(20)]
+            
+            assert conn.submit_jobs(jobs) == [f"id-{i}" for i in range(20)]
+            assert mock_client.Jobs.SubmitJob.call_count == 20
+
+def test_submit_jobs_web_service_partial_failure(mock_config):
+    """Test that a failed Web Service submission keeps the IDs of the other jobs."""
+    with patch('nk2dl.deadline.connection.config') as mock_config, \
+         patch.dict('sys.modules', {'Deadline': MagicMock(), 'Deadline.DeadlineConnect': MagicMock()}):
+        
+        mock_config.get.side_effect = lambda key, default=None: {
+            'deadline.use_web_service': True,
+            'deadline.host': 'testhost',
+            'deadline.port': 8081,
+            'deadline.ssl': False,
+            'deadline.commandline_on_fail': False
+        }.get(key, default)
+        
+        def submit(job_info, plugin_info):
+            if job_info['Name'] == '1':
+                return "Error: Invalid job"
+            return f"id-{job_info['Name']}"
+        
+        mock_client = MagicMock()
+        mock_client.Groups.GetGroupNames.return_value = ['none']
+        mock_client.Jobs.SubmitJob.side_effect = submit
+        
+        with patch('Deadline.DeadlineConnect.DeadlineCon', return_value=mock_client):
+            conn = DeadlineConnection()
+            results = conn.submit_jobs([({'Plugin': 'Nuke', 'Name': str(i)}, {}) for i in range(3)])
+            
+            assert results[0] == "id-0"
+            assert isinstance(results[1], DeadlineError)
+            assert results[2] == "id-2"
+
+def test_submit_jobs_web_service_workers(mock_config):
+    """Test that deadline.submit_workers limits the number of concurrent Web Service submissions."""
+    with patch('nk2dl.deadline.connection.config') as mock_config, \
+         patch.dict('sys.modules', {'Deadline': MagicMock(), 'Deadline.DeadlineConnect': MagicMock()}):
+        
+        mock_config.get.side_effect = lambda key, default=None: {
+            'deadline.use_web_service': True,
+            'deadline.host': 'testhost',
+            'deadline.port': 8081,
+            'deadline.ssl': False,
+            'deadline.submit_workers': '2'
+        }.get(key, default)
+        
+        lock = threading.Lock()
+        active = []
+        peak = []
+        
+        def submit(job_info, plugin_info):
+            with lock:
+                active.append(job_info['Name'])
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(job_info['Name'])
+            return f"id-{job_info['Name']}"
+        
+        mock_client = MagicMock()
+        mock_client.Groups.GetGroupNames.return_value = ['none']
+        mock_client.Jobs.SubmitJob.side_effect = submit
+        
+        with patch('Deadline.DeadlineConnect.DeadlineCon', return_value=mock_client):
+            conn = DeadlineConnection()
+            results = conn.submit_jobs([({'Plugin': 'Nuke', 'Name': str(i)}, {}) for i in range(6)])
+            
+            assert results == [f"id-{i}" for i in range(6)]
+            assert max(peak) <= 2
+
+def test_submit_jobs_web_service_fallback_once(mock_config):
+    """Test that concurrent Web Service failures switch a shared connection to the command line once."""
+    with patch('nk2dl.deadline.connection.config') as mock_config, \
+         patch.dict('sys.modules', {'Deadline': MagicMock(), 'Deadline.DeadlineConnect': MagicMock()}):
+        
+        mock_config.get.side_effect = lambda key, default=None: {
+            'deadline.use_web_service': True,
+            'deadline.host': 'testhost',
+            'deadline.port': 8081,
+            'deadline.ssl': False,
+            'deadline.commandline_on_fail': True,
+            'deadline.submit_workers': 4
+        }.get(key, default)
+        
+        # Every worker fails at the same time
+        barrier = threading.Barrier(4)
+        
+        def submit(job_info, plugin_info):
+            barrier.wait(timeout=5)
+            raise RuntimeError("Web Service unavailable")
+        
+        mock_client = MagicMock()
+        mock_client.Groups.GetGroupNames.return_value = ['none']
+        mock_client.Jobs.SubmitJob.side_effect = submit
+        
+        def setup_command_line(conn):
+            assert conn.use_web_service
+            conn._command_path = '/path/to/deadlinecommand'
+        
+        with patch('Deadline.DeadlineConnect.DeadlineCon', return_value=mock_client), \
+             patch.object(DeadlineConnection, '_setup_command_line', autospec=True,
+                          side_effect=setup_command_line) as mock_setup, \
+             patch.object(DeadlineConnection, '_init_command_line') as mock_init, \
+             patch.object(DeadlineConnection, '_run_submit_command', return_value="JobID=cmd-id\n"):
+            conn = DeadlineConnection()
+            results = conn.submit_jobs([({'Plugin': 'Nuke', 'Name': str(i)}, {}) for i in range(4)])
+            
+            assert results == ["cmd-id"] * 4
+            assert not conn.use_web_service
+            mock_setup.assert_called_once()
+            mock_init.assert_called_once()
+
+def test_command_line_verified_once(mock_config):
+    """Test that deadlinecommand is only verified once per process."""
+    with patch.object(DeadlineConnection, '_setup_command_line'), \
+         patch('subprocess.Popen') as mock_popen:
+        
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = (b'/repo/path\n', b'')
+        mock_popen.return_value = mock_process
+        
+        for _ in range(2):
+            conn = DeadlineConnection()
+            conn._command_path = '/path/to/deadlinecommand'
+            conn.ensure_connected()
+        
+        mock_popen.assert_called_once()
+        assert _repository_paths['/path/to/deadlinecommand'] == '/repo/path'
+
+def test_command_path_located_once(mock_config):
+    """Test that deadlinecommand is only searched for once per DEADLINE_PATH."""
+    with patch.dict(os.environ, {'DEADLINE_PATH': '/opt/deadline/bin'}), \
+         patch('os.path.exists', return_value=True) as mock_exists, \
+         patch('sys.platform', 'linux'):
+        
+        first = DeadlineConnection()
+        second = DeadlineConnection()
+        
+        assert first._command_path == second._command_path == os.path.join('/opt/deadline/bin', 'deadlinecommand')
+        mock_exists.assert_called_once()
+
+def test_web_service_verified_once(mock_config):
+    """Test that the Web Service client is created and tested once per process."""
+    with patch('nk2dl.deadline.connection.config') as mock_config, \
+         patch.dict('sys.modules', {'Deadline': MagicMock(), 'Deadline.DeadlineConnect': MagicMock()}):
+        
+        mock_config.get.side_effect = lambda key, default=None: {
+            'deadline.use_web_service': True,
+            'deadline.host': 'testhost',
+            'deadline.port': 8081,
+            'deadline.ssl': False
+        }.get(key, default)
+        
+        mock_client = MagicMock()
+        mock_client.Groups.GetGroupNames.return_value = ['none']
+        
+        with patch('Deadline.DeadlineConnect.DeadlineCon', return_value=mock_client) as mock_connect:
+            first = DeadlineConnection()
+            first.ensure_connected()
+            second = DeadlineConnection()
+            second.ensure_connected()
+            
+            assert first._web_client is second._web_client is mock_client
+            mock_connect.assert_called_once()
+            mock_client.Groups.GetGroupNames.assert_called_once()
@@ -0,0 +1,95 @@
+"""Tests for frame range parsing and token substitution."""
+
+import unittest
+
+from nk2dl.common.framerange import FrameRange
+
+
+SCRIPT_CONTENT = """Root {
+ inputs 0
+ first_frame 1001
+ last_frame 1100
+ heroFrames 1001, 1050 1100
+}
+"""
+
+
+class TestFrameRange(unittest.TestCase):
+    """Tests for the FrameRange class."""
+
+    def test_valid_syntax(self):
+        """Test syntax validation of plain frame ranges."""
+        for value in ("1-10", "1,3,9", "1-90x3", "1-90/3", "9,50,100-200", "9-18x2,100"):
+            self.assertTrue(FrameRange(value).is_valid_syntax(), value)
+        for value in ("", "1-", "1,,2", "1-10x-"):
+            self.assertFalse(FrameRange(value).is_valid_syntax(), value)
+
+    def test_expand_range(self):
+        """Test expanding ranges, steps and single frames."""
+        self.assertEqual(FrameRange("1-5").expand_range(), [1, 2, 3, 4, 5])
+        self.assertEqual(FrameRange("1-10x3").expand_range(), [1, 4, 7, 10])
+        self.assertEqual(FrameRange("1-10/4,20").expand_range(), [1, 5, 9, 20])
+        self.assertEqual(FrameRange("20,1-3").expand_range(), [1, 2, 3, 20])
+        self.assertEqual(FrameRange("5,1-3,2").expand_range(), [1, 2, 2, 3, 5])
+
+        with self.assertRaises(ValueError):
+            FrameRange("10-1").expand_range()
+        with self.assertRaises(ValueError):
+            FrameRange("f-l").expand_range()
+
+    def test_normalize_hero_frames(self):
+        """Test normalizing hero frame lists."""
+        self.assertEqual(FrameRange.normalize_hero_frames("1, 5  10,,20"), "1,5,10,20")
+        self.assertEqual(FrameRange.normalize_hero_frames(""), "")
+
+    def test_substitute_tokens(self):
+        """Test substituting frame tokens."""
+        fr = FrameRange("f-l")
+        self.assertTrue(fr.has_tokens)
+        self.assertEqual(fr.substitute_tokens(1, 10), "1-10")
+        self.assertEqual(fr.expand_range(), list(range(1, 11)))
+
+        fr = FrameRange("first,middle,last")
+        self.assertEqual(fr.substitute_tokens(1, 10), "1,5,10")
+
+        fr = FrameRange("i,h")
+        self.assertEqual(fr.substitute_tokens(1, 10, "2 4", 3, 7), "3-7,2,4")
+
+    def test_substitute_tokens_from_script(self):
+        """Test substituting tokens from Nuke script content."""
+        fr = FrameRange("f,m,l,hero")
+        result = fr.substitute_tokens_from_script(SCRIPT_CONTENT)
+        self.assertEqual(result, "1001,1050,1100,1001,1050,1100")
+        self.assertEqual(fr.expand_range(), [1001, 1001, 1050, 1050, 1100, 1100])
+
+        fr = FrameRange("1-10")
+        self.assertEqual(fr.substitute_tokens_from_script(SCRIPT_CONTENT), "1-10")
+
+    def test_expand_range_cache(self):
+        """Test that expansion is cached until tokens are substituted again."""
+        fr = FrameRange("f-l")
+        fr.substitute_tokens(1, 3)
+        frames = fr.expand_range()
+        self.assertEqual(frames, [1, 2, 3])
+
+        # Mutating the returned list must not affect the cache
+        frames.append(99)
+        self.assertEqual(fr.expand_range(), [1, 2, 3])
+
+        fr.substitute_tokens(5, 6)
+        self.assertEqual(fr.expand_range(), [5, 6])
+
+    def test_expand_range_errors(self):
+        """Test errors for malformed ranges."""
+        for value in ("1-10x0", "10-1"):
+            with self.assertRaisesRegex(ValueError, rf"^Error parsing range '{value}': "):
+                FrameRange(value).expand_range()
+        with self.assertRaisesRegex(ValueError, "^Invalid range format: 1-a$"):
+            FrameRange("1-a").expand_range()
+        # Digits that aren't decimal are rejected with a message rather than failing in int()
+        with self.assertRaisesRegex(ValueError, "^Invalid frame number: ²$"):
+            FrameRange("²").expand_range()
+
+    def test_expand_range_empty_step(self):
+        """Test that a range with a trailing 'x' and no step value uses a step of 1."""
+        self.assertEqual(FrameRange("1-10x").expand_range(), list(range(1, 11)))
@@ -0,0 +1,163 @@
+"""Tests for Nuke script submission."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from nk2dl.common.errors import DeadlineError, SubmissionError
+from nk2dl.nuke import utils as nuke_utils
+from nk2dl.nuke.submission import NukeSubmission, _script_session_lock, submit_nuke_script
+
+
+class FakeKnob:
+    """Minimal stand-in for a Nuke knob."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def value(self):
+        return self._value
+
+    def evaluate(self):
+        return self._value
+
+
+class FakeNode:
+    """Minimal stand-in for a Nuke node."""
+
+    def __init__(self, name, node_class, **knobs):
+        self._name = name
+        self._class = node_class
+        self._knobs = {key: FakeKnob(value) for key, value in knobs.items()}
+
+    def name(self):
+        return self._name
+
+    def Class(self):
+        return self._class
+
+    def knobs(self):
+        return self._knobs
+
+    def __getitem__(self, key):
+        return self._knobs[key]
+
+
+def write_node(name, render_order):
+    """Create a fake Write node with the given render order."""
+    return FakeNode(name, "Write", file=f"/renders/{name}.####.exr", file_type="exr",
+                    disable=False, render_order=render_order, use_limit=False, first=1, last=10)
+
+
+@pytest.fixture
+def fake_nuke(tmp_path):
+    """Install a fake nuke module with write nodes A and C at render order 1 and B at 2."""
+    nodes = {node.name(): node for node in (write_node("A", 1), write_node("B", 2), write_node("C", 1))}
+    root = FakeNode("root", "Root", first_frame=1, last_frame=10, project_directory="")
+    root.knobs()["gsv"] = MagicMock()
+    root["gsv"].getListOptions.return_value = ["main", "alt"]
+
+    nuke = MagicMock()
+    nuke.root.return_value = root
+    nuke.toNode.side_effect = nodes.get
+    nuke.allNodes.side_effect = lambda node_class=None, *args, **kwargs: [
+        node for node in nodes.values() if node_class in (None, node.Class())]
+
+    script_path = tmp_path / "shot.nk"
+    script_path.write_text("Root {}\n")
+
+    with patch.object(nuke_utils, '_nuke_module', nuke):
+        yield str(script_path)
+
+
+def test_topological_sort_render_order():
+    """Test that write nodes are ordered by render order, keeping the original order for ties."""
+    nodes = [("Write3", 2), ("Write2", 1), ("Write1", 1)]
+    assert NukeSubmission._topological_sort_write_nodes(nodes) == [("Write2", 1), ("Write1", 1), ("Write3", 2)]
+
+
+def test_topological_sort_alphabetical():
+    """Test that render order ties are broken alphabetically when requested."""
+    nodes = [("Write3", 2), ("Write2", 1), ("Write1", 1)]
+    assert NukeSubmission._topological_sort_write_nodes(nodes, alphabetical=True) == [
+        ("Write1", 1), ("Write2", 1), ("Write3", 2)]
+
+
+def fail_write_node(failed_node):
+    """Create a submit_jobs stand-in that fails the job for one write node."""
+    def submit_jobs(jobs):
+        return [DeadlineError("Result=Failed") if plugin_info["WriteNode"] == failed_node
+                else f"id-{plugin_info['WriteNode']}" for _, plugin_info in jobs]
+    return submit_jobs
+
+
+def test_submit_keeps_jobs_of_failed_batch(fake_nuke):
+    """Test that jobs submitted alongside a failed job are still tracked."""
+    connection = MagicMock()
+    connection.submit_jobs.side_effect = fail_write_node("C")
+
+    submission = NukeSubmission(fake_nuke, frame_range="1-10", write_nodes_as_separate_jobs=True,
+                                connection=connection)
+
+    assert submission.submit() == {1: ["id-A"], 2: ["id-B"]}
+
+
+def test_submit_depends_on_submitted_jobs_of_previous_level(fake_nuke):
+    """Test that a render order level depends on the jobs of the previous level that were submitted."""
+    connection = MagicMock()
+    connection.submit_jobs.side_effect = fail_write_node("A")
+
+    submission = NukeSubmission(fake_nuke, frame_range="1-10", render_order_dependencies=True,
+                                job_dependencies="user-dep", connection=connection)
+
+    assert submission.submit() == {1: ["id-C"], 2: ["id-B"]}
+    (job_info, plugin_info), = connection.submit_jobs.call_args_list[1][0][0]
+    assert plugin_info["WriteNode"] == "B"
+    assert job_info["JobDependency0"] == "user-dep"
+    assert job_info["JobDependency1"] == "id-C"
+
+
+def test_submit_skips_levels_after_failed_level(fake_nuke):
+    """Test that later levels aren't submitted without dependencies when a whole level fails."""
+    connection = MagicMock()
+    connection.submit_jobs.side_effect = lambda jobs: [DeadlineError("Result=Failed") for _ in jobs]
+
+    submission = NukeSubmission(fake_nuke, frame_range="1-10", render_order_dependencies=True,
+                                connection=connection)
+
+    with pytest.raises(SubmissionError) as exc_info:
+        submission.submit()
+    connection.submit_jobs.assert_called_once()
+    assert "write node B: no jobs were submitted for render order 1" in str(exc_info.value)
+
+
+def test_submit_gsv_raises_when_no_jobs_submitted(fake_nuke):
+    """Test that a GSV submission raises, listing the failed jobs, when Deadline rejects every job."""
+    connection = MagicMock()
+    connection.submit_jobs.side_effect = lambda jobs: [DeadlineError("Result=Failed") for _ in jobs]
+
+    submission = NukeSubmission(fake_nuke, frame_range="1-10", nuke_version="15.2",
+                                graph_scope_variables=["shot:main,alt"], connection=connection)
+
+    with pytest.raises(SubmissionError) as exc_info:
+        submission.submit()
+    message = str(exc_info.value)
+    assert "GSV combination shot=main: Result=Failed" in message
+    assert "GSV combination shot=alt: Result=Failed" in message
+
+
+def test_submit_nuke_script_releases_session_lock(fake_nuke):
+    """Test that jobs are submitted to Deadline without holding the script session lock."""
+    lock_held = []
+
+    def submit_jobs(jobs):
+        lock_held.append(_script_session_lock.locked())
+        return [f"id-{plugin_info['WriteNode']}" for _, plugin_info in jobs]
+
+    connection = MagicMock()
+    connection.submit_jobs.side_effect = submit_jobs
+
+    result = submit_nuke_script(fake_nuke, frame_range="1-10", write_nodes_as_separate_jobs=True,
+                                connection=connection)
+
+    assert result == {1: ["id-A", "id-C"], 2: ["id-B"]}
+    assert lock_held == [False]